@@ -39,12 +39,21 @@ echo 
 if exist build rmdir /s /q build
 if exist dist\ideaSystemXS rmdir /s /q dist\ideaSystemXS
 
+REM ɿݿģ
+echo ݿģ...
+python -c "from src.data.database_manager import DatabaseManager; DatabaseManager.create_template()"
+if %ERRORLEVEL% neq 0 (
+    echo : ݿģʧ
+    exit /b 1
+)
+
 REM PyInstaller
 echo ʼӦó...
 pyinstaller --noconfirm --clean ^
     --name="ideaSystemXS" ^
     --icon=src/ui/resources/icon.ico ^
     --add-data="src/ui/resources;src/ui/resources" ^
+    --add-data="src/data/ideas_template.db;src/data" ^
     --hidden-import=PyQt6.QtCore ^
     --hidden-import=PyQt6.QtGui ^
     --hidden-import=PyQt6.QtWidgets ^
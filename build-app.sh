@@ -50,11 +50,20 @@ echo -e "${YELLOW}清理旧的构建文件...${NC}"
 rm -rf build
 rm -rf dist/ideaSystemXS
 
+# 生成空数据库模板
+echo -e "${YELLOW}生成数据库模板...${NC}"
+python -c "from src.data.database_manager import DatabaseManager; DatabaseManager.create_template()"
+if [ $? -ne 0 ]; then
+    echo -e "${RED}错误: 生成数据库模板失败${NC}"
+    exit 1
+fi
+
 # 运行PyInstaller
 echo -e "${YELLOW}开始打包应用程序...${NC}"
 pyinstaller --noconfirm --clean \
     --name="ideaSystemXS" \
     --add-data="src/ui/resources:src/ui/resources" \
+    --add-data="src/data/ideas_template.db:src/data" \
     --hidden-import=PyQt6.QtCore \
     --hidden-import=PyQt6.QtGui \
     --hidden-import=PyQt6.QtWidgets \
@@ -1,45 +1,69 @@
 """
 AI管理器模块，负责管理AI相关组件。
 """
+import threading
 from typing import Optional
 
 from src.ai.ai_service import AIService
-from src.ai.embedding_generator import EmbeddingGenerator
-from src.ai.idea_analyzer import IdeaAnalyzer
-from src.ai.ideas_summarizer import IdeasSummarizer
-from src.ai.ai_query_console import AIQueryManager
-from src.ai.reminder_system import ReminderSystem
 from src.business.idea_manager import IdeaManager
 from src.business.tag_manager import TagManager
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 from src.data.database_manager import DatabaseManager
 from src.data.vector_db_manager import VectorDBManager
-from src.system_integration.notification_manager import NotificationManager
 
 
-class AIManager:
-    """AI管理器类，负责管理AI相关组件。"""
+class Services:
+    """AI服务注册表，直接访问AI组件，无需经过事件系统。"""
 
-    _instance = None
+    __slots__ = ("_manager",)
 
-    def __new__(cls, config_manager=None, event_system=None, database_manager=None, vector_db_manager=None):
-        """
-        实现单例模式，确保只创建一个实例。
+    def __init__(self):
+        """初始化服务注册表。"""
+        self._manager: Optional["AIManager"] = None
 
-        Args:
-            config_manager: 配置管理器实例
-            event_system: 事件系统实例
-            database_manager: 数据库管理器实例
-            vector_db_manager: 向量数据库管理器实例
+    @property
+    def ai_service(self) -> Optional[AIService]:
+        """AI服务实例，AI管理器未创建时为None。"""
+        return self._manager.get_ai_service() if self._manager else None
 
-        Returns:
-            AIManager 实例
-        """
-        if cls._instance is None:
-            cls._instance = super(AIManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    @property
+    def embedding_generator(self):
+        """嵌入生成器实例，AI管理器未创建时为None。"""
+        return self._manager.get_embedding_generator() if self._manager else None
+
+    @property
+    def idea_analyzer(self):
+        """想法分析器实例，AI管理器未创建时为None。"""
+        return self._manager.get_idea_analyzer() if self._manager else None
+
+    @property
+    def ideas_summarizer(self):
+        """想法总结器实例，AI管理器未创建时为None。"""
+        return self._manager.get_ideas_summarizer() if self._manager else None
+
+    @property
+    def reminder_system(self):
+        """提醒系统实例，AI管理器未创建时为None。"""
+        return self._manager.get_reminder_system() if self._manager else None
+
+
+# 全局服务注册表
+services = Services()
+
+# AI管理器全局实例及创建锁
+_ai_manager: Optional["AIManager"] = None
+_ai_manager_lock = threading.Lock()
+
+
+class AIManager:
+    """AI管理器类，负责管理AI相关组件。"""
+
+    __slots__ = (
+        "_config_manager", "_event_system", "_database_manager", "_vector_db_manager",
+        "_idea_manager", "_tag_manager", "_ai_service", "_embedding_generator",
+        "_idea_analyzer", "_ideas_summarizer", "_ai_query_manager", "_reminder_system",
+    )
 
     def __init__(
         self,
@@ -57,63 +81,28 @@ class AIManager:
             database_manager: 数据库管理器实例
             vector_db_manager: 向量数据库管理器实例
         """
-        if self._initialized:
-            return
-
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
         self._database_manager = database_manager or DatabaseManager(self._config_manager)
         self._vector_db_manager = vector_db_manager or VectorDBManager(self._config_manager)
 
-        # 初始化业务逻辑组件
-        self._idea_manager = IdeaManager(self._config_manager, self._event_system)
-        self._tag_manager = TagManager(self._config_manager, self._event_system)
-
-        # 初始化AI服务
+        # AI服务创建开销小，且需要订阅设置界面发布的test_ai_api事件，在此直接创建
         self._ai_service = AIService(self._config_manager, self._event_system)
-        
-        # 初始化嵌入生成器
-        self._embedding_generator = EmbeddingGenerator(
-            self._config_manager, self._event_system, self._ai_service
-        )
-        
-        # 初始化想法分析器
-        self._idea_analyzer = IdeaAnalyzer(
-            self._config_manager,
-            self._event_system,
-            self._ai_service,
-            self._embedding_generator,
-            self._idea_manager,
-            self._tag_manager
-        )
-        
-        # 初始化想法总结器
-        self._ideas_summarizer = IdeasSummarizer(
-            self._config_manager,
-            self._event_system,
-            self._ai_service,
-            self._idea_manager,
-            self._tag_manager
-        )
-        
-        # 初始化AI查询管理器
-        self._ai_query_manager = AIQueryManager(
-            self._config_manager,
-            self._event_system,
-            self._ai_service,
-            self._idea_manager
-        )
-
-        # 通知管理器会在需要时获取，避免循环依赖
-        self._notification_manager = None
-        
-        # 初始化提醒系统
-        self._reminder_system = None  # 延迟初始化
+
+        # 以下组件在首次使用时创建，避免启动时构建全部AI组件
+        self._idea_manager = None
+        self._tag_manager = None
+        self._embedding_generator = None
+        self._idea_analyzer = None
+        self._ideas_summarizer = None
+        self._ai_query_manager = None
+        self._reminder_system = None
 
         # 注册事件处理器
         self._register_event_handlers()
-        
-        self._initialized = True
+
+        # 注册到服务注册表，供其他模块直接获取AI组件
+        services._manager = self
 
     def _register_event_handlers(self):
         """注册事件处理器。"""
@@ -122,13 +111,7 @@ class AIManager:
         
         # 应用程序退出事件
         self._event_system.subscribe("app_exit", self._handle_app_exit)
-        
-        # 获取AI组件实例事件
-        self._event_system.subscribe("get_ai_service", self._handle_get_ai_service)
-        self._event_system.subscribe("get_embedding_generator", self._handle_get_embedding_generator)
-        self._event_system.subscribe("get_idea_analyzer", self._handle_get_idea_analyzer)
-        self._event_system.subscribe("get_ideas_summarizer", self._handle_get_ideas_summarizer)
-        self._event_system.subscribe("get_reminder_system", self._handle_get_reminder_system)
+
 
     def _handle_config_changed(self, data=None):
         """
@@ -139,11 +122,6 @@ class AIManager:
         """
         # 如果AI相关配置发生变化，更新相关组件
         if data and "ai" in data:
-            # 更新AI服务
-            if self._ai_service:
-                # AI服务本身会监听配置变更事件，无需手动更新
-                pass
-            
             # 更新向量数据库
             if self._vector_db_manager:
                 self._vector_db_manager.update_embedding_function()
@@ -158,60 +136,27 @@ class AIManager:
         # 清理资源
         pass
 
-    def _handle_get_ai_service(self, data):
-        """
-        处理获取AI服务实例事件。
-
-        Args:
-            data: 事件数据，包含callback字段
-        """
-        callback = data.get("callback", None)
-        if callback:
-            callback(self._ai_service)
-
-    def _handle_get_embedding_generator(self, data):
-        """
-        处理获取嵌入生成器实例事件。
-
-        Args:
-            data: 事件数据，包含callback字段
-        """
-        callback = data.get("callback", None)
-        if callback:
-            callback(self._embedding_generator)
-
-    def _handle_get_idea_analyzer(self, data):
+    def get_idea_manager(self) -> IdeaManager:
         """
-        处理获取想法分析器实例事件。
+        获取想法管理器实例。
 
-        Args:
-            data: 事件数据，包含callback字段
-        """
-        callback = data.get("callback", None)
-        if callback:
-            callback(self._idea_analyzer)
-
-    def _handle_get_ideas_summarizer(self, data):
-        """
-        处理获取想法总结器实例事件。
-
-        Args:
-            data: 事件数据，包含callback字段
+        Returns:
+            想法管理器实例
         """
-        callback = data.get("callback", None)
-        if callback:
-            callback(self._ideas_summarizer)
+        if self._idea_manager is None:
+            self._idea_manager = IdeaManager(self._config_manager, self._event_system)
+        return self._idea_manager
 
-    def _handle_get_reminder_system(self, data):
+    def get_tag_manager(self) -> TagManager:
         """
-        处理获取提醒系统实例事件。
+        获取标签管理器实例。
 
-        Args:
-            data: 事件数据，包含callback字段
+        Returns:
+            标签管理器实例
         """
-        callback = data.get("callback", None)
-        if callback:
-            callback(self.get_reminder_system())
+        if self._tag_manager is None:
+            self._tag_manager = TagManager(self._config_manager, self._event_system)
+        return self._tag_manager
 
     def get_ai_service(self) -> AIService:
         """
@@ -222,43 +167,79 @@ class AIManager:
         """
         return self._ai_service
 
-    def get_embedding_generator(self) -> EmbeddingGenerator:
+    def get_embedding_generator(self):
         """
         获取嵌入生成器实例。
 
         Returns:
             嵌入生成器实例
         """
+        if self._embedding_generator is None:
+            # 延迟导入，避免启动时加载numpy
+            from src.ai.embedding_generator import EmbeddingGenerator
+            self._embedding_generator = EmbeddingGenerator(
+                self._config_manager, self._event_system, self.get_ai_service()
+            )
         return self._embedding_generator
 
-    def get_idea_analyzer(self) -> IdeaAnalyzer:
+    def get_idea_analyzer(self):
         """
         获取想法分析器实例。
 
         Returns:
             想法分析器实例
         """
+        if self._idea_analyzer is None:
+            # 延迟导入，仅在使用时加载
+            from src.ai.idea_analyzer import IdeaAnalyzer
+            self._idea_analyzer = IdeaAnalyzer(
+                self._config_manager,
+                self._event_system,
+                self.get_ai_service(),
+                self.get_embedding_generator(),
+                self.get_idea_manager(),
+                self.get_tag_manager()
+            )
         return self._idea_analyzer
 
-    def get_ideas_summarizer(self) -> IdeasSummarizer:
+    def get_ideas_summarizer(self):
         """
         获取想法总结器实例。
 
         Returns:
             想法总结器实例
         """
+        if self._ideas_summarizer is None:
+            # 延迟导入，仅在使用时加载
+            from src.ai.ideas_summarizer import IdeasSummarizer
+            self._ideas_summarizer = IdeasSummarizer(
+                self._config_manager,
+                self._event_system,
+                self.get_ai_service(),
+                self.get_idea_manager(),
+                self.get_tag_manager()
+            )
         return self._ideas_summarizer
 
-    def get_ai_query_manager(self) -> AIQueryManager:
+    def get_ai_query_manager(self):
         """
         获取AI查询管理器实例。
 
         Returns:
             AI查询管理器实例
         """
+        if self._ai_query_manager is None:
+            # 延迟导入，仅在使用时加载
+            from src.ai.ai_query_console import AIQueryManager
+            self._ai_query_manager = AIQueryManager(
+                self._config_manager,
+                self._event_system,
+                self.get_ai_service(),
+                self.get_idea_manager()
+            )
         return self._ai_query_manager
 
-    def get_reminder_system(self) -> ReminderSystem:
+    def get_reminder_system(self):
         """
         获取提醒系统实例。
 
@@ -267,14 +248,15 @@ class AIManager:
         """
         if self._reminder_system is None:
             # 延迟导入，避免循环依赖
+            from src.ai.reminder_system import ReminderSystem
             from src.system_integration.notification_manager import NotificationManager
             notification_manager = NotificationManager(self._config_manager, self._event_system)
             
             self._reminder_system = ReminderSystem(
                 self._config_manager,
                 self._event_system,
-                self._ai_service,
-                self._idea_manager,
+                self.get_ai_service(),
+                self.get_idea_manager(),
                 notification_manager
             )
         
@@ -285,7 +267,7 @@ class AIManager:
         # 如果AI功能已启用且不处于离线模式，初始化AI服务
         if self._config_manager.is_ai_enabled() and not self._config_manager.is_offline_mode():
             # 测试AI服务连接
-            success, _ = self._ai_service.test_api_connection()
+            success, _ = self.get_ai_service().test_api_connection()
             
             if success:
                 # 初始化提醒系统
@@ -307,4 +289,30 @@ class AIManager:
         Returns:
             是否可用
         """
-        return self._ai_service.is_available()
+        return self.get_ai_service().is_available()
+
+
+def get_ai_manager(
+    config_manager: Optional[ConfigManager] = None,
+    event_system: Optional[EventSystem] = None,
+    database_manager: Optional[DatabaseManager] = None,
+    vector_db_manager: Optional[VectorDBManager] = None,
+) -> AIManager:
+    """
+    获取AI管理器实例，首次调用时创建，之后直接返回已创建的实例并忽略传入的参数。
+
+    Args:
+        config_manager: 配置管理器实例
+        event_system: 事件系统实例
+        database_manager: 数据库管理器实例
+        vector_db_manager: 向量数据库管理器实例
+
+    Returns:
+        AIManager 实例
+    """
+    global _ai_manager
+    if _ai_manager is None:
+        with _ai_manager_lock:
+            if _ai_manager is None:
+                _ai_manager = AIManager(config_manager, event_system, database_manager, vector_db_manager)
+    return _ai_manager
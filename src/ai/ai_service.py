@@ -1,21 +1,164 @@
 """
 AI服务模块，提供AI相关功能。
 """
+import hashlib
 import json
+import logging
 import os
+import re
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 
+logger = logging.getLogger(__name__)
+
+# 响应体写入日志或错误消息时保留的最大长度
+_ERROR_BODY_LIMIT = 500
+
+# orjson为可选依赖，未安装时回退到标准库json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# 从模型回复中提取JSON对象的正则表达式
+_JSON_OBJECT_RE = re.compile(r'\{[\s\S]*\}')
+
+# 分析想法的系统消息和提示模板
+_ANALYZE_SYSTEM_MSG = {"role": "system", "content": "你是一个专业的文本分析助手，擅长提取文本的关键信息。"}
+_ANALYZE_PROMPT = """\
+请分析以下想法文本，提取关键信息：
+
+{idea_text}
+
+请提供以下信息：
+1. 标签：提取3-5个关键词作为标签，每个标签不超过10个字符
+2. 标题：生成一个简短的标题，不超过20个字符
+3. 摘要：生成一个简短的摘要，不超过100个字符
+
+请以JSON格式返回结果，格式如下：
+{{
+    "tags": ["标签1", "标签2", "标签3"],
+    "title": "标题",
+    "summary": "摘要"
+}}
+"""
+
+# 总结想法的系统消息和提示模板
+_SUMMARIZE_SYSTEM_MSG = {"role": "system", "content": "你是一个专业的思想分析师，擅长总结和关联不同的想法。"}
+_SUMMARIZE_PROMPT = """\
+请总结以下想法，找出共同主题、关联点和可能的行动建议：
+
+{ideas_text}
+
+请提供：
+1. 共同主题：这些想法的共同点是什么？
+2. 关键见解：从这些想法中可以得出哪些重要见解？
+3. 行动建议：基于这些想法，有哪些可能的行动建议？
+
+请以连贯的段落形式回答，不要使用标题或编号。
+"""
+
+# 生成提醒建议的系统消息和提示模板
+_REMINDER_SYSTEM_MSG = {"role": "system", "content": "你是一个专业的个人助理，擅长分析文本并设置合适的提醒。"}
+_REMINDER_PROMPT = """\
+请分析以下想法文本，判断是否需要设置提醒：
+
+{idea_text}
+
+当前时间：{current_time}
+
+请判断这个想法是否包含需要在未来某个时间点提醒用户的内容。如果需要提醒，请指定提醒时间和原因。
+
+请以JSON格式返回结果，格式如下：
+{{
+    "should_remind": true或false,
+    "remind_time": "YYYY-MM-DD HH:MM:SS"（如果should_remind为true，则提供提醒时间，否则为null）,
+    "remind_reason": "提醒原因"（如果should_remind为true，则提供提醒原因，否则为空字符串）
+}}
+"""
+
+# AI问答的系统消息和提示模板
+_ASK_SYSTEM_MSG = {"role": "system", "content": "你是一个智能助手，可以帮助用户回答关于他们想法的问题。"}
+_ASK_PROMPT = """\
+{context_text}
+
+用户问题：{query}
+
+请根据上述信息回答用户的问题。如果无法根据提供的信息回答，请诚实地说明。
+"""
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """
+    解析JSON数据，优先使用orjson。
+
+    Args:
+        data: JSON字节串或字符串
+
+    Returns:
+        解析结果
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """
+    序列化为UTF-8编码的JSON字节串，优先使用orjson。
+
+    Args:
+        obj: 待序列化对象
+
+    Returns:
+        JSON字节串
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    # 使用紧凑分隔符，输出与orjson一致，减少请求体大小
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _error_body(response: requests.Response) -> str:
+    """
+    获取用于日志和错误消息的截断响应体，直接解码字节，避免requests检测编码。
+
+    Args:
+        response: 响应对象
+
+    Returns:
+        截断后的响应文本
+    """
+    return response.content[:_ERROR_BODY_LIMIT].decode("utf-8", errors="replace")
+
 
 class AIService:
     """AI服务类，提供AI API调用功能。"""
 
+    __slots__ = (
+        "_config_manager", "_event_system", "_session", "_executor",
+        "_api_url", "_api_key", "_model", "_chat_url", "_embed_url",
+        "_embedding_cache", "_embedding_cache_lock",
+    )
+
+    # 嵌入向量缓存容量和有效期（秒）
+    EMBEDDING_CACHE_SIZE = 2048
+    EMBEDDING_CACHE_TTL = 3600
+
+    # 单次嵌入请求的最大输入数量
+    EMBEDDING_BATCH_SIZE = 96
+
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -31,21 +174,104 @@ class AIService:
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
         
+        # 复用HTTP连接的会话
+        self._session = self._create_session()
+        
+        # 缓存API地址、模型和请求头，配置变更时刷新
+        self._refresh_config()
+        
+        # 嵌入向量缓存，键为(模型, 文本摘要)，值为(过期时间, 向量)
+        self._embedding_cache = OrderedDict()
+        self._embedding_cache_lock = threading.Lock()
+        
+        # 执行网络请求的后台线程池
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ai-")
+        
         # 注册事件处理器
         self._register_event_handlers()
 
+    def _create_session(self) -> requests.Session:
+        """
+        创建带连接池和keep-alive的HTTP会话。
+
+        Returns:
+            HTTP会话
+        """
+        session = requests.Session()
+        
+        # 对限流和服务端临时错误自动重试，POST请求也重试，并遵循Retry-After头；
+        # 重试用尽后返回最后一次响应，由调用方按状态码处理
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(408, 429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["POST"]),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _refresh_config(self):
+        """从配置中读取API地址、密钥和模型，更新缓存的请求地址和会话请求头。"""
+        self._api_url = self._config_manager.get("ai", "api_url", "")
+        self._api_key = self._config_manager.get("ai", "api_key", "")
+        self._model = self._config_manager.get("ai", "model", "gpt-3.5-turbo")
+        self._chat_url = f"{self._api_url.rstrip('/')}/chat/completions"
+        self._embed_url = f"{self._api_url.rstrip('/')}/embeddings"
+        self._session.headers.update({
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._api_key}"
+        })
+
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 测试AI API连接事件
         self._event_system.subscribe("test_ai_api", self._handle_test_api)
+        
+        # 配置变更事件
+        self._event_system.subscribe("config_changed", self._handle_config_changed)
+        
+        # 应用程序退出事件
+        self._event_system.subscribe("app_exit", self._handle_app_exit)
+
+    def _handle_config_changed(self, data=None):
+        """
+        处理配置变更事件。
+
+        Args:
+            data: 事件数据
+        """
+        self._refresh_config()
+        
+        # API地址或模型可能已变化，清空嵌入向量缓存
+        with self._embedding_cache_lock:
+            self._embedding_cache.clear()
+
+    def _handle_app_exit(self, data=None):
+        """
+        处理应用程序退出事件。
+
+        Args:
+            data: 事件数据
+        """
+        # 取消尚未开始的后台请求，不等待正在执行的请求
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
 
     def _handle_test_api(self, data=None):
         """
-        处理测试AI API连接事件。
+        处理测试AI API连接事件，在后台线程中执行测试，避免阻塞UI线程。
 
         Args:
             data: 事件数据
         """
+        self._executor.submit(self._run_test_and_publish)
+
+    def _run_test_and_publish(self):
+        """测试API连接并发布测试结果事件。"""
         # 测试API连接
         success, message = self.test_api_connection()
         
@@ -67,10 +293,7 @@ class AIService:
             return False
         
         # 检查API URL和API密钥是否已配置
-        api_url = self._config_manager.get("ai", "api_url", "")
-        api_key = self._config_manager.get("ai", "api_key", "")
-        
-        return bool(api_url and api_key)
+        return bool(self._api_url and self._api_key)
 
     def test_api_connection(self) -> Tuple[bool, str]:
         """
@@ -86,60 +309,160 @@ class AIService:
         if self._config_manager.is_offline_mode():
             return False, "系统处于离线模式"
         
-        # 检查API URL和API密钥是否已配置
-        api_url = self._config_manager.get("ai", "api_url", "")
-        api_key = self._config_manager.get("ai", "api_key", "")
+        # 测试前按最新配置刷新API地址和请求头
+        self._refresh_config()
         
-        if not api_url:
+        # 检查API URL和API密钥是否已配置
+        if not self._api_url:
             return False, "API URL未配置"
         
-        if not api_key:
+        if not self._api_key:
             return False, "API密钥未配置"
         
-        # 构建请求URL
-        url = f"{api_url.rstrip('/')}/chat/completions"
+        messages = [
+            {"role": "system", "content": "You are a helpful assistant."},
+            {"role": "user", "content": "Hello, this is a test message. Please respond with 'Test successful'."}
+        ]
         
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {api_key}"
-        }
+        success, content = self._chat_completion(messages, max_tokens=50, timeout=10)
+        if not success:
+            return False, content
         
+        if "test successful" in content.lower():
+            return True, "API连接测试成功"
+        return False, f"API响应内容异常: {content}"
+
+    def _chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: int = 500,
+        timeout: int = 30
+    ) -> Tuple[bool, str]:
+        """
+        调用聊天补全接口。
+
+        Args:
+            messages: 消息列表
+            temperature: 温度，为None时使用接口默认值
+            max_tokens: 最大令牌数
+            timeout: 超时时间（秒）
+
+        Returns:
+            (成功标志, 回复内容或错误消息)
+        """
         # 构建请求数据
         data = {
-            "model": self._config_manager.get("ai", "model", "gpt-3.5-turbo"),
-            "messages": [
-                {"role": "system", "content": "You are a helpful assistant."},
-                {"role": "user", "content": "Hello, this is a test message. Please respond with 'Test successful'."}
-            ],
-            "max_tokens": 50
+            "model": self._model,
+            "messages": messages,
+            "max_tokens": max_tokens
         }
+        if temperature is not None:
+            data["temperature"] = temperature
         
         try:
             # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response = self._session.post(self._chat_url, data=_json_dumps(data), timeout=timeout)
             
             # 检查响应状态码
-            if response.status_code == 200:
-                # 解析响应数据
-                response_data = response.json()
-                
-                # 检查响应内容
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    content = response_data["choices"][0].get("message", {}).get("content", "")
-                    if "test successful" in content.lower():
-                        return True, "API连接测试成功"
-                    else:
-                        return False, f"API响应内容异常: {content}"
-                else:
-                    return False, f"API响应格式异常: {response_data}"
-            else:
-                return False, f"API请求失败，状态码: {response.status_code}, 响应: {response.text}"
+            if response.status_code != 200:
+                return False, f"API请求失败，状态码: {response.status_code}, 响应: {_error_body(response)}"
+            
+            # 解析响应数据
+            response_data = _json_loads(response.content)
+            
+            # 检查响应内容
+            if "choices" in response_data and len(response_data["choices"]) > 0:
+                return True, response_data["choices"][0].get("message", {}).get("content", "")
+            return False, f"API响应格式异常: {response_data}"
         except RequestException as e:
             return False, f"API请求异常: {str(e)}"
         except Exception as e:
             return False, f"未知错误: {str(e)}"
 
+    def _chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: int = 500,
+        timeout: int = 30
+    ) -> Iterator[str]:
+        """
+        以流式方式调用聊天补全接口，逐段返回回复内容。
+
+        Args:
+            messages: 消息列表
+            temperature: 温度，为None时使用接口默认值
+            max_tokens: 最大令牌数
+            timeout: 超时时间（秒）
+
+        Returns:
+            回复内容片段迭代器，请求失败时不返回任何内容
+        """
+        # 构建请求数据
+        data = {
+            "model": self._model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "stream": True
+        }
+        if temperature is not None:
+            data["temperature"] = temperature
+        
+        try:
+            # 发送请求，按行读取服务器推送的事件
+            with self._session.post(self._chat_url, data=_json_dumps(data), timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("流式请求失败，状态码: %s, 响应: %s",
+                                     response.status_code, _error_body(response))
+                    return
+                
+                for line in response.iter_lines():
+                    if not line.startswith(b"data: "):
+                        continue
+                    payload = line[6:]
+                    if payload.strip() == b"[DONE]":
+                        break
+                    
+                    choices = _json_loads(payload).get("choices") or []
+                    if choices:
+                        content = choices[0].get("delta", {}).get("content")
+                        if content:
+                            yield content
+        except RequestException as e:
+            logger.error("流式请求异常: %s", e)
+        except ValueError as e:
+            logger.error("流式响应解析失败: %s", e)
+
+    def _extract_json_object(self, content: str) -> Optional[Dict[str, Any]]:
+        """
+        从模型回复中解析JSON对象。
+
+        Args:
+            content: 回复内容
+
+        Returns:
+            解析出的字典，如果解析失败则返回None
+        """
+        try:
+            # 尝试直接解析
+            result = _json_loads(content)
+        except json.JSONDecodeError:
+            # 如果直接解析失败，尝试提取JSON部分
+            json_match = _JSON_OBJECT_RE.search(content)
+            if not json_match:
+                return None
+            try:
+                result = _json_loads(json_match.group(0))
+            except json.JSONDecodeError:
+                return None
+        
+        # 验证结果格式
+        if not isinstance(result, dict):
+            return None
+        return result
+
     def generate_embedding(self, text: str) -> Optional[List[float]]:
         """
         生成文本嵌入向量。
@@ -154,44 +477,152 @@ class AIService:
         if not self.is_available():
             return None
         
-        # 构建请求URL
-        api_url = self._config_manager.get("ai", "api_url", "")
-        url = f"{api_url.rstrip('/')}/embeddings"
+        model = "text-embedding-ada-002"
         
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config_manager.get('ai', 'api_key', '')}"
-        }
+        # 优先从缓存获取
+        cache_key = (model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+        cached = self._get_cached_embedding(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 构建请求URL
+        url = self._embed_url
         
         # 构建请求数据
         data = {
-            "model": "text-embedding-ada-002",
+            "model": model,
             "input": text
         }
         
         try:
             # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=10)
+            response = self._session.post(url, data=_json_dumps(data), timeout=10)
             
             # 检查响应状态码
             if response.status_code == 200:
                 # 解析响应数据
-                response_data = response.json()
+                response_data = _json_loads(response.content)
                 
                 # 检查响应内容
                 if "data" in response_data and len(response_data["data"]) > 0:
                     embedding = response_data["data"][0].get("embedding", None)
+                    if embedding is not None:
+                        self._cache_embedding(cache_key, embedding)
                     return embedding
             
-            # 记录错误
-            print(f"生成嵌入向量失败，状态码: {response.status_code}, 响应: {response.text}")
+            # 记录错误，仅在日志级别启用时才解码响应体
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("生成嵌入向量失败，状态码: %s, 响应: %s",
+                             response.status_code, _error_body(response))
             return None
         except Exception as e:
             # 记录错误
-            print(f"生成嵌入向量异常: {str(e)}")
+            logger.error("生成嵌入向量异常: %s", e)
             return None
 
+    def generate_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        批量生成文本嵌入向量，多个文本合并到同一个请求中发送。
+
+        Args:
+            texts: 文本列表
+
+        Returns:
+            嵌入向量列表，对应于输入文本列表，生成失败的位置为None
+        """
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        
+        # 如果AI服务不可用，返回全None
+        if not texts or not self.is_available():
+            return embeddings
+        
+        model = "text-embedding-ada-002"
+        
+        # 先从缓存获取，只请求未命中的文本
+        cache_keys = []
+        pending = []
+        for i, text in enumerate(texts):
+            cache_key = (model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest())
+            cache_keys.append(cache_key)
+            cached = self._get_cached_embedding(cache_key)
+            if cached is not None:
+                embeddings[i] = cached
+            elif text:
+                pending.append(i)
+        
+        # 构建请求URL
+        url = self._embed_url
+        
+        for start in range(0, len(pending), self.EMBEDDING_BATCH_SIZE):
+            batch = pending[start:start + self.EMBEDDING_BATCH_SIZE]
+            data = {
+                "model": model,
+                "input": [texts[i] for i in batch]
+            }
+            
+            try:
+                # 发送请求
+                response = self._session.post(url, data=_json_dumps(data), timeout=30)
+                
+                if response.status_code != 200:
+                    if logger.isEnabledFor(logging.ERROR):
+                        logger.error("批量生成嵌入向量失败，状态码: %s, 响应: %s",
+                                     response.status_code, _error_body(response))
+                    continue
+                
+                # 按index将结果放回对应位置
+                for item in _json_loads(response.content).get("data", []):
+                    index = item.get("index")
+                    embedding = item.get("embedding")
+                    if index is None or embedding is None or not 0 <= index < len(batch):
+                        continue
+                    text_index = batch[index]
+                    embeddings[text_index] = embedding
+                    self._cache_embedding(cache_keys[text_index], embedding)
+            except Exception as e:
+                logger.error("批量生成嵌入向量异常: %s", e)
+        
+        return embeddings
+
+    def _get_cached_embedding(self, cache_key: Tuple[str, bytes]) -> Optional[List[float]]:
+        """
+        从缓存获取嵌入向量。
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            嵌入向量，如果未命中或已过期则返回None
+        """
+        with self._embedding_cache_lock:
+            entry = self._embedding_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            expires_at, embedding = entry
+            if expires_at < time.monotonic():
+                del self._embedding_cache[cache_key]
+                return None
+            
+            self._embedding_cache.move_to_end(cache_key)
+        
+        # 返回副本，避免调用方修改缓存内容
+        return list(embedding)
+
+    def _cache_embedding(self, cache_key: Tuple[str, bytes], embedding: List[float]):
+        """
+        缓存嵌入向量，超出容量时淘汰最久未使用的条目。
+
+        Args:
+            cache_key: 缓存键
+            embedding: 嵌入向量
+        """
+        with self._embedding_cache_lock:
+            self._embedding_cache[cache_key] = (time.monotonic() + self.EMBEDDING_CACHE_TTL, tuple(embedding))
+            self._embedding_cache.move_to_end(cache_key)
+            while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                self._embedding_cache.popitem(last=False)
+
     def analyze_idea(self, idea_text: str) -> Dict[str, Any]:
         """
         分析想法，提取标签、主题和摘要。
@@ -210,164 +641,154 @@ class AIService:
                 "summary": ""
             }
         
-        # 构建请求URL
-        api_url = self._config_manager.get("ai", "api_url", "")
-        url = f"{api_url.rstrip('/')}/chat/completions"
-        
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config_manager.get('ai', 'api_key', '')}"
-        }
-        
         # 构建提示
-        prompt = f"""
-        请分析以下想法文本，提取关键信息：
-
-        {idea_text}
-
-        请提供以下信息：
-        1. 标签：提取3-5个关键词作为标签，每个标签不超过10个字符
-        2. 标题：生成一个简短的标题，不超过20个字符
-        3. 摘要：生成一个简短的摘要，不超过100个字符
-
-        请以JSON格式返回结果，格式如下：
-        {{
-            "tags": ["标签1", "标签2", "标签3"],
-            "title": "标题",
-            "summary": "摘要"
-        }}
-        """
+        prompt = _ANALYZE_PROMPT.format(idea_text=idea_text)
         
-        # 构建请求数据
-        data = {
-            "model": self._config_manager.get("ai", "model", "gpt-3.5-turbo"),
-            "messages": [
-                {"role": "system", "content": "你是一个专业的文本分析助手，擅长提取文本的关键信息。"},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,
-            "max_tokens": 500
-        }
+        messages = [
+            _ANALYZE_SYSTEM_MSG,
+            {"role": "user", "content": prompt}
+        ]
         
-        try:
-            # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            
-            # 检查响应状态码
-            if response.status_code == 200:
-                # 解析响应数据
-                response_data = response.json()
-                
-                # 检查响应内容
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    content = response_data["choices"][0].get("message", {}).get("content", "")
-                    
-                    # 提取JSON部分
-                    try:
-                        # 尝试直接解析
-                        result = json.loads(content)
-                    except json.JSONDecodeError:
-                        # 如果直接解析失败，尝试提取JSON部分
-                        import re
-                        json_match = re.search(r'({[\s\S]*})', content)
-                        if json_match:
-                            try:
-                                result = json.loads(json_match.group(1))
-                            except json.JSONDecodeError:
-                                # 如果仍然失败，返回默认结果
-                                return {
-                                    "tags": [],
-                                    "title": "",
-                                    "summary": ""
-                                }
-                        else:
-                            # 如果没有找到JSON部分，返回默认结果
-                            return {
-                                "tags": [],
-                                "title": "",
-                                "summary": ""
-                            }
-                    
-                    # 验证结果格式
-                    if not isinstance(result, dict):
-                        return {
-                            "tags": [],
-                            "title": "",
-                            "summary": ""
-                        }
-                    
-                    # 提取结果
-                    tags = result.get("tags", [])
-                    title = result.get("title", "")
-                    summary = result.get("summary", "")
-                    
-                    # 验证结果类型
-                    if not isinstance(tags, list):
-                        tags = []
-                    
-                    if not isinstance(title, str):
-                        title = ""
-                    
-                    if not isinstance(summary, str):
-                        summary = ""
-                    
-                    return {
-                        "tags": tags,
-                        "title": title,
-                        "summary": summary
-                    }
-            
+        success, content = self._chat_completion(messages, temperature=0.3, max_tokens=500)
+        if not success:
             # 记录错误
-            print(f"分析想法失败，状态码: {response.status_code}, 响应: {response.text}")
+            logger.error("分析想法失败: %s", content)
             return {
                 "tags": [],
                 "title": "",
                 "summary": ""
             }
-        except Exception as e:
-            # 记录错误
-            print(f"分析想法异常: {str(e)}")
+        
+        # 提取JSON部分
+        result = self._extract_json_object(content)
+        if result is None:
             return {
                 "tags": [],
                 "title": "",
                 "summary": ""
             }
+        
+        # 提取结果
+        tags = result.get("tags", [])
+        title = result.get("title", "")
+        summary = result.get("summary", "")
+        
+        # 验证结果类型
+        if not isinstance(tags, list):
+            tags = []
+        
+        if not isinstance(title, str):
+            title = ""
+        
+        if not isinstance(summary, str):
+            summary = ""
+        
+        return {
+            "tags": tags,
+            "title": title,
+            "summary": summary
+        }
+
+    def analyze_ideas_batch(self, idea_texts: List[str], concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        并发分析多个想法。
 
-    def find_related_ideas(self, idea_text: str, idea_id: Optional[int] = None, limit: int = 5) -> List[Dict[str, Any]]:
+        请求通过会话连接池并发发送，结果顺序与输入一致。
+
+        Args:
+            idea_texts: 想法文本列表
+            concurrency: 最大并发请求数
+
+        Returns:
+            分析结果列表，对应于输入文本列表
+        """
+        if not idea_texts:
+            return []
+        
+        # AI服务不可用时无需启动线程
+        if not self.is_available() or len(idea_texts) == 1:
+            return [self.analyze_idea(text) for text in idea_texts]
+        
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(idea_texts))) as executor:
+            return list(executor.map(self.analyze_idea, idea_texts))
+
+    def find_related_ideas(self, idea_text: str, idea_id: Optional[int] = None, limit: int = 5) -> Future:
         """
         查找与给定想法相关的其他想法。
 
+        嵌入向量在后台线程中生成，随后通过query_vector_db事件查询向量数据库，
+        查询结果写入返回的Future。
+
         Args:
             idea_text: 想法文本
             idea_id: 想法ID，用于排除自身
             limit: 返回结果数量限制
 
         Returns:
-            相关想法列表
+            Future对象，结果为相关想法列表
         """
-        # 如果AI服务不可用，返回空列表
-        if not self.is_available():
-            return []
+        future: Future = Future()
         
-        # 生成嵌入向量
-        embedding = self.generate_embedding(idea_text)
-        if not embedding:
-            return []
+        # 如果AI服务不可用，直接返回空列表
+        if not self.is_available():
+            future.set_result([])
+            return future
         
-        # 发布查询向量数据库事件
-        self._event_system.publish("query_vector_db", {
-            "embedding": embedding,
-            "exclude_id": idea_id,
-            "limit": limit,
-            "callback": lambda results: self._event_system.publish("related_ideas_found", {
-                "idea_id": idea_id,
-                "results": results
+        self._executor.submit(self._query_related_ideas, future, idea_text, idea_id, limit)
+        return future
+
+    def _query_related_ideas(self, future: Future, idea_text: str, idea_id: Optional[int], limit: int):
+        """
+        生成嵌入向量并查询相关想法，结果写入Future。
+
+        Args:
+            future: 接收结果的Future对象
+            idea_text: 想法文本
+            idea_id: 想法ID，用于排除自身
+            limit: 返回结果数量限制
+        """
+        try:
+            # 生成嵌入向量
+            embedding = self.generate_embedding(idea_text)
+            
+            # 没有嵌入向量或没有向量数据库查询处理器时，返回空列表
+            if not embedding or not self._event_system.has_subscribers("query_vector_db"):
+                future.set_result([])
+                return
+            
+            # 发布查询向量数据库事件，由处理器通过回调写入结果
+            self._event_system.publish("query_vector_db", {
+                "embedding": embedding,
+                "exclude_id": idea_id,
+                "limit": limit,
+                "callback": future.set_result
             })
-        })
+        except Exception as e:
+            future.set_exception(e)
+
+    def _build_summarize_messages(self, ideas: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+        """
+        构建总结想法的消息列表。
+
+        Args:
+            ideas: 想法列表，每个想法包含id、title、content等字段
+
+        Returns:
+            消息列表
+        """
+        # 构建想法文本
+        ideas_text = "".join(
+            f"想法{i+1}：{idea.get('title', '')}\n{idea.get('content', '')}\n\n"
+            for i, idea in enumerate(ideas)
+        )
+        
+        # 构建提示
+        prompt = _SUMMARIZE_PROMPT.format(ideas_text=ideas_text)
         
-        # 返回空列表，实际结果将通过事件异步返回
-        return []
+        return [
+            _SUMMARIZE_SYSTEM_MSG,
+            {"role": "user", "content": prompt}
+        ]
 
     def summarize_ideas(self, ideas: List[Dict[str, Any]]) -> str:
         """
@@ -383,68 +804,32 @@ class AIService:
         if not self.is_available() or not ideas:
             return ""
         
-        # 构建请求URL
-        api_url = self._config_manager.get("ai", "api_url", "")
-        url = f"{api_url.rstrip('/')}/chat/completions"
+        messages = self._build_summarize_messages(ideas)
         
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config_manager.get('ai', 'api_key', '')}"
-        }
-        
-        # 构建想法文本
-        ideas_text = ""
-        for i, idea in enumerate(ideas):
-            ideas_text += f"想法{i+1}：{idea.get('title', '')}\n"
-            ideas_text += f"{idea.get('content', '')}\n\n"
+        success, content = self._chat_completion(messages, temperature=0.5, max_tokens=1000)
+        if not success:
+            # 记录错误
+            logger.error("总结想法失败: %s", content)
+            return ""
         
-        # 构建提示
-        prompt = f"""
-        请总结以下想法，找出共同主题、关联点和可能的行动建议：
+        return content.strip()
 
-        {ideas_text}
+    def summarize_ideas_stream(self, ideas: List[Dict[str, Any]]) -> Iterator[str]:
+        """
+        以流式方式总结多个想法，逐段返回生成的文本。
 
-        请提供：
-        1. 共同主题：这些想法的共同点是什么？
-        2. 关键见解：从这些想法中可以得出哪些重要见解？
-        3. 行动建议：基于这些想法，有哪些可能的行动建议？
+        Args:
+            ideas: 想法列表，每个想法包含id、title、content等字段
 
-        请以连贯的段落形式回答，不要使用标题或编号。
+        Returns:
+            总结文本片段迭代器
         """
+        # 如果AI服务不可用或想法列表为空，不返回任何内容
+        if not self.is_available() or not ideas:
+            return
         
-        # 构建请求数据
-        data = {
-            "model": self._config_manager.get("ai", "model", "gpt-3.5-turbo"),
-            "messages": [
-                {"role": "system", "content": "你是一个专业的思想分析师，擅长总结和关联不同的想法。"},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.5,
-            "max_tokens": 1000
-        }
-        
-        try:
-            # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            
-            # 检查响应状态码
-            if response.status_code == 200:
-                # 解析响应数据
-                response_data = response.json()
-                
-                # 检查响应内容
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    content = response_data["choices"][0].get("message", {}).get("content", "")
-                    return content.strip()
-            
-            # 记录错误
-            print(f"总结想法失败，状态码: {response.status_code}, 响应: {response.text}")
-            return ""
-        except Exception as e:
-            # 记录错误
-            print(f"总结想法异常: {str(e)}")
-            return ""
+        messages = self._build_summarize_messages(ideas)
+        yield from self._chat_completion_stream(messages, temperature=0.5, max_tokens=1000)
 
     def generate_reminder(self, idea_text: str) -> Dict[str, Any]:
         """
@@ -464,131 +849,85 @@ class AIService:
                 "remind_reason": ""
             }
         
-        # 构建请求URL
-        api_url = self._config_manager.get("ai", "api_url", "")
-        url = f"{api_url.rstrip('/')}/chat/completions"
-        
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config_manager.get('ai', 'api_key', '')}"
-        }
-        
         # 获取当前时间
         current_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
         
         # 构建提示
-        prompt = f"""
-        请分析以下想法文本，判断是否需要设置提醒：
-
-        {idea_text}
-
-        当前时间：{current_time}
-
-        请判断这个想法是否包含需要在未来某个时间点提醒用户的内容。如果需要提醒，请指定提醒时间和原因。
-
-        请以JSON格式返回结果，格式如下：
-        {{
-            "should_remind": true或false,
-            "remind_time": "YYYY-MM-DD HH:MM:SS"（如果should_remind为true，则提供提醒时间，否则为null）,
-            "remind_reason": "提醒原因"（如果should_remind为true，则提供提醒原因，否则为空字符串）
-        }}
-        """
+        prompt = _REMINDER_PROMPT.format(idea_text=idea_text, current_time=current_time)
         
-        # 构建请求数据
-        data = {
-            "model": self._config_manager.get("ai", "model", "gpt-3.5-turbo"),
-            "messages": [
-                {"role": "system", "content": "你是一个专业的个人助理，擅长分析文本并设置合适的提醒。"},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.3,
-            "max_tokens": 500
-        }
+        messages = [
+            _REMINDER_SYSTEM_MSG,
+            {"role": "user", "content": prompt}
+        ]
         
-        try:
-            # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            
-            # 检查响应状态码
-            if response.status_code == 200:
-                # 解析响应数据
-                response_data = response.json()
-                
-                # 检查响应内容
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    content = response_data["choices"][0].get("message", {}).get("content", "")
-                    
-                    # 提取JSON部分
-                    try:
-                        # 尝试直接解析
-                        result = json.loads(content)
-                    except json.JSONDecodeError:
-                        # 如果直接解析失败，尝试提取JSON部分
-                        import re
-                        json_match = re.search(r'({[\s\S]*})', content)
-                        if json_match:
-                            try:
-                                result = json.loads(json_match.group(1))
-                            except json.JSONDecodeError:
-                                # 如果仍然失败，返回默认结果
-                                return {
-                                    "should_remind": False,
-                                    "remind_time": None,
-                                    "remind_reason": ""
-                                }
-                        else:
-                            # 如果没有找到JSON部分，返回默认结果
-                            return {
-                                "should_remind": False,
-                                "remind_time": None,
-                                "remind_reason": ""
-                            }
-                    
-                    # 验证结果格式
-                    if not isinstance(result, dict):
-                        return {
-                            "should_remind": False,
-                            "remind_time": None,
-                            "remind_reason": ""
-                        }
-                    
-                    # 提取结果
-                    should_remind = result.get("should_remind", False)
-                    remind_time = result.get("remind_time", None)
-                    remind_reason = result.get("remind_reason", "")
-                    
-                    # 验证结果类型
-                    if not isinstance(should_remind, bool):
-                        should_remind = False
-                    
-                    if not isinstance(remind_time, str) and remind_time is not None:
-                        remind_time = None
-                    
-                    if not isinstance(remind_reason, str):
-                        remind_reason = ""
-                    
-                    return {
-                        "should_remind": should_remind,
-                        "remind_time": remind_time,
-                        "remind_reason": remind_reason
-                    }
-            
+        success, content = self._chat_completion(messages, temperature=0.3, max_tokens=500)
+        if not success:
             # 记录错误
-            print(f"生成提醒建议失败，状态码: {response.status_code}, 响应: {response.text}")
+            logger.error("生成提醒建议失败: %s", content)
             return {
                 "should_remind": False,
                 "remind_time": None,
                 "remind_reason": ""
             }
-        except Exception as e:
-            # 记录错误
-            print(f"生成提醒建议异常: {str(e)}")
+        
+        # 提取JSON部分
+        result = self._extract_json_object(content)
+        if result is None:
             return {
                 "should_remind": False,
                 "remind_time": None,
                 "remind_reason": ""
             }
+        
+        # 提取结果
+        should_remind = result.get("should_remind", False)
+        remind_time = result.get("remind_time", None)
+        remind_reason = result.get("remind_reason", "")
+        
+        # 验证结果类型
+        if not isinstance(should_remind, bool):
+            should_remind = False
+        
+        if not isinstance(remind_time, str) and remind_time is not None:
+            remind_time = None
+        
+        if not isinstance(remind_reason, str):
+            remind_reason = ""
+        
+        return {
+            "should_remind": should_remind,
+            "remind_time": remind_time,
+            "remind_reason": remind_reason
+        }
+
+    def _build_ask_messages(
+        self, query: str, context: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, str]]:
+        """
+        构建AI问答的消息列表。
+
+        Args:
+            query: 问题
+            context: 上下文，包含相关想法的列表
+
+        Returns:
+            消息列表
+        """
+        # 构建上下文文本
+        context_text = ""
+        if context:
+            context_text = "以下是一些相关的想法，可能对回答有帮助：\n\n" + "".join(
+                f"想法{i+1}：{idea.get('title', '')}\n{idea.get('content', '')}\n\n"
+                for i, idea in enumerate(context)
+            )
+        
+        # 构建提示
+        prompt = _ASK_PROMPT.format(context_text=context_text, query=query)
+        
+        return [
+            _ASK_SYSTEM_MSG,
+            {"role": "user", "content": prompt}
+        ]
 
     def ask_ai(self, query: str, context: Optional[List[Dict[str, Any]]] = None) -> str:
         """
@@ -605,62 +944,38 @@ class AIService:
         if not self.is_available():
             return "AI服务不可用，请检查设置。"
         
-        # 构建请求URL
-        api_url = self._config_manager.get("ai", "api_url", "")
-        url = f"{api_url.rstrip('/')}/chat/completions"
-        
-        # 构建请求头
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._config_manager.get('ai', 'api_key', '')}"
-        }
-        
-        # 构建上下文文本
-        context_text = ""
-        if context:
-            context_text = "以下是一些相关的想法，可能对回答有帮助：\n\n"
-            for i, idea in enumerate(context):
-                context_text += f"想法{i+1}：{idea.get('title', '')}\n"
-                context_text += f"{idea.get('content', '')}\n\n"
-        
-        # 构建提示
-        prompt = f"""
-        {context_text}
+        messages = self._build_ask_messages(query, context)
         
-        用户问题：{query}
+        success, content = self._chat_completion(messages, temperature=0.7, max_tokens=1000)
+        if not success:
+            # 记录错误
+            logger.error("AI问答失败: %s", content)
+            return "AI服务请求失败，请稍后再试。"
         
-        请根据上述信息回答用户的问题。如果无法根据提供的信息回答，请诚实地说明。
+        return content.strip()
+
+    def ask_ai_stream(self, query: str, context: Optional[List[Dict[str, Any]]] = None) -> Iterator[str]:
         """
+        以流式方式向AI提问，逐段返回生成的回答。
+
+        Args:
+            query: 问题
+            context: 上下文，包含相关想法的列表
+
+        Returns:
+            AI回答片段迭代器
+        """
+        # 如果AI服务不可用，返回错误消息
+        if not self.is_available():
+            yield "AI服务不可用，请检查设置。"
+            return
         
-        # 构建请求数据
-        data = {
-            "model": self._config_manager.get("ai", "model", "gpt-3.5-turbo"),
-            "messages": [
-                {"role": "system", "content": "你是一个智能助手，可以帮助用户回答关于他们想法的问题。"},
-                {"role": "user", "content": prompt}
-            ],
-            "temperature": 0.7,
-            "max_tokens": 1000
-        }
+        messages = self._build_ask_messages(query, context)
         
-        try:
-            # 发送请求
-            response = requests.post(url, headers=headers, json=data, timeout=30)
-            
-            # 检查响应状态码
-            if response.status_code == 200:
-                # 解析响应数据
-                response_data = response.json()
-                
-                # 检查响应内容
-                if "choices" in response_data and len(response_data["choices"]) > 0:
-                    content = response_data["choices"][0].get("message", {}).get("content", "")
-                    return content.strip()
-            
-            # 记录错误
-            print(f"AI问答失败，状态码: {response.status_code}, 响应: {response.text}")
-            return "AI服务请求失败，请稍后再试。"
-        except Exception as e:
-            # 记录错误
-            print(f"AI问答异常: {str(e)}")
-            return f"AI服务异常: {str(e)}"
+        received = False
+        for chunk in self._chat_completion_stream(messages, temperature=0.7, max_tokens=1000):
+            received = True
+            yield chunk
+        
+        if not received:
+            yield "AI服务请求失败，请稍后再试。"
@@ -29,11 +29,22 @@ class EmbeddingGenerator:
         """
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
+        self._ai_service = ai_service
         
         # 注册事件处理器
         self._register_event_handlers()
 
+    def _get_ai_service(self) -> AIService:
+        """
+        获取AI服务实例，未传入时在首次使用时创建。
+
+        Returns:
+            AI服务实例
+        """
+        if self._ai_service is None:
+            self._ai_service = AIService(self._config_manager, self._event_system)
+        return self._ai_service
+
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 生成嵌入向量事件
@@ -74,7 +85,7 @@ class EmbeddingGenerator:
             return None
         
         # 使用AI服务生成嵌入向量
-        embedding = self._ai_service.generate_embedding(text)
+        embedding = self._get_ai_service().generate_embedding(text)
         
         # 如果AI服务不可用或生成失败，使用备用方法生成
         if embedding is None:
@@ -162,10 +173,14 @@ class EmbeddingGenerator:
         if not texts:
             return []
         
-        # 逐个生成嵌入向量
-        embeddings = []
-        for text in texts:
-            embedding = self.generate_embedding(text)
-            embeddings.append(embedding)
+        # 使用AI服务批量生成嵌入向量
+        embeddings = self._get_ai_service().generate_embeddings(texts)
+        
+        # 空文本返回None，生成失败的使用备用方法生成
+        for i, text in enumerate(texts):
+            if not text:
+                embeddings[i] = None
+            elif embeddings[i] is None:
+                embeddings[i] = self._generate_fallback_embedding(text)
         
         return embeddings
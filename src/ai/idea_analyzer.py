@@ -1,6 +1,7 @@
 """
 想法分析和关联模块，用于分析想法并找出关联。
 """
+from collections import defaultdict
 from typing import Dict, List, Optional, Tuple, Union
 
 from src.ai.ai_service import AIService
@@ -36,16 +37,60 @@ class IdeaAnalyzer:
         """
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
-        self._embedding_generator = embedding_generator or EmbeddingGenerator(
-            self._config_manager, self._event_system, self._ai_service
-        )
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
-        self._tag_manager = tag_manager or TagManager(self._config_manager, self._event_system)
+        self._ai_service = ai_service
+        self._embedding_generator = embedding_generator
+        self._idea_manager = idea_manager
+        self._tag_manager = tag_manager
         
         # 注册事件处理器
         self._register_event_handlers()
 
+    def _get_ai_service(self) -> AIService:
+        """
+        获取AI服务实例，未传入时在首次使用时创建。
+
+        Returns:
+            AI服务实例
+        """
+        if self._ai_service is None:
+            self._ai_service = AIService(self._config_manager, self._event_system)
+        return self._ai_service
+
+    def _get_embedding_generator(self) -> EmbeddingGenerator:
+        """
+        获取嵌入生成器实例，未传入时在首次使用时创建。
+
+        Returns:
+            嵌入生成器实例
+        """
+        if self._embedding_generator is None:
+            self._embedding_generator = EmbeddingGenerator(
+                self._config_manager, self._event_system, self._get_ai_service()
+            )
+        return self._embedding_generator
+
+    def _get_idea_manager(self) -> IdeaManager:
+        """
+        获取想法管理器实例，未传入时在首次使用时创建。
+
+        Returns:
+            想法管理器实例
+        """
+        if self._idea_manager is None:
+            self._idea_manager = IdeaManager(self._config_manager, self._event_system)
+        return self._idea_manager
+
+    def _get_tag_manager(self) -> TagManager:
+        """
+        获取标签管理器实例，未传入时在首次使用时创建。
+
+        Returns:
+            标签管理器实例
+        """
+        if self._tag_manager is None:
+            self._tag_manager = TagManager(self._config_manager, self._event_system)
+        return self._tag_manager
+
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 分析想法事件
@@ -75,7 +120,7 @@ class IdeaAnalyzer:
             return
         
         # 获取想法
-        idea = self._idea_manager.get_idea(idea_id)
+        idea = self._get_idea_manager().get_idea(idea_id)
         
         # 如果想法不存在，不处理
         if not idea:
@@ -85,7 +130,7 @@ class IdeaAnalyzer:
         analysis_result = self.analyze_idea(idea["content"])
         
         # 更新想法
-        self._idea_manager.update_idea(
+        self._get_idea_manager().update_idea(
             idea_id,
             title=analysis_result.get("title", idea.get("title", "")),
             summary=analysis_result.get("summary", ""),
@@ -117,7 +162,7 @@ class IdeaAnalyzer:
             return
         
         # 获取想法
-        idea = self._idea_manager.get_idea(idea_id)
+        idea = self._get_idea_manager().get_idea(idea_id)
         
         # 如果想法不存在，不处理
         if not idea:
@@ -147,21 +192,22 @@ class IdeaAnalyzer:
         if not idea_ids:
             return
         
-        # 批量分析想法
-        results = {}
+        # 获取想法，跳过不存在的想法
+        ideas = []
         for idea_id in idea_ids:
-            # 获取想法
-            idea = self._idea_manager.get_idea(idea_id)
-            
-            # 如果想法不存在，跳过
-            if not idea:
-                continue
-            
-            # 分析想法
-            analysis_result = self.analyze_idea(idea["content"])
+            idea = self._get_idea_manager().get_idea(idea_id)
+            if idea:
+                ideas.append(idea)
+        
+        # 并发分析想法
+        analysis_results = self.analyze_ideas([idea["content"] for idea in ideas])
+        
+        results = {}
+        for idea, analysis_result in zip(ideas, analysis_results):
+            idea_id = idea["id"]
             
             # 更新想法
-            self._idea_manager.update_idea(
+            self._get_idea_manager().update_idea(
                 idea_id,
                 title=analysis_result.get("title", idea.get("title", "")),
                 summary=analysis_result.get("summary", ""),
@@ -194,7 +240,7 @@ class IdeaAnalyzer:
             }
         
         # 使用AI服务分析想法
-        analysis_result = self._ai_service.analyze_idea(content)
+        analysis_result = self._get_ai_service().analyze_idea(content)
         
         # 如果AI服务不可用或分析失败，使用备用方法分析
         if not analysis_result.get("title") and not analysis_result.get("tags"):
@@ -202,6 +248,36 @@ class IdeaAnalyzer:
         
         return analysis_result
 
+    def analyze_ideas(self, contents: List[str]) -> List[Dict[str, Union[str, List[str]]]]:
+        """
+        批量分析想法，AI请求并发发送。
+
+        Args:
+            contents: 想法内容列表
+
+        Returns:
+            分析结果列表，对应于输入内容列表
+        """
+        # 只把非空内容发送给AI服务
+        non_empty = [content for content in contents if content]
+        ai_results = iter(self._get_ai_service().analyze_ideas_batch(non_empty))
+        
+        results = []
+        for content in contents:
+            if not content:
+                results.append({"title": "", "summary": "", "tags": []})
+                continue
+            
+            analysis_result = next(ai_results)
+            
+            # 如果AI服务不可用或分析失败，使用备用方法分析
+            if not analysis_result.get("title") and not analysis_result.get("tags"):
+                analysis_result = self._analyze_idea_fallback(content)
+            
+            results.append(analysis_result)
+        
+        return results
+
     def _analyze_idea_fallback(self, content: str) -> Dict[str, Union[str, List[str]]]:
         """
         备用的想法分析方法，当AI服务不可用时使用。
@@ -224,10 +300,10 @@ class IdeaAnalyzer:
         
         # 提取标签
         words = content.lower().split()
-        word_freq = {}
+        word_freq = defaultdict(int)
         for word in words:
             if len(word) > 2:
-                word_freq[word] = word_freq.get(word, 0) + 1
+                word_freq[word] += 1
         
         # 按频率排序
         sorted_words = sorted(word_freq.items(), key=lambda x: x[1], reverse=True)
@@ -258,37 +334,44 @@ class IdeaAnalyzer:
             return []
         
         # 生成嵌入向量
-        embedding = self._embedding_generator.generate_embedding(content)
+        embedding = self._get_embedding_generator().generate_embedding(content)
         
         # 如果生成嵌入向量失败，返回空列表
         if embedding is None:
             return []
         
         # 获取所有想法
-        ideas = self._idea_manager.get_ideas()
+        ideas = self._get_idea_manager().get_ideas()
+        
+        # 排除指定的想法
+        if exclude_id is not None:
+            ideas = [idea for idea in ideas if idea["id"] != exclude_id]
+        
+        # 为没有嵌入向量的想法批量生成嵌入向量
+        missing_ideas = [idea for idea in ideas if "embedding" not in idea or not idea["embedding"]]
+        missing_embeddings = dict(zip(
+            (idea["id"] for idea in missing_ideas),
+            self._get_embedding_generator().batch_generate_embeddings([idea["content"] for idea in missing_ideas])
+        ))
         
         # 计算相似度
         similarities = []
         for idea in ideas:
-            # 如果是要排除的想法，跳过
-            if exclude_id is not None and idea["id"] == exclude_id:
-                continue
-            
-            # 如果想法没有嵌入向量，生成嵌入向量
+            # 如果想法没有嵌入向量，使用批量生成的嵌入向量
             if "embedding" not in idea or not idea["embedding"]:
-                idea_embedding = self._embedding_generator.generate_embedding(idea["content"])
+                idea_embedding = missing_embeddings.get(idea["id"])
                 
                 # 如果生成嵌入向量失败，跳过
                 if idea_embedding is None:
                     continue
                 
                 # 更新想法的嵌入向量
-                self._idea_manager.update_idea_embedding(idea["id"], idea_embedding)
+                self._get_idea_manager().update_idea_embedding(idea["id"], idea_embedding)
             else:
                 idea_embedding = idea["embedding"]
             
             # 计算相似度
-            similarity = self._embedding_generator.calculate_similarity(embedding, idea_embedding)
+            similarity = self._get_embedding_generator().calculate_similarity(embedding, idea_embedding)
             
             # 添加到相似度列表
             similarities.append((idea, similarity))
@@ -300,7 +383,7 @@ class IdeaAnalyzer:
         related_ideas = []
         for idea, similarity in similarities[:limit]:
             # 获取标签
-            tags = self._tag_manager.get_idea_tags(idea["id"])
+            tags = self._get_tag_manager().get_idea_tags(idea["id"])
             
             # 添加到相关想法列表
             related_ideas.append({
@@ -332,7 +415,7 @@ class IdeaAnalyzer:
         results = {}
         for idea_id in idea_ids:
             # 获取想法
-            idea = self._idea_manager.get_idea(idea_id)
+            idea = self._get_idea_manager().get_idea(idea_id)
             
             # 如果想法不存在，跳过
             if not idea:
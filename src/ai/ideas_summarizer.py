@@ -1,7 +1,14 @@
 """
 智能归纳和总结模块，用于归纳和总结想法。
 """
-from typing import Dict, List, Optional, Tuple, Union
+import hashlib
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import chain
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from src.ai.ai_service import AIService
 from src.business.idea_manager import IdeaManager
@@ -9,10 +16,34 @@ from src.business.tag_manager import TagManager
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 
+# 压缩想法内容时去除的Markdown标记：标题、引用、列表符号、强调和代码符号
+_MARKDOWN_PREFIX_RE = re.compile(r"^\s{0,3}(?:#{1,6}|>|[-*+]|\d+\.)\s+", re.MULTILINE)
+_MARKDOWN_INLINE_RE = re.compile(r"[*_`~]+")
+_MARKDOWN_LINK_RE = re.compile(r"!?\[([^\]]*)\]\([^)]*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class IdeasSummarizer:
     """想法总结器类，用于归纳和总结想法。"""
 
+    # 总结缓存容量和有效期（秒）
+    SUMMARY_CACHE_SIZE = 128
+    SUMMARY_CACHE_TTL = 24 * 3600
+
+    # 等待其他线程进行中的相同总结请求的最长时间（秒）
+    SUMMARY_WAIT_TIMEOUT = 60
+
+    # 发送给AI的想法内容总字符数预算，以及每个想法至少保留的字符数
+    SUMMARY_CHAR_BUDGET = 6000
+    SUMMARY_MIN_IDEA_CHARS = 80
+
+    # 分段总结时每段的想法数量，以及并发请求数
+    MAP_REDUCE_CHUNK_SIZE = 25
+    MAP_REDUCE_WORKERS = 4
+
+    # 想法数量不超过该值时直接使用模板总结，不调用AI服务
+    SHORT_SUMMARY_THRESHOLD = 2
+
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -33,13 +64,53 @@ class IdeasSummarizer:
         """
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
-        self._tag_manager = tag_manager or TagManager(self._config_manager, self._event_system)
+        self._ai_service = ai_service
+        self._idea_manager = idea_manager
+        self._tag_manager = tag_manager
+        
+        # AI总结缓存，键为想法集合的内容摘要，值为(过期时间, 总结)
+        self._summary_cache = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
+        
+        # 进行中的AI总结请求，相同想法集合的并发请求共享同一个结果
+        self._pending_summaries: Dict[str, Future] = {}
         
         # 注册事件处理器
         self._register_event_handlers()
 
+    def _get_ai_service(self) -> AIService:
+        """
+        获取AI服务实例，未传入时在首次使用时创建。
+
+        Returns:
+            AI服务实例
+        """
+        if self._ai_service is None:
+            self._ai_service = AIService(self._config_manager, self._event_system)
+        return self._ai_service
+
+    def _get_idea_manager(self) -> IdeaManager:
+        """
+        获取想法管理器实例，未传入时在首次使用时创建。
+
+        Returns:
+            想法管理器实例
+        """
+        if self._idea_manager is None:
+            self._idea_manager = IdeaManager(self._config_manager, self._event_system)
+        return self._idea_manager
+
+    def _get_tag_manager(self) -> TagManager:
+        """
+        获取标签管理器实例，未传入时在首次使用时创建。
+
+        Returns:
+            标签管理器实例
+        """
+        if self._tag_manager is None:
+            self._tag_manager = TagManager(self._config_manager, self._event_system)
+        return self._tag_manager
+
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 总结想法事件
@@ -68,19 +139,16 @@ class IdeasSummarizer:
         if not idea_ids:
             return
         
-        # 获取想法列表
-        ideas = []
-        for idea_id in idea_ids:
-            idea = self._idea_manager.get_idea(idea_id)
-            if idea:
-                # 获取标签
-                tags = self._tag_manager.get_idea_tags(idea_id)
-                
-                # 添加标签到想法
-                idea["tags"] = tags
-                
-                # 添加到想法列表
-                ideas.append(idea)
+        # 批量获取想法和标签
+        ideas_map = self._get_idea_manager().get_ideas_by_ids(idea_ids)
+        tags_map = self._get_tag_manager().get_tags_for_ideas(list(ideas_map))
+        
+        # 按请求顺序组装想法列表，并添加标签
+        ideas = [
+            {**ideas_map[idea_id], "tags": tags_map.get(idea_id, [])}
+            for idea_id in idea_ids
+            if idea_id in ideas_map
+        ]
         
         # 总结想法
         summary = self.summarize_ideas(ideas)
@@ -107,7 +175,7 @@ class IdeasSummarizer:
             return
         
         # 获取标签想法
-        ideas = self._idea_manager.get_ideas_by_tag(tag)
+        ideas = self._get_idea_manager().get_ideas_by_tag(tag)
         
         # 总结想法
         summary = self.summarize_ideas(ideas)
@@ -137,7 +205,7 @@ class IdeasSummarizer:
             return
         
         # 获取时间段想法
-        ideas = self._idea_manager.get_ideas_by_time_range(start_time, end_time)
+        ideas = self._get_idea_manager().get_ideas_by_time_range(start_time, end_time)
         
         # 总结想法
         summary = self.summarize_ideas(ideas)
@@ -160,15 +228,201 @@ class IdeasSummarizer:
         if not ideas:
             return ""
         
-        # 使用AI服务总结想法
-        summary = self._ai_service.summarize_ideas(ideas)
+        # 想法很少时模板总结已足够，不必调用AI服务
+        if len(ideas) <= self.SHORT_SUMMARY_THRESHOLD:
+            return self._summarize_ideas_fallback(ideas)
         
         # 如果AI服务不可用或总结失败，使用备用方法总结
-        if not summary:
-            summary = self._summarize_ideas_fallback(ideas)
+        return self._summarize_with_ai(ideas) or self._summarize_ideas_fallback(ideas)
+
+    def _summarize_ideas_map_reduce(self, ideas: List[Dict]) -> str:
+        """
+        分段总结大量想法：先并发总结每段想法，再总结各段的总结。
+
+        Args:
+            ideas: 想法列表
+
+        Returns:
+            总结文本
+        """
+        if len(ideas) <= self.MAP_REDUCE_CHUNK_SIZE:
+            return self.summarize_ideas(ideas)
+        
+        # 并发总结每段想法
+        chunks = [
+            ideas[start:start + self.MAP_REDUCE_CHUNK_SIZE]
+            for start in range(0, len(ideas), self.MAP_REDUCE_CHUNK_SIZE)
+        ]
+        with ThreadPoolExecutor(max_workers=min(self.MAP_REDUCE_WORKERS, len(chunks))) as executor:
+            summaries = list(executor.map(self._summarize_with_ai, chunks))
+        
+        # 所有分段都失败时使用备用方法总结
+        if not any(summaries):
+            return self._summarize_ideas_fallback(ideas)
+        
+        # 部分分段失败时用备用方法总结这些分段，确保每个想法都包含在最终总结中
+        partials = [
+            summary or self._summarize_ideas_fallback(chunk)
+            for chunk, summary in zip(chunks, summaries)
+        ]
+        
+        # 总结各段的总结，失败时直接拼接分段总结
+        summary = self._summarize_with_ai([
+            {"title": f"第{i+1}部分", "content": partial}
+            for i, partial in enumerate(partials)
+        ])
+        return summary or "\n\n".join(partials)
+
+    def _summarize_with_ai(self, ideas: List[Dict]) -> str:
+        """
+        使用AI服务总结想法，结果按想法集合缓存，相同的并发请求只调用一次AI服务。
+
+        Args:
+            ideas: 想法列表
+
+        Returns:
+            总结文本，如果AI服务不可用或总结失败则返回空字符串
+        """
+        # 相同的想法集合且内容未修改时直接返回缓存的总结
+        cache_key = self._summary_cache_key(ideas)
+        summary = self._get_cached_summary(cache_key)
+        if summary is not None:
+            return summary
+        
+        # 如果已有相同的总结请求在进行中，等待其结果，不重复调用AI服务
+        with self._summary_cache_lock:
+            future = self._pending_summaries.get(cache_key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._pending_summaries[cache_key] = future
+        
+        if not owner:
+            try:
+                summary = future.result(timeout=self.SUMMARY_WAIT_TIMEOUT)
+            except FutureTimeoutError:
+                summary = ""
+            return summary
+        
+        summary = ""
+        try:
+            # 使用AI服务总结想法，先压缩想法内容以减少输入令牌
+            summary = self._get_ai_service().summarize_ideas(self._pack_ideas_for_llm(ideas))
+            if summary:
+                self._cache_summary(cache_key, summary)
+        finally:
+            with self._summary_cache_lock:
+                del self._pending_summaries[cache_key]
+            future.set_result(summary)
         
         return summary
 
+    def _pack_ideas_for_llm(self, ideas: List[Dict]) -> List[Dict]:
+        """
+        压缩发送给AI的想法列表：只保留标题和内容，去除Markdown标记，并按总预算截断内容。
+        想法过多时，按标签在本组中出现的频率保留最相关的想法。
+
+        Args:
+            ideas: 想法列表
+
+        Returns:
+            压缩后的想法列表
+        """
+        max_ideas = max(1, self.SUMMARY_CHAR_BUDGET // self.SUMMARY_MIN_IDEA_CHARS)
+        if len(ideas) > max_ideas:
+            # 以想法标签在本组中的出现次数之和作为相关度，保留相关度最高的想法，保持原有顺序
+            tag_freq = Counter(chain.from_iterable(self._tag_names(idea) for idea in ideas))
+            ranked = sorted(
+                range(len(ideas)),
+                key=lambda i: sum(tag_freq[tag] for tag in self._tag_names(ideas[i])),
+                reverse=True
+            )
+            ideas = [ideas[i] for i in sorted(ranked[:max_ideas])]
+        
+        budget = self.SUMMARY_CHAR_BUDGET // len(ideas)
+        packed = []
+        for idea in ideas:
+            content = idea.get("content") or ""
+            content = _MARKDOWN_LINK_RE.sub(r"\1", content)
+            content = _MARKDOWN_PREFIX_RE.sub("", content)
+            content = _MARKDOWN_INLINE_RE.sub("", content)
+            content = _WHITESPACE_RE.sub(" ", content).strip()
+            packed.append({
+                "title": idea.get("title") or "",
+                "content": content[:budget]
+            })
+        return packed
+
+    def _tag_names(self, idea: Dict) -> Iterator[str]:
+        """
+        逐个返回想法的标签名称，不创建中间列表。
+
+        Args:
+            idea: 想法字典，标签可能是字符串或包含name的字典
+
+        Returns:
+            标签名称迭代器
+        """
+        return (
+            tag.get("name", "") if isinstance(tag, dict) else tag
+            for tag in idea.get("tags") or ()
+        )
+
+    def _summary_cache_key(self, ideas: List[Dict]) -> str:
+        """
+        计算想法集合的缓存键，由按ID排序的想法ID、修改时间和内容生成摘要。
+
+        Args:
+            ideas: 想法列表
+
+        Returns:
+            缓存键
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for idea in sorted(ideas, key=lambda x: x.get("id") or 0):
+            digest.update(
+                f"{idea.get('id')}:{idea.get('updated_at', '')}:{idea.get('title', '')}:{idea.get('content', '')}\0"
+                .encode("utf-8")
+            )
+        return digest.hexdigest()
+
+    def _get_cached_summary(self, cache_key: str) -> Optional[str]:
+        """
+        从缓存获取总结。
+
+        Args:
+            cache_key: 缓存键
+
+        Returns:
+            总结文本，如果未命中或已过期则返回None
+        """
+        with self._summary_cache_lock:
+            entry = self._summary_cache.get(cache_key)
+            if entry is None:
+                return None
+            
+            expires_at, summary = entry
+            if expires_at < time.monotonic():
+                del self._summary_cache[cache_key]
+                return None
+            
+            self._summary_cache.move_to_end(cache_key)
+            return summary
+
+    def _cache_summary(self, cache_key: str, summary: str):
+        """
+        缓存总结，超出容量时淘汰最久未使用的条目。
+
+        Args:
+            cache_key: 缓存键
+            summary: 总结文本
+        """
+        with self._summary_cache_lock:
+            self._summary_cache[cache_key] = (time.monotonic() + self.SUMMARY_CACHE_TTL, summary)
+            self._summary_cache.move_to_end(cache_key)
+            while len(self._summary_cache) > self.SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+
     def _summarize_ideas_fallback(self, ideas: List[Dict]) -> str:
         """
         备用的想法总结方法，当AI服务不可用时使用。
@@ -186,38 +440,38 @@ class IdeasSummarizer:
         if not ideas:
             return ""
         
-        # 提取所有标签
-        all_tags = []
-        for idea in ideas:
-            tags = idea.get("tags", [])
-            all_tags.extend(tags)
-        
-        # 统计标签频率
-        tag_freq = {}
-        for tag in all_tags:
-            tag_freq[tag] = tag_freq.get(tag, 0) + 1
+        idea_count = len(ideas)
         
-        # 按频率排序
-        sorted_tags = sorted(tag_freq.items(), key=lambda x: x[1], reverse=True)
+        # 只有一个想法时，用一句话概括
+        if idea_count == 1:
+            idea = ideas[0]
+            tags = list(self._tag_names(idea))
+            topic = f"（主题：{', '.join(tags)}）" if tags else ""
+            content = idea.get('content', '')
+            if len(content) > 100:
+                content = content[:100] + "..."
+            return f"这条想法是“{idea.get('title', '')}”{topic}：{content}"
         
-        # 取前5个作为主要标签
-        main_tags = [tag for tag, _ in sorted_tags[:5]]
+        # 逐个想法累加标签频率，取前5个作为主要标签
+        tag_freq = Counter()
+        for idea in ideas:
+            tag_freq.update(self._tag_names(idea))
+        main_tags = [tag for tag, _ in tag_freq.most_common(5)]
         
         # 生成总结
-        summary = f"这组想法包含{len(ideas)}个条目，主要涉及以下主题：{', '.join(main_tags)}。"
+        parts = [f"这组想法包含{idea_count}个条目，主要涉及以下主题：{', '.join(main_tags)}。\n\n主要想法包括："]
         
-        # 添加每个想法的简短描述
-        summary += "\n\n主要想法包括："
-        for i, idea in enumerate(ideas[:5]):  # 只取前5个想法
-            title = idea.get("title", "")
-            content = idea.get("content", "")
-            summary += f"\n{i+1}. {title}: {content[:50]}..."
+        # 添加每个想法的简短描述，只取前5个想法
+        parts.extend(
+            f"{i+1}. {idea.get('title', '')}: {idea.get('content', '')[:50]}..."
+            for i, idea in enumerate(ideas[:5])
+        )
         
         # 如果想法超过5个，添加提示
-        if len(ideas) > 5:
-            summary += f"\n\n还有{len(ideas) - 5}个其他想法未列出。"
+        if idea_count > 5:
+            parts.append(f"\n还有{idea_count - 5}个其他想法未列出。")
         
-        return summary
+        return "\n".join(parts)
 
     def generate_daily_summary(self, date: str) -> str:
         """
@@ -230,7 +484,7 @@ class IdeasSummarizer:
             总结文本
         """
         # 获取指定日期的想法
-        ideas = self._idea_manager.get_ideas_by_date(date)
+        ideas = self._get_idea_manager().get_ideas_by_date(date)
         
         # 总结想法
         summary = self.summarize_ideas(ideas)
@@ -249,10 +503,10 @@ class IdeasSummarizer:
             总结文本
         """
         # 获取指定周的想法
-        ideas = self._idea_manager.get_ideas_by_time_range(start_date, end_date)
+        ideas = self._get_idea_manager().get_ideas_by_time_range(start_date, end_date)
         
-        # 总结想法
-        summary = self.summarize_ideas(ideas)
+        # 总结想法，想法较多时分段总结
+        summary = self._summarize_ideas_map_reduce(ideas)
         
         return summary
 
@@ -268,13 +522,38 @@ class IdeasSummarizer:
             总结文本
         """
         # 获取指定月份的想法
-        ideas = self._idea_manager.get_ideas_by_month(year, month)
+        ideas = self._get_idea_manager().get_ideas_by_month(year, month)
         
-        # 总结想法
-        summary = self.summarize_ideas(ideas)
+        # 总结想法，想法较多时分段总结
+        summary = self._summarize_ideas_map_reduce(ideas)
         
         return summary
 
+    def generate_period_summaries(
+        self, date: str, start_date: str, end_date: str, year: int, month: int
+    ) -> Dict[str, str]:
+        """
+        并发生成日、周、月的想法总结，总耗时取决于最慢的一个总结。
+
+        Args:
+            date: 日期，格式为YYYY-MM-DD
+            start_date: 周开始日期，格式为YYYY-MM-DD
+            end_date: 周结束日期，格式为YYYY-MM-DD
+            year: 年份
+            month: 月份
+
+        Returns:
+            总结字典，包含daily、weekly和monthly字段
+        """
+        # 数据库连接按线程隔离，各总结可在独立线程中查询和调用AI服务
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="summary-") as executor:
+            futures = {
+                "daily": executor.submit(self.generate_daily_summary, date),
+                "weekly": executor.submit(self.generate_weekly_summary, start_date, end_date),
+                "monthly": executor.submit(self.generate_monthly_summary, year, month),
+            }
+            return {period: future.result() for period, future in futures.items()}
+
     def generate_tag_summary(self, tag: str) -> str:
         """
         生成指定标签的想法总结。
@@ -286,7 +565,7 @@ class IdeasSummarizer:
             总结文本
         """
         # 获取指定标签的想法
-        ideas = self._idea_manager.get_ideas_by_tag(tag)
+        ideas = self._get_idea_manager().get_ideas_by_tag(tag)
         
         # 总结想法
         summary = self.summarize_ideas(ideas)
@@ -2,6 +2,8 @@
 定时提醒系统模块，用于管理定时提醒。
 """
 import datetime
+import heapq
+import logging
 import threading
 import time
 from typing import Callable, Dict, List, Optional, Tuple, Union
@@ -12,10 +14,21 @@ from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 from src.system_integration.notification_manager import NotificationManager
 
+logger = logging.getLogger(__name__)
+
+# 解析ISO 8601格式的提醒时间，fromisoformat由C实现，比strptime和正则解析都快
+_parse_datetime = datetime.datetime.fromisoformat
+
 
 class ReminderSystem:
     """定时提醒系统类，用于管理定时提醒。"""
 
+    # 提醒线程的最长休眠时间（秒），避免系统休眠或时钟调整后长时间错过提醒
+    MAX_SLEEP_SECONDS = 60
+
+    # 每次从数据库查询到期提醒的最大数量
+    DUE_BATCH_SIZE = 100
+
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -36,20 +49,49 @@ class ReminderSystem:
         """
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
+        self._ai_service = ai_service
+        self._idea_manager = idea_manager
         self._notification_manager = notification_manager or NotificationManager(self._config_manager, self._event_system)
         
         # 提醒线程
         self._reminder_thread = None
         self._stop_thread = False
         
+        # 待触发提醒的最小堆，元素为(提醒时间戳, 提醒ID)；
+        # 删除或修改的提醒不立即移出堆，弹出时根据_scheduled判断是否仍然有效
+        self._heap: List[Tuple[float, int]] = []
+        self._scheduled: Dict[int, float] = {}
+        self._heap_lock = threading.Lock()
+        self._wake = threading.Event()
+        
         # 注册事件处理器
         self._register_event_handlers()
         
         # 启动提醒线程
         self._start_reminder_thread()
 
+    def _get_ai_service(self) -> AIService:
+        """
+        获取AI服务实例，未传入时在首次使用时创建。
+
+        Returns:
+            AI服务实例
+        """
+        if self._ai_service is None:
+            self._ai_service = AIService(self._config_manager, self._event_system)
+        return self._ai_service
+
+    def _get_idea_manager(self) -> IdeaManager:
+        """
+        获取想法管理器实例，未传入时在首次使用时创建。
+
+        Returns:
+            想法管理器实例
+        """
+        if self._idea_manager is None:
+            self._idea_manager = IdeaManager(self._config_manager, self._event_system)
+        return self._idea_manager
+
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 添加提醒事件
@@ -64,9 +106,47 @@ class ReminderSystem:
         # 生成提醒建议事件
         self._event_system.subscribe("generate_reminder_suggestion", self._handle_generate_reminder_suggestion)
         
+        # 提醒变更事件，由想法管理器发布，用于同步待触发提醒
+        self._event_system.subscribe("reminder_added", self._handle_reminder_changed)
+        self._event_system.subscribe("reminder_updated", self._handle_reminder_changed)
+        self._event_system.subscribe("reminder_deleted", self._handle_reminder_deleted)
+        self._event_system.subscribe("reminders_deleted", self._handle_reminders_deleted)
+        
         # 应用程序退出事件
         self._event_system.subscribe("app_exit", self._handle_app_exit)
 
+    def _handle_reminder_changed(self, data):
+        """
+        处理提醒添加或更新事件。
+
+        Args:
+            data: 事件数据，包含reminder字段
+        """
+        reminder = data.get("reminder") if data else None
+        if reminder:
+            self._schedule_reminder(reminder)
+
+    def _handle_reminder_deleted(self, data):
+        """
+        处理提醒删除事件。
+
+        Args:
+            data: 事件数据，包含reminder字段
+        """
+        reminder = data.get("reminder") if data else None
+        if reminder:
+            self._unschedule_reminder(reminder["id"])
+
+    def _handle_reminders_deleted(self, data):
+        """
+        处理提醒批量删除事件。
+
+        Args:
+            data: 事件数据，包含reminder_ids字段
+        """
+        for reminder_id in (data or {}).get("reminder_ids", []):
+            self._unschedule_reminder(reminder_id)
+
     def _handle_add_reminder(self, data):
         """
         处理添加提醒事件。
@@ -159,7 +239,7 @@ class ReminderSystem:
             return
         
         # 获取想法
-        idea = self._idea_manager.get_idea(idea_id)
+        idea = self._get_idea_manager().get_idea(idea_id)
         
         # 如果想法不存在，不处理
         if not idea:
@@ -199,60 +279,134 @@ class ReminderSystem:
 
     def _stop_reminder_thread(self):
         """停止提醒线程。"""
-        # 设置停止标志
+        # 设置停止标志并唤醒线程
         self._stop_thread = True
+        self._wake.set()
         
         # 等待线程结束
         if self._reminder_thread is not None and self._reminder_thread.is_alive():
             self._reminder_thread.join(timeout=1.0)
 
     def _reminder_loop(self):
-        """提醒循环。"""
+        """提醒循环，休眠到最近的提醒时间，有提醒变更时被唤醒。"""
+        try:
+            # 加载所有未完成的提醒
+            self._load_reminders()
+        except Exception:
+            # 记录错误
+            logger.exception("加载提醒异常")
+        
         while not self._stop_thread:
+            with self._heap_lock:
+                timeout = self._heap[0][0] - time.time() if self._heap else self.MAX_SLEEP_SECONDS
+            
+            # 等待最近的提醒到期或提醒变更
+            self._wake.wait(min(max(timeout, 0), self.MAX_SLEEP_SECONDS))
+            self._wake.clear()
+            
+            if self._stop_thread:
+                break
+            
             try:
                 # 检查是否有到期的提醒
                 self._check_reminders()
-                
-                # 休眠一段时间
-                time.sleep(60)  # 每分钟检查一次
-            except Exception as e:
+            except Exception:
                 # 记录错误
-                print(f"提醒循环异常: {str(e)}")
-                
-                # 休眠一段时间
-                time.sleep(60)
+                logger.exception("提醒循环异常")
+
+    def _load_reminders(self):
+        """从数据库加载所有未完成的提醒到待触发堆。"""
+        for reminder in self._get_idea_manager().get_pending_reminders():
+            self._schedule_reminder(reminder, wake=False)
+
+    def _reminder_timestamp(self, reminder_time) -> Optional[float]:
+        """
+        将提醒时间转换为时间戳。
+
+        Args:
+            reminder_time: 提醒时间，datetime或格式为YYYY-MM-DD HH:MM:SS的字符串
+
+        Returns:
+            时间戳，如果无法解析则返回None
+        """
+        if isinstance(reminder_time, datetime.datetime):
+            return reminder_time.timestamp()
+        
+        if not reminder_time:
+            return None
+        
+        try:
+            return _parse_datetime(str(reminder_time)).timestamp()
+        except ValueError:
+            return None
+
+    def _schedule_reminder(self, reminder: Dict, wake: bool = True):
+        """
+        将提醒加入待触发堆，已完成或时间无效的提醒会被移出。
+
+        Args:
+            reminder: 提醒信息
+            wake: 是否唤醒提醒线程重新计算休眠时间
+        """
+        timestamp = None if reminder.get("is_completed") else self._reminder_timestamp(reminder.get("reminder_time"))
+        if timestamp is None:
+            self._unschedule_reminder(reminder["id"])
+            return
+        
+        with self._heap_lock:
+            self._scheduled[reminder["id"]] = timestamp
+            heapq.heappush(self._heap, (timestamp, reminder["id"]))
+        
+        if wake:
+            self._wake.set()
+
+    def _unschedule_reminder(self, reminder_id: int):
+        """
+        将提醒标记为不再触发，堆中的旧条目在弹出时丢弃。
+
+        Args:
+            reminder_id: 提醒ID
+        """
+        with self._heap_lock:
+            self._scheduled.pop(reminder_id, None)
 
     def _check_reminders(self):
-        """检查是否有到期的提醒。"""
+        """触发所有已到期的提醒。"""
         # 获取当前时间
         now = datetime.datetime.now()
+        timestamp_now = now.timestamp()
+        
+        # 弹出所有到期的提醒，跳过已删除或已修改时间的旧条目
+        has_due = False
+        with self._heap_lock:
+            while self._heap and self._heap[0][0] <= timestamp_now:
+                timestamp, reminder_id = heapq.heappop(self._heap)
+                if self._scheduled.get(reminder_id) == timestamp:
+                    del self._scheduled[reminder_id]
+                    has_due = True
+        
+        # 堆中没有到期提醒时不查询数据库
+        if not has_due:
+            return
         
-        # 获取所有提醒
-        reminders = self.get_reminders()
-        
-        # 检查每个提醒
-        for reminder in reminders:
-            # 获取提醒时间
-            remind_time_str = reminder.get("remind_time", "")
-            
-            # 如果提醒时间为空，跳过
-            if not remind_time_str:
-                continue
-            
-            try:
-                # 解析提醒时间
-                remind_time = datetime.datetime.strptime(remind_time_str, "%Y-%m-%d %H:%M:%S")
-                
-                # 如果提醒时间已到，触发提醒
-                if remind_time <= now:
+        # 以数据库中的到期提醒为准，分批触发
+        while True:
+            reminders = self._get_idea_manager().get_due_reminders(now, self.DUE_BATCH_SIZE)
+            for reminder in reminders:
+                self._unschedule_reminder(reminder["id"])
+                try:
                     # 触发提醒
                     self._trigger_reminder(reminder)
-                    
-                    # 删除提醒
-                    self.delete_reminder(reminder["id"])
-            except Exception as e:
-                # 记录错误
-                print(f"检查提醒异常: {str(e)}")
+                except Exception:
+                    # 记录错误
+                    logger.exception("检查提醒异常")
+            
+            # 一次删除本批已触发的提醒
+            deleted = self._get_idea_manager().delete_reminders([reminder["id"] for reminder in reminders])
+            
+            # 本批未满或删除失败时结束，避免重复触发同一批提醒
+            if len(reminders) < self.DUE_BATCH_SIZE or deleted == 0:
+                break
 
     def _trigger_reminder(self, reminder):
         """
@@ -269,28 +423,17 @@ class ReminderSystem:
             return
         
         # 获取想法
-        idea = self._idea_manager.get_idea(idea_id)
+        idea = self._get_idea_manager().get_idea(idea_id)
         
         # 如果想法不存在，不处理
         if not idea:
             return
         
-        # 获取提醒原因
-        remind_reason = reminder.get("remind_reason", "")
-        
-        # 构建提醒标题
-        title = f"想法提醒: {idea.get('title', '')}"
-        
-        # 构建提醒内容
-        content = f"{remind_reason}\n\n{idea.get('content', '')}"
-        
-        # 发送通知
-        self._notification_manager.send_notification(title, content)
-        
-        # 发布提醒触发事件
+        # 发布提醒触发事件，由通知管理器显示通知并播放提示音
         self._event_system.publish("reminder_triggered", {
             "reminder": reminder,
-            "idea": idea
+            "idea": idea,
+            "idea_title": idea.get("title", "")
         })
 
     def add_reminder(self, idea_id: int, remind_time: str, remind_reason: str = "") -> bool:
@@ -299,7 +442,7 @@ class ReminderSystem:
 
         Args:
             idea_id: 想法ID
-            remind_time: 提醒时间，格式为YYYY-MM-DD HH:MM:SS
+            remind_time: 提醒时间，ISO 8601格式，如YYYY-MM-DD HH:MM:SS
             remind_reason: 提醒原因
 
         Returns:
@@ -315,27 +458,23 @@ class ReminderSystem:
         
         try:
             # 解析提醒时间
-            datetime.datetime.strptime(remind_time, "%Y-%m-%d %H:%M:%S")
+            remind_datetime = _parse_datetime(remind_time)
         except ValueError:
             # 如果提醒时间格式不正确，返回False
             return False
         
-        # 添加提醒到数据库
-        reminder_id = self._idea_manager.add_reminder(idea_id, remind_time, remind_reason)
+        # 带时区的时间转换为本地时间，数据库中只保存本地时间
+        if remind_datetime.tzinfo is not None:
+            remind_datetime = remind_datetime.astimezone().replace(tzinfo=None)
         
-        # 如果添加失败，返回False
-        if reminder_id is None:
-            return False
+        # 统一转换为YYYY-MM-DD HH:MM:SS格式保存，数据库的时间类型转换和到期查询的字符串比较都依赖该格式
+        remind_time = remind_datetime.isoformat(sep=" ", timespec="seconds")
         
-        # 发布提醒添加事件
-        self._event_system.publish("reminder_added", {
-            "id": reminder_id,
-            "idea_id": idea_id,
-            "remind_time": remind_time,
-            "remind_reason": remind_reason
-        })
+        # 添加提醒到数据库，想法管理器会发布reminder_added事件，由事件处理器加入待触发堆
+        reminder = self._get_idea_manager().add_reminder(idea_id, remind_time, remind_reason)
         
-        return True
+        # 如果添加失败，返回False
+        return reminder is not None
 
     def delete_reminder(self, reminder_id: int) -> bool:
         """
@@ -351,31 +490,24 @@ class ReminderSystem:
         if reminder_id is None:
             return False
         
-        # 删除提醒
-        success = self._idea_manager.delete_reminder(reminder_id)
-        
-        # 如果删除成功，发布提醒删除事件
-        if success:
-            self._event_system.publish("reminder_deleted", {
-                "id": reminder_id
-            })
-        
-        return success
+        # 删除提醒，想法管理器会发布reminder_deleted事件，由事件处理器移出待触发堆
+        return self._get_idea_manager().delete_reminder(reminder_id)
 
     def get_reminders(self, idea_id: Optional[int] = None) -> List[Dict]:
         """
         获取提醒。
 
         Args:
-            idea_id: 想法ID，如果为None，则获取所有提醒
+            idea_id: 想法ID，如果为None，则获取所有未完成的提醒
 
         Returns:
             提醒列表
         """
         # 获取提醒
-        reminders = self._idea_manager.get_reminders(idea_id)
+        if idea_id is None:
+            return self._get_idea_manager().get_pending_reminders()
         
-        return reminders
+        return self._get_idea_manager().get_idea_reminders(idea_id)
 
     def generate_reminder_suggestion(self, content: str) -> Dict:
         """
@@ -388,6 +520,6 @@ class ReminderSystem:
             提醒建议，包含should_remind、remind_time和remind_reason字段
         """
         # 使用AI服务生成提醒建议
-        suggestion = self._ai_service.generate_reminder(content)
+        suggestion = self._get_ai_service().generate_reminder(content)
         
         return suggestion
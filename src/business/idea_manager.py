@@ -53,17 +53,8 @@ class IdeaManager:
         self._database_manager.begin_transaction()
 
         try:
-            # 插入想法
-            self._database_manager.execute(
-                """
-                INSERT INTO Ideas (content, title, created_at, updated_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                """,
-                (content, title),
-            )
-
-            # 获取新想法ID
-            idea_id = self._database_manager.get_last_row_id()
+            # 插入想法并获取新想法ID，created_at/updated_at使用列默认值CURRENT_TIMESTAMP
+            idea_id = self._database_manager.insert_returning("Ideas", ("content", "title"), (content, title))
 
             # 提交事务
             self._database_manager.commit()
@@ -179,6 +170,7 @@ class IdeaManager:
 
         try:
             # 更新想法
+            update_fields.append("updated_at = CURRENT_TIMESTAMP")
             query = f"UPDATE Ideas SET {', '.join(update_fields)} WHERE id = ?"
             params.append(idea_id)
             self._database_manager.execute(query, tuple(params))
@@ -298,6 +290,27 @@ class IdeaManager:
         
         return idea
 
+    def get_ideas_by_ids(self, idea_ids: List[int]) -> Dict[int, Dict]:
+        """
+        批量获取想法，不包含标签、关键词等关联信息。
+
+        Args:
+            idea_ids: 想法ID列表
+
+        Returns:
+            以想法ID为键的想法字典
+        """
+        ideas = {}
+        ids = list(dict.fromkeys(idea_ids))
+        chunk_size = self._database_manager.MAX_VARIABLES
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            placeholders = ", ".join(["?"] * len(chunk))
+            self._database_manager.execute(f"SELECT * FROM Ideas WHERE id IN ({placeholders})", tuple(chunk))
+            for idea in self._database_manager.fetchall():
+                ideas[idea["id"]] = idea
+        return ideas
+
     def get_ideas(
         self,
         limit: int = 100,
@@ -308,6 +321,9 @@ class IdeaManager:
         is_favorite: Optional[bool] = None,
         tag_ids: Optional[List[int]] = None,
         search_query: Optional[str] = None,
+        created_on: Optional[datetime.date] = None,
+        created_from: Optional[datetime.date] = None,
+        created_to: Optional[datetime.date] = None,
     ) -> List[Dict]:
         """
         获取想法列表。
@@ -321,6 +337,9 @@ class IdeaManager:
             is_favorite: 是否收藏
             tag_ids: 标签ID列表
             search_query: 搜索查询
+            created_on: 创建日期
+            created_from: 创建日期的起始日期（包含）
+            created_to: 创建日期的结束日期（包含）
 
         Returns:
             想法字典列表
@@ -345,17 +364,28 @@ class IdeaManager:
             params.extend(tag_ids)
 
         if search_query:
-            where_clauses.append("(content LIKE ? OR title LIKE ?)")
-            search_param = f"%{search_query}%"
-            params.append(search_param)
-            params.append(search_param)
+            search_clause, search_params = self._database_manager.get_text_search_clause(search_query)
+            where_clauses.append(search_clause)
+            params.extend(search_params)
+
+        if created_on is not None:
+            created_from = created_to = created_on
+
+        # 使用范围条件，可以利用created_at索引
+        if created_from is not None:
+            where_clauses.append("created_at >= ?")
+            params.append(created_from.isoformat())
+
+        if created_to is not None:
+            where_clauses.append("created_at < ?")
+            params.append((created_to + datetime.timedelta(days=1)).isoformat())
 
         # 添加WHERE子句
         if where_clauses:
             query += " WHERE " + " AND ".join(where_clauses)
 
         # 添加排序
-        valid_sort_fields = ["id", "created_at", "updated_at", "importance"]
+        valid_sort_fields = ["id", "title", "created_at", "updated_at", "importance"]
         valid_sort_orders = ["ASC", "DESC"]
         
         if sort_by not in valid_sort_fields:
@@ -375,27 +405,147 @@ class IdeaManager:
         self._database_manager.execute(query, tuple(params))
         ideas = self._database_manager.fetchall()
 
-        # 获取每个想法的标签、关键词、关联和提醒
+        # 批量获取所有想法的标签、关键词、关联和提醒
+        self._attach_idea_details(ideas)
+
+        return ideas
+
+    def get_ideas_by_time_range(
+        self, start_date: Union[str, datetime.date], end_date: Union[str, datetime.date]
+    ) -> List[Dict]:
+        """
+        获取创建日期在指定范围内的全部想法，按创建时间升序排列。
+
+        Args:
+            start_date: 开始日期（包含），date或格式为YYYY-MM-DD的字符串
+            end_date: 结束日期（包含），date或格式为YYYY-MM-DD的字符串
+
+        Returns:
+            想法字典列表
+        """
+        # LIMIT -1 表示不限制数量
+        return self.get_ideas(
+            limit=-1,
+            sort_by="created_at",
+            sort_order="ASC",
+            created_from=self._to_date(start_date),
+            created_to=self._to_date(end_date),
+        )
+
+    def get_ideas_by_date(self, date: Union[str, datetime.date]) -> List[Dict]:
+        """
+        获取指定日期创建的全部想法，按创建时间升序排列。
+
+        Args:
+            date: 日期，date或格式为YYYY-MM-DD的字符串
+
+        Returns:
+            想法字典列表
+        """
+        return self.get_ideas_by_time_range(date, date)
+
+    def get_ideas_by_month(self, year: int, month: int) -> List[Dict]:
+        """
+        获取指定月份创建的全部想法，按创建时间升序排列。
+
+        Args:
+            year: 年份
+            month: 月份
+
+        Returns:
+            想法字典列表
+        """
+        start_date = datetime.date(year, month, 1)
+        next_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+        return self.get_ideas_by_time_range(start_date, next_month - datetime.timedelta(days=1))
+
+    @staticmethod
+    def _to_date(value: Union[str, datetime.date]) -> datetime.date:
+        """
+        将日期参数转换为date。
+
+        Args:
+            value: date、datetime或以YYYY-MM-DD开头的字符串
+
+        Returns:
+            日期
+        """
+        if isinstance(value, datetime.datetime):
+            return value.date()
+        if isinstance(value, datetime.date):
+            return value
+        return datetime.date.fromisoformat(str(value)[:10])
+
+    def _attach_idea_details(self, ideas: List[Dict]) -> None:
+        """
+        批量获取想法的标签、关键词、关联和提醒，每类数据按批执行一次查询，不逐个想法查询。
+
+        Args:
+            ideas: 想法字典列表，结果直接写入各想法字典
+        """
+        idea_ids = [idea["id"] for idea in ideas]
+        tags = self._fetch_grouped_by_idea(
+            """
+            SELECT it.idea_id AS group_idea_id, t.* FROM Tags t
+            JOIN IdeaTags it ON t.id = it.tag_id
+            WHERE it.idea_id IN ({placeholders})
+            ORDER BY t.name
+            """,
+            idea_ids,
+        )
+        keywords = self._fetch_grouped_by_idea(
+            """
+            SELECT idea_id AS group_idea_id, * FROM Keywords
+            WHERE idea_id IN ({placeholders})
+            ORDER BY weight DESC
+            """,
+            idea_ids,
+        )
+        relations = self._fetch_grouped_by_idea(
+            """
+            SELECT r.source_idea_id AS group_idea_id, r.*, i.title as target_title FROM Relations r
+            JOIN Ideas i ON r.target_idea_id = i.id
+            WHERE r.source_idea_id IN ({placeholders})
+            ORDER BY r.confidence DESC
+            """,
+            idea_ids,
+        )
+        reminders = self._fetch_grouped_by_idea(
+            """
+            SELECT idea_id AS group_idea_id, * FROM Reminders
+            WHERE idea_id IN ({placeholders})
+            ORDER BY reminder_time
+            """,
+            idea_ids,
+        )
+
         for idea in ideas:
             idea_id = idea["id"]
-            
-            # 获取标签
-            tags = self.get_idea_tags(idea_id)
-            idea["tags"] = tags
-            
-            # 获取关键词
-            keywords = self.get_idea_keywords(idea_id)
-            idea["keywords"] = keywords
-            
-            # 获取关联
-            relations = self.get_idea_relations(idea_id)
-            idea["relations"] = relations
-            
-            # 获取提醒
-            reminders = self.get_idea_reminders(idea_id)
-            idea["reminders"] = reminders
+            idea["tags"] = tags.get(idea_id, [])
+            idea["keywords"] = keywords.get(idea_id, [])
+            idea["relations"] = relations.get(idea_id, [])
+            idea["reminders"] = reminders.get(idea_id, [])
 
-        return ideas
+    def _fetch_grouped_by_idea(self, query: str, idea_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        按想法ID分批执行查询，并按想法ID分组结果。
+
+        Args:
+            query: 查询语句，用{placeholders}表示想法ID参数，结果中的group_idea_id字段为分组的想法ID
+            idea_ids: 想法ID列表
+
+        Returns:
+            以想法ID为键的结果字典列表，各组内保持查询的排序
+        """
+        grouped: Dict[int, List[Dict]] = {}
+        chunk_size = self._database_manager.MAX_VARIABLES
+        for start in range(0, len(idea_ids), chunk_size):
+            chunk = idea_ids[start:start + chunk_size]
+            placeholders = ", ".join(["?"] * len(chunk))
+            self._database_manager.execute(query.format(placeholders=placeholders), tuple(chunk))
+            for row in self._database_manager.fetchall():
+                grouped.setdefault(row.pop("group_idea_id"), []).append(row)
+        return grouped
 
     def search_ideas(self, query: str, limit: int = 10) -> List[Dict]:
         """
@@ -576,6 +726,18 @@ class IdeaManager:
         )
         return self._database_manager.fetchall()
 
+    def get_pending_reminders(self) -> List[Dict]:
+        """
+        获取所有未完成的提醒。
+
+        Returns:
+            提醒字典列表
+        """
+        self._database_manager.execute(
+            "SELECT * FROM Reminders WHERE is_completed = 0 ORDER BY reminder_time"
+        )
+        return self._database_manager.fetchall()
+
     def add_reminder(self, idea_id: int, reminder_time: datetime.datetime, note: Optional[str] = None) -> Optional[Dict]:
         """
         添加提醒。
@@ -590,14 +752,9 @@ class IdeaManager:
         """
         try:
             # 添加提醒
-            self._database_manager.execute(
-                """
-                INSERT INTO Reminders (idea_id, reminder_time, note, created_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                """,
-                (idea_id, reminder_time, note),
+            reminder_id = self._database_manager.insert_returning(
+                "Reminders", ("idea_id", "reminder_time", "note"), (idea_id, reminder_time, note)
             )
-            reminder_id = self._database_manager.get_last_row_id()
             self._database_manager.commit()
 
             # 获取添加的提醒
@@ -711,20 +868,57 @@ class IdeaManager:
             print(f"删除提醒失败: {e}")
             return False
 
-    def get_due_reminders(self) -> List[Dict]:
+    def delete_reminders(self, reminder_ids: List[int]) -> int:
+        """
+        批量删除提醒，在一个事务中完成。
+
+        Args:
+            reminder_ids: 提醒ID列表
+
+        Returns:
+            删除的提醒数量
+        """
+        if not reminder_ids:
+            return 0
+
+        try:
+            # 删除提醒
+            placeholders = ", ".join(["?"] * len(reminder_ids))
+            cursor = self._database_manager.execute(
+                f"DELETE FROM Reminders WHERE id IN ({placeholders})", tuple(reminder_ids)
+            )
+            self._database_manager.commit()
+
+            # 发布批量删除事件
+            self._event_system.publish("reminders_deleted", {"reminder_ids": list(reminder_ids)})
+
+            return cursor.rowcount
+        except Exception as e:
+            print(f"批量删除提醒失败: {e}")
+            return 0
+
+    def get_due_reminders(self, now: Optional[datetime.datetime] = None, limit: int = 100) -> List[Dict]:
         """
         获取到期提醒。
 
+        Args:
+            now: 当前时间（本地时间），为None时使用datetime.now()
+            limit: 返回数量限制
+
         Returns:
             到期提醒字典列表
         """
+        # 提醒时间以本地时间保存，不能与UTC的CURRENT_TIMESTAMP比较
+        now = now or datetime.datetime.now()
         self._database_manager.execute(
             """
             SELECT r.*, i.title as idea_title FROM Reminders r
             JOIN Ideas i ON r.idea_id = i.id
-            WHERE r.reminder_time <= CURRENT_TIMESTAMP AND r.is_completed = 0
+            WHERE r.reminder_time <= ? AND r.is_completed = 0
             ORDER BY r.reminder_time
-            """
+            LIMIT ?
+            """,
+            (now.isoformat(sep=" "), limit),
         )
         return self._database_manager.fetchall()
 
@@ -31,11 +31,13 @@ class ScheduleManager:
         Returns:
             ScheduleManager实例
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(ScheduleManager, cls).__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+        # 双重检查锁定：实例已存在时无需加锁
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(ScheduleManager, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
 
     def __init__(self, config_manager: Optional[ConfigManager] = None, event_system: Optional[EventSystem] = None, database_manager: Optional[DatabaseManager] = None):
         """
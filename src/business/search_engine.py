@@ -89,11 +89,11 @@ class SearchEngine:
             想法字典列表
         """
         # 构建查询
-        sql_query = """
+        search_clause, params = self._database_manager.get_text_search_clause(query, alias="i.")
+        sql_query = f"""
             SELECT i.* FROM Ideas i
-            WHERE (i.content LIKE ? OR i.title LIKE ?)
+            WHERE {search_clause}
         """
-        params = [f"%{query}%", f"%{query}%"]
 
         # 添加过滤条件
         if "is_archived" in filters:
@@ -48,14 +48,7 @@ class TagManager:
                 return existing_tag
 
             # 插入标签
-            self._database_manager.execute(
-                """
-                INSERT INTO Tags (name, color, created_at)
-                VALUES (?, ?, CURRENT_TIMESTAMP)
-                """,
-                (name, color),
-            )
-            tag_id = self._database_manager.get_last_row_id()
+            tag_id = self._database_manager.insert_returning("Tags", ("name", "color"), (name, color))
             self._database_manager.commit()
 
             # 获取新创建的标签
@@ -188,6 +181,35 @@ class TagManager:
         self._database_manager.execute("SELECT * FROM Tags ORDER BY name")
         return self._database_manager.fetchall()
 
+    def get_tags_for_ideas(self, idea_ids: List[int]) -> Dict[int, List[Dict]]:
+        """
+        批量获取多个想法的标签。
+
+        Args:
+            idea_ids: 想法ID列表
+
+        Returns:
+            以想法ID为键的标签字典列表，没有标签的想法不包含在内
+        """
+        tags: Dict[int, List[Dict]] = {}
+        ids = list(dict.fromkeys(idea_ids))
+        chunk_size = self._database_manager.MAX_VARIABLES
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            placeholders = ", ".join(["?"] * len(chunk))
+            self._database_manager.execute(
+                f"""
+                SELECT it.idea_id, t.* FROM Tags t
+                JOIN IdeaTags it ON t.id = it.tag_id
+                WHERE it.idea_id IN ({placeholders})
+                ORDER BY t.name
+                """,
+                tuple(chunk),
+            )
+            for tag in self._database_manager.fetchall():
+                tags.setdefault(tag.pop("idea_id"), []).append(tag)
+        return tags
+
     def get_tags_with_idea_count(self) -> List[Dict]:
         """
         获取所有标签及其关联的想法数量。
@@ -191,8 +191,8 @@ class AppManager:
         """
         if self._ai_manager is None:
             # 延迟导入，避免循环依赖
-            from ..ai.ai_manager import AIManager
-            self._ai_manager = AIManager(self._config_manager, self._event_system, self._database_manager, self._vector_db_manager)
+            from ..ai.ai_manager import get_ai_manager
+            self._ai_manager = get_ai_manager(self._config_manager, self._event_system, self._database_manager, self._vector_db_manager)
         return self._ai_manager
 
     def initialize(self):
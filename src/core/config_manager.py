@@ -187,6 +187,17 @@ class ConfigManager:
         self.config[section] = values
         self._save_config()
 
+    def update_section(self, section: str, values: Dict[str, Any]) -> None:
+        """
+        更新配置节中的多个配置项，只写入一次配置文件。
+
+        Args:
+            section: 配置节
+            values: 要更新的配置值字典
+        """
+        self.config.setdefault(section, {}).update(values)
+        self._save_config()
+
     def reset_to_default(self) -> None:
         """重置配置为默认值。"""
         self.config = self._get_default_config()
@@ -21,9 +21,8 @@ class EventSystem:
             event_type: 事件类型
             callback: 回调函数
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        self._subscribers[event_type].append(callback)
+        # 写时复制：替换为新列表，发布事件时遍历的旧列表不受影响
+        self._subscribers[event_type] = self._subscribers.get(event_type, []) + [callback]
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         """
@@ -34,8 +33,12 @@ class EventSystem:
             callback: 回调函数
         """
         if event_type in self._subscribers and callback in self._subscribers[event_type]:
-            self._subscribers[event_type].remove(callback)
-            if not self._subscribers[event_type]:
+            # 写时复制：替换为新列表，发布事件时遍历的旧列表不受影响
+            subscribers = list(self._subscribers[event_type])
+            subscribers.remove(callback)
+            if subscribers:
+                self._subscribers[event_type] = subscribers
+            else:
                 del self._subscribers[event_type]
 
     def publish(self, event_type: str, data: Any = None) -> None:
@@ -53,13 +56,12 @@ class EventSystem:
             oldest_event = next(iter(self._event_history))
             del self._event_history[oldest_event]
 
-        # 通知订阅者
-        if event_type in self._subscribers:
-            for callback in self._subscribers[event_type]:
-                try:
-                    callback(data)
-                except Exception as e:
-                    print(f"事件处理错误: {e}")
+        # 通知订阅者，遍历订阅列表快照，无需加锁
+        for callback in self._subscribers.get(event_type, ()):
+            try:
+                callback(data)
+            except Exception as e:
+                print(f"事件处理错误: {e}")
 
     def get_last_event_data(self, event_type: str) -> Any:
         """
@@ -2,12 +2,16 @@
 数据库管理器模块，负责管理SQLite数据库连接和操作。
 """
 import os
+import shutil
 import sqlite3
 import threading
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from src.core.config_manager import ConfigManager
 
+# 打包时预先生成的空数据库模板，首次运行时直接复制以省去建表开销
+TEMPLATE_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ideas_template.db")
+
 
 class DatabaseManager:
     """数据库管理器类，负责管理SQLite数据库连接和操作。"""
@@ -15,6 +19,12 @@ class DatabaseManager:
     _instance = None
     _lock = threading.Lock()
 
+    # 数据库结构版本，修改表结构时递增
+    SCHEMA_VERSION = 2
+
+    # 单条语句中参数数量的上限，低于旧版SQLite的SQLITE_MAX_VARIABLE_NUMBER（999）
+    MAX_VARIABLES = 900
+
     def __new__(cls, config_manager: Optional[ConfigManager] = None):
         """
         实现单例模式。
@@ -25,11 +35,13 @@ class DatabaseManager:
         Returns:
             DatabaseManager实例
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(DatabaseManager, cls).__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+        # 双重检查锁定：实例已存在时无需加锁
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(DatabaseManager, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
 
     def __init__(self, config_manager: Optional[ConfigManager] = None):
         """
@@ -38,21 +50,50 @@ class DatabaseManager:
         Args:
             config_manager: 配置管理器实例
         """
-        if self._initialized:
-            return
-
-        self._config_manager = config_manager or ConfigManager()
-        self._db_path = self._config_manager.get_sqlite_path()
-        self._connection = None
-        self._cursor = None
-        self._local = threading.local()
-        self._initialized = True
+        # 加锁以保证后台预热线程与主线程不会并发初始化
+        with self._lock:
+            if self._initialized:
+                return
+
+            self._config_manager = config_manager or ConfigManager()
+            self._db_path = self._config_manager.get_sqlite_path()
+            self._connection = None
+            self._cursor = None
+            self._local = threading.local()
+            self._fts_enabled = False
+
+            # 确保数据库目录存在
+            os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+
+            # 首次运行时复制预生成的空数据库
+            if not os.path.exists(self._db_path) and os.path.exists(TEMPLATE_DB_PATH):
+                shutil.copy2(TEMPLATE_DB_PATH, self._db_path)
+
+            # 仅在结构版本不一致时初始化数据库
+            if self._get_schema_version() != self.SCHEMA_VERSION:
+                self._init_database()
+            else:
+                self._fts_enabled = self.table_exists("ideas_fts")
+            self._initialized = True
+
+    @classmethod
+    def create_template(cls, template_path: str = TEMPLATE_DB_PATH) -> None:
+        """
+        生成随应用分发的空数据库模板，在打包时调用。
 
-        # 确保数据库目录存在
-        os.makedirs(os.path.dirname(self._db_path), exist_ok=True)
+        Args:
+            template_path: 模板文件路径
+        """
+        if os.path.exists(template_path):
+            os.remove(template_path)
 
-        # 初始化数据库
-        self._init_database()
+        # 绕过单例，使用独立实例在模板路径上建表
+        builder = super(DatabaseManager, cls).__new__(cls)
+        builder._db_path = template_path
+        builder._local = threading.local()
+        builder._fts_enabled = False
+        builder._init_database()
+        builder.close()
 
     def _get_connection(self) -> sqlite3.Connection:
         """
@@ -67,6 +108,12 @@ class DatabaseManager:
                 detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES
             )
             self._local.connection.row_factory = sqlite3.Row
+            # 启用增量空间回收，须先于其他写入设置，已有数据库在下次VACUUM后生效
+            self._local.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # 启用WAL日志模式，读写互不阻塞
+            self._local.connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection.execute("PRAGMA cache_size=-8000")
         return self._local.connection
 
     def _get_cursor(self) -> sqlite3.Cursor:
@@ -185,6 +232,7 @@ class DatabaseManager:
         # 创建索引
         self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_created_at ON Ideas(created_at)")
         self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_updated_at ON Ideas(updated_at)")
+        self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_title ON Ideas(title)")
         self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_is_archived ON Ideas(is_archived)")
         self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_is_favorite ON Ideas(is_favorite)")
         self.execute("CREATE INDEX IF NOT EXISTS idx_ideas_ai_processed ON Ideas(ai_processed)")
@@ -197,27 +245,93 @@ class DatabaseManager:
         self.execute("CREATE INDEX IF NOT EXISTS idx_reminders_reminder_time ON Reminders(reminder_time)")
         self.execute("CREATE INDEX IF NOT EXISTS idx_reminders_is_completed ON Reminders(is_completed)")
 
-        # 创建触发器
+        # 移除旧版本的时间戳触发器，updated_at 由应用层的UPDATE语句负责设置
+        self.execute("DROP TRIGGER IF EXISTS update_ideas_timestamp")
+        self.execute("DROP TRIGGER IF EXISTS update_settings_timestamp")
+
+        # 创建全文索引
+        self._init_fts()
+
+        # 记录结构版本
+        self.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+        # 提交更改
+        self.commit()
+
+    def _get_schema_version(self) -> int:
+        """
+        获取数据库文件中记录的结构版本。
+
+        Returns:
+            结构版本号
+        """
+        return self.execute("PRAGMA user_version").fetchone()[0]
+
+    def _init_fts(self) -> None:
+        """创建Ideas表的FTS5全文索引及同步触发器，SQLite不支持FTS5时回退到LIKE查询。"""
+        fts_exists = self.table_exists("ideas_fts")
+        try:
+            # 使用trigram分词器，支持中文等无空格文本的子串匹配
+            self.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS ideas_fts USING fts5(
+                    title, content, content='Ideas', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            print(f"FTS5全文索引不可用: {e}")
+            return
+
         self.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_ideas_timestamp 
-            AFTER UPDATE ON Ideas
-            FOR EACH ROW
+            CREATE TRIGGER IF NOT EXISTS ideas_fts_insert
+            AFTER INSERT ON Ideas
             BEGIN
-                UPDATE Ideas SET updated_at = CURRENT_TIMESTAMP WHERE id = OLD.id;
+                INSERT INTO ideas_fts(rowid, title, content) VALUES (NEW.id, NEW.title, NEW.content);
             END
         """)
 
         self.execute("""
-            CREATE TRIGGER IF NOT EXISTS update_settings_timestamp 
-            AFTER UPDATE ON Settings
-            FOR EACH ROW
+            CREATE TRIGGER IF NOT EXISTS ideas_fts_delete
+            AFTER DELETE ON Ideas
             BEGIN
-                UPDATE Settings SET updated_at = CURRENT_TIMESTAMP WHERE key = OLD.key;
+                INSERT INTO ideas_fts(ideas_fts, rowid, title, content) VALUES ('delete', OLD.id, OLD.title, OLD.content);
             END
         """)
 
-        # 提交更改
-        self.commit()
+        self.execute("""
+            CREATE TRIGGER IF NOT EXISTS ideas_fts_update
+            AFTER UPDATE OF title, content ON Ideas
+            BEGIN
+                INSERT INTO ideas_fts(ideas_fts, rowid, title, content) VALUES ('delete', OLD.id, OLD.title, OLD.content);
+                INSERT INTO ideas_fts(rowid, title, content) VALUES (NEW.id, NEW.title, NEW.content);
+            END
+        """)
+
+        # 新建索引时为已有数据建立索引
+        if not fts_exists:
+            self.execute("INSERT INTO ideas_fts(ideas_fts) VALUES ('rebuild')")
+
+        self._fts_enabled = True
+
+    def get_text_search_clause(self, search_query: str, alias: str = "") -> Tuple[str, List[str]]:
+        """
+        构建想法标题和内容的文本搜索条件。
+
+        查询长度不少于3个字符且FTS5可用时使用全文索引，否则使用LIKE子串匹配。
+
+        Args:
+            search_query: 搜索查询
+            alias: Ideas表别名，如"i."
+
+        Returns:
+            (WHERE子句, 查询参数列表)
+        """
+        if self._fts_enabled and len(search_query) >= 3:
+            # 作为短语整体匹配，避免查询中的FTS语法字符被解析
+            phrase = '"' + search_query.replace('"', '""') + '"'
+            return f"{alias}id IN (SELECT rowid FROM ideas_fts WHERE ideas_fts MATCH ?)", [phrase]
+
+        search_param = f"%{search_query}%"
+        return f"({alias}content LIKE ? OR {alias}title LIKE ?)", [search_param, search_param]
 
     def execute(self, query: str, params: Union[Tuple, Dict, None] = None) -> sqlite3.Cursor:
         """
@@ -237,13 +351,13 @@ class DatabaseManager:
             cursor.execute(query)
         return cursor
 
-    def executemany(self, query: str, params_list: List[Union[Tuple, Dict]]) -> sqlite3.Cursor:
+    def executemany(self, query: str, params_list: Iterable[Union[Tuple, Dict]]) -> sqlite3.Cursor:
         """
         执行多个SQL查询。
 
         Args:
             query: SQL查询语句
-            params_list: 查询参数列表
+            params_list: 查询参数序列，可以是生成器，参数会被逐行读取而无需先构建列表
 
         Returns:
             数据库游标
@@ -319,6 +433,43 @@ class DatabaseManager:
         """
         return self._get_cursor().lastrowid
 
+    def insert_returning(
+        self,
+        table: str,
+        columns: Iterable[str],
+        values: Union[Tuple, List],
+        returning: str = "id"
+    ) -> Any:
+        """
+        插入一条记录并返回指定列的值。
+
+        SQLite 3.35及以上版本使用 INSERT ... RETURNING 在同一条语句中取回结果，
+        低版本回退为插入后读取 lastrowid。
+
+        Args:
+            table: 表名
+            columns: 列名
+            values: 列值
+            returning: 返回的列名
+
+        Returns:
+            插入记录的指定列值
+        """
+        columns = list(columns)
+        placeholders = ", ".join(["?"] * len(columns))
+        query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+        if sqlite3.sqlite_version_info >= (3, 35):
+            # 取完全部结果，确保语句执行结束
+            rows = self.execute(f"{query} RETURNING {returning}", tuple(values)).fetchall()
+            return rows[0][0]
+
+        cursor = self.execute(query, tuple(values))
+        if returning == "id":
+            return cursor.lastrowid
+        row = self.execute(f"SELECT {returning} FROM {table} WHERE rowid = ?", (cursor.lastrowid,)).fetchone()
+        return row[0] if row else None
+
     def table_exists(self, table_name: str) -> bool:
         """
         检查表是否存在。
@@ -353,7 +504,6 @@ class DatabaseManager:
         Returns:
             备份文件路径
         """
-        import shutil
         import datetime
 
         if backup_path is None:
@@ -362,14 +512,13 @@ class DatabaseManager:
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = os.path.join(backup_dir, f"ideas_backup_{timestamp}.db")
 
-        # 关闭当前连接
-        self.close()
-
-        # 复制数据库文件
-        shutil.copy2(self._db_path, backup_path)
-
-        # 重新连接数据库
-        self._get_connection()
+        # 提交当前事务后通过SQLite备份接口复制，WAL模式下尚未写回主文件的数据也会包含在备份中
+        self.commit()
+        target = sqlite3.connect(backup_path)
+        try:
+            self._get_connection().backup(target)
+        finally:
+            target.close()
 
         return backup_path
 
@@ -383,22 +532,46 @@ class DatabaseManager:
         Returns:
             是否成功
         """
-        import shutil
-
         if not os.path.exists(backup_path):
             return False
 
-        # 关闭当前连接
-        self.close()
-
-        # 复制备份文件到数据库文件
-        shutil.copy2(backup_path, self._db_path)
+        # 校验备份文件，避免用损坏的文件覆盖当前数据库
+        if not self._verify_database_file(backup_path):
+            return False
 
-        # 重新连接数据库
-        self._get_connection()
+        # 通过SQLite备份接口写入当前数据库，不直接覆盖文件，避免与残留的-wal/-shm文件不一致，
+        # 其他线程的连接也能读到恢复后的数据
+        self.commit()
+        source = sqlite3.connect(backup_path)
+        try:
+            source.backup(self._get_connection())
+        finally:
+            source.close()
 
         return True
 
+    def _verify_database_file(self, db_path: str) -> bool:
+        """
+        使用 PRAGMA quick_check 校验数据库文件是否完整可读。
+
+        Args:
+            db_path: 数据库文件路径
+
+        Returns:
+            是否通过校验
+        """
+        try:
+            connection = sqlite3.connect(db_path)
+            try:
+                result = connection.execute("PRAGMA quick_check").fetchone()
+            finally:
+                connection.close()
+        except sqlite3.DatabaseError as e:
+            print(f"备份文件校验失败: {e}")
+            return False
+
+        return result is not None and result[0] == "ok"
+
     def get_db_path(self) -> str:
         """
         获取数据库路径。
@@ -419,5 +592,25 @@ class DatabaseManager:
 
     def vacuum(self) -> None:
         """压缩数据库。"""
-        self.execute("VACUUM")
         self.commit()
+        connection = self._get_connection()
+
+        # VACUUM期间关闭同步，完成后恢复原设置；VACUUM自行获取所需的锁，
+        # 不设置独占锁模式，否则其他线程持有连接时会失败，且完成后锁不会立即释放
+        synchronous = connection.execute("PRAGMA synchronous").fetchone()[0]
+        connection.execute("PRAGMA synchronous = OFF")
+        try:
+            connection.execute("VACUUM")
+        finally:
+            connection.execute(f"PRAGMA synchronous = {synchronous}")
+
+    def incremental_vacuum(self, pages: int = 1000) -> None:
+        """
+        增量回收空闲页，适合在日常运行中调用。
+
+        Args:
+            pages: 最多回收的页数
+        """
+        # executescript会将语句执行到底，普通execute每次只回收一页
+        self.commit()
+        self._get_connection().executescript(f"PRAGMA incremental_vacuum({int(pages)})")
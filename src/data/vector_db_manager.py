@@ -45,6 +45,7 @@ class VectorDBManager:
         self._db_path = self._config_manager.get_vector_db_path()
         self._client = None
         self._embedding_function = None
+        self._cached_size, self._cached_mtime = 0, 0
         self._initialized = True
 
         # 确保数据库目录存在
@@ -433,14 +434,40 @@ class VectorDBManager:
         """
         获取数据库大小。
 
+        结果按数据库根目录的修改时间缓存，目录未变化时直接返回缓存值。
+
         Returns:
             数据库大小（字节）
         """
+        try:
+            mtime = os.stat(self._db_path).st_mtime
+        except OSError:
+            return 0
+
+        if mtime == self._cached_mtime:
+            return self._cached_size
+
+        self._cached_size = self._scan_dir_size(self._db_path)
+        self._cached_mtime = mtime
+        return self._cached_size
+
+    def _scan_dir_size(self, path: str) -> int:
+        """
+        递归统计目录大小。
+
+        Args:
+            path: 目录路径
+
+        Returns:
+            目录大小（字节）
+        """
         total_size = 0
-        for dirpath, dirnames, filenames in os.walk(self._db_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                total_size += os.path.getsize(filepath)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total_size += self._scan_dir_size(entry.path)
+                else:
+                    total_size += entry.stat(follow_symlinks=False).st_size
         return total_size
 
     def update_embedding_function(self) -> None:
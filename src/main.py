@@ -4,7 +4,11 @@ ideaSystemXS 知识库系统 - 主程序入口
 
 import sys
 import os
+import atexit
 import logging
+import logging.handlers
+import queue
+import threading
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt, QCoreApplication
 
@@ -19,6 +23,7 @@ sys.path.append(parent_dir)
 from src.core.app_manager import AppManager
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
+from src.data.database_manager import DatabaseManager
 
 # 设置日志
 def setup_logging():
@@ -28,23 +33,46 @@ def setup_logging():
     
     log_file = os.path.join(log_dir, "app.log")
     
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(formatter)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    # 日志先放入队列，由单独的监听线程写入文件和控制台，记录日志的线程不等待I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
+        format='%(message)s',
+        handlers=[logging.handlers.QueueHandler(log_queue)]
     )
     
     return logging.getLogger("ideaSystemXS")
 
+def warm_up_database(config_manager):
+    """在后台线程中预先打开数据库，完成建表和WAL设置"""
+    try:
+        DatabaseManager(config_manager)._get_connection()
+    except Exception as e:
+        logging.getLogger("ideaSystemXS").warning(f"数据库预热失败: {e}")
+
 def main():
     """主程序入口"""
     # 设置日志
     logger = setup_logging()
     logger.info("启动 ideaSystemXS...")
     
+    # 创建配置管理器
+    logger.info("初始化配置管理器...")
+    config_manager = ConfigManager()
+    
+    # 数据库打开与Qt初始化并行进行
+    threading.Thread(target=warm_up_database, args=(config_manager,), daemon=True).start()
+    
     # 设置高DPI支持
     #QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
     #QCoreApplication.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
@@ -58,10 +86,6 @@ def main():
     logger.info("初始化事件系统...")
     event_system = EventSystem()
     
-    # 创建配置管理器
-    logger.info("初始化配置管理器...")
-    config_manager = ConfigManager()
-    
     # 创建应用管理器
     logger.info("初始化应用管理器...")
     app_manager = AppManager(config_manager, event_system)
@@ -1,14 +1,18 @@
 """
 快捷键管理器模块，负责管理全局快捷键。
 """
+import logging
 import threading
-from typing import Callable, Dict, Optional
+from itertools import product
+from typing import Callable, Dict, FrozenSet, Optional, Set
 
 import keyboard
 
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 
+logger = logging.getLogger(__name__)
+
 
 class HotkeyManager:
     """快捷键管理器类，负责管理全局快捷键。"""
@@ -27,11 +31,13 @@ class HotkeyManager:
         Returns:
             HotkeyManager实例
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super(HotkeyManager, cls).__new__(cls)
-                cls._instance._initialized = False
-            return cls._instance
+        # 双重检查锁定：实例已存在时无需加锁
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(HotkeyManager, cls).__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
 
     def __init__(self, config_manager: Optional[ConfigManager] = None, event_system: Optional[EventSystem] = None):
         """
@@ -47,6 +53,15 @@ class HotkeyManager:
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
         self._hotkeys: Dict[str, Callable] = {}
+        
+        # 所有单步快捷键共用一个键盘钩子，按下的扫描码集合与组合键表匹配
+        self._chord_table: Dict[FrozenSet[int], Callable] = {}
+        self._pressed: Set[int] = set()
+        self._hook = None
+        
+        # 多步快捷键（如"ctrl+a, b"）无法用组合键表表示，仍由keyboard单独注册
+        self._step_hotkeys: Set[str] = set()
+        
         self._initialized = True
 
         # 注册事件处理器
@@ -76,13 +91,68 @@ class HotkeyManager:
             是否成功注册
         """
         try:
-            keyboard.add_hotkey(hotkey, callback, suppress=True)
+            # 解析快捷键，无效的快捷键会抛出异常
+            steps = keyboard.parse_hotkey(hotkey)
+            if len(steps) > 1:
+                keyboard.add_hotkey(hotkey, callback, suppress=True)
+                self._step_hotkeys.add(hotkey)
+            
             self._hotkeys[hotkey] = callback
+            self._rebuild_chord_table()
             return True
-        except Exception as e:
-            print(f"注册快捷键失败: {e}")
+        except Exception:
+            logger.exception("注册快捷键失败")
             return False
 
+    def _rebuild_chord_table(self) -> None:
+        """根据已注册的快捷键重建组合键表，并按需安装或移除键盘钩子。"""
+        chord_table = {}
+        for hotkey, callback in self._hotkeys.items():
+            if hotkey in self._step_hotkeys:
+                continue
+            
+            # 同一个键可能对应多个扫描码（如左右Ctrl），为每种组合建立一项
+            for scan_codes in product(*keyboard.parse_hotkey(hotkey)[0]):
+                chord_table[frozenset(scan_codes)] = callback
+        
+        # 整体替换，钩子线程读取时不会看到不完整的表
+        self._chord_table = chord_table
+        
+        if chord_table and self._hook is None:
+            self._hook = keyboard.hook(self._dispatch, suppress=True)
+        elif not chord_table and self._hook is not None:
+            keyboard.unhook(self._hook)
+            self._hook = None
+            self._pressed.clear()
+
+    def _dispatch(self, event) -> bool:
+        """
+        处理键盘钩子事件，按下的键与已注册的组合键匹配时触发回调。
+
+        Args:
+            event: 键盘事件
+
+        Returns:
+            是否放行该按键，匹配快捷键时返回False以拦截
+        """
+        scan_code = event.scan_code
+        if event.event_type == keyboard.KEY_UP:
+            self._pressed.discard(scan_code)
+            return True
+        
+        # 按住不放产生的重复按下事件不再触发
+        if scan_code in self._pressed:
+            return True
+        
+        self._pressed.add(scan_code)
+        callback = self._chord_table.get(frozenset(self._pressed))
+        if callback is None:
+            return True
+        
+        # 在其他线程中执行回调，避免阻塞键盘钩子
+        keyboard.call_later(callback, delay=0)
+        return False
+
     def unregister_hotkey(self, hotkey: str) -> bool:
         """
         取消注册快捷键。
@@ -94,12 +164,17 @@ class HotkeyManager:
             是否成功取消注册
         """
         try:
-            keyboard.remove_hotkey(hotkey)
-            if hotkey in self._hotkeys:
-                del self._hotkeys[hotkey]
+            if hotkey in self._step_hotkeys:
+                keyboard.remove_hotkey(hotkey)
+                self._step_hotkeys.discard(hotkey)
+            elif hotkey not in self._hotkeys:
+                raise KeyError(hotkey)
+            
+            self._hotkeys.pop(hotkey, None)
+            self._rebuild_chord_table()
             return True
-        except Exception as e:
-            print(f"取消注册快捷键失败: {e}")
+        except Exception:
+            logger.exception("取消注册快捷键失败")
             return False
 
     def unregister_all_hotkeys(self) -> None:
@@ -1,7 +1,9 @@
 """
 通知管理器模块，负责管理系统通知。
 """
+import logging
 import os
+import subprocess
 from typing import Optional
 
 from PyQt6.QtWidgets import QSystemTrayIcon
@@ -9,10 +11,15 @@ from PyQt6.QtWidgets import QSystemTrayIcon
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 
+logger = logging.getLogger(__name__)
+
 
 class NotificationManager:
     """通知管理器类，负责管理系统通知。"""
 
+    # 非Windows系统上正在播放提示音的进程，所有实例共用，避免同一事件重复播放
+    _sound_process: Optional[subprocess.Popen] = None
+
     def __init__(self, config_manager: Optional[ConfigManager] = None, event_system: Optional[EventSystem] = None):
         """
         初始化通知管理器。
@@ -25,7 +32,11 @@ class NotificationManager:
         self._event_system = event_system or EventSystem()
         self._system_tray = None
         
+        # 缓存是否播放提醒声音，配置变更时刷新
+        self._sound_enabled = bool(self._config_manager.get("reminders", "notification_sound", True))
+        
         # 注册事件处理器
+        self._event_system.subscribe("config_changed", self._handle_config_changed)
         self._event_system.subscribe("reminder_triggered", self._handle_reminder_triggered)
         self._event_system.subscribe("idea_processed", self._handle_idea_processed)
         self._event_system.subscribe("ai_task_completed", self._handle_ai_task_completed)
@@ -40,6 +51,16 @@ class NotificationManager:
         """
         self._system_tray = system_tray
 
+    def _handle_config_changed(self, data=None) -> None:
+        """
+        处理配置变更事件。
+
+        Args:
+            data: 事件数据
+        """
+        if data and "reminders" in data:
+            self._sound_enabled = bool(self._config_manager.get("reminders", "notification_sound", True))
+
     def _handle_reminder_triggered(self, data) -> None:
         """
         处理提醒触发事件。
@@ -59,7 +80,7 @@ class NotificationManager:
         self.show_notification(title, message)
         
         # 如果启用了提醒声音，播放声音
-        if self._config_manager.get("reminders", "notification_sound", True):
+        if self._sound_enabled:
             self._play_notification_sound()
 
     def _handle_idea_processed(self, data) -> None:
@@ -130,13 +151,22 @@ class NotificationManager:
             self._system_tray.show_message(title, message, icon, timeout)
 
     def _play_notification_sound(self) -> None:
-        """播放通知声音。"""
+        """播放通知声音，不阻塞调用线程，连续触发时只播放一次。"""
         try:
             # 使用系统声音
             if os.name == "nt":  # Windows
                 import winsound
-                winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS)
+                # 异步播放立即返回，新的播放会替换正在播放的声音
+                winsound.PlaySound("SystemAsterisk", winsound.SND_ALIAS | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
             else:  # Linux/Mac
-                os.system("aplay /usr/share/sounds/sound-icons/glass-water-1.wav &>/dev/null &")
-        except Exception as e:
-            print(f"播放通知声音失败: {e}")
+                # 上一次的声音仍在播放时不再重复播放
+                process = NotificationManager._sound_process
+                if process is not None and process.poll() is None:
+                    return
+                NotificationManager._sound_process = subprocess.Popen(
+                    ["aplay", "-q", "/usr/share/sounds/sound-icons/glass-water-1.wav"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL
+                )
+        except Exception:
+            logger.exception("播放通知声音失败")
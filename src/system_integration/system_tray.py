@@ -1,7 +1,7 @@
 """
 系统托盘模块，负责管理系统托盘图标和菜单。
 """
-from typing import Optional
+from typing import Dict, Optional
 
 from PyQt6.QtGui import QIcon, QAction
 from PyQt6.QtWidgets import QSystemTrayIcon, QMenu
@@ -13,6 +13,19 @@ from src.core.event_system import EventSystem
 class SystemTray:
     """系统托盘类，负责管理系统托盘图标和菜单。"""
 
+    # 已加载的托盘图标，按图标名称缓存，切换主题时不重复解码资源
+    _icon_cache: Dict[str, QIcon] = {}
+
+    # 托盘菜单项：(文本, 处理方法名)，None表示分隔线
+    _MENU_ITEMS = (
+        ("新建想法", "_handle_new_idea"),
+        ("打开主窗口", "_handle_open_main"),
+        None,
+        ("设置", "_handle_settings"),
+        None,
+        ("退出", "_handle_exit"),
+    )
+
     def __init__(self, config_manager: Optional[ConfigManager] = None, event_system: Optional[EventSystem] = None):
         """
         初始化系统托盘。
@@ -25,6 +38,7 @@ class SystemTray:
         self._event_system = event_system or EventSystem()
         self._tray_icon = None
         self._tray_menu = None
+        self._menu_actions = []
         #self._tray_icon = QSystemTrayIcon(self)
         #self._tray_icon.setIcon(QIcon("./icon.png"))
         
@@ -55,42 +69,31 @@ class SystemTray:
 
     def _add_menu_items(self) -> None:
         """添加托盘菜单项。"""
-        # 新建想法
-        new_idea_action = QAction("新建想法", self._tray_menu)
-        new_idea_action.triggered.connect(self._handle_new_idea)
-        self._tray_menu.addAction(new_idea_action)
-        
-        # 打开主窗口
-        open_main_action = QAction("打开主窗口", self._tray_menu)
-        open_main_action.triggered.connect(self._handle_open_main)
-        self._tray_menu.addAction(open_main_action)
-        
-        # 分隔线
-        self._tray_menu.addSeparator()
-        
-        # 设置
-        settings_action = QAction("设置", self._tray_menu)
-        settings_action.triggered.connect(self._handle_settings)
-        self._tray_menu.addAction(settings_action)
-        
-        # 分隔线
-        self._tray_menu.addSeparator()
-        
-        # 退出
-        exit_action = QAction("退出", self._tray_menu)
-        exit_action.triggered.connect(self._handle_exit)
-        self._tray_menu.addAction(exit_action)
+        self._menu_actions = []
+        for item in self._MENU_ITEMS:
+            # None表示分隔线
+            if item is None:
+                self._tray_menu.addSeparator()
+                continue
+            
+            text, handler_name = item
+            action = QAction(text, self._tray_menu)
+            action.triggered.connect(getattr(self, handler_name))
+            self._tray_menu.addAction(action)
+            self._menu_actions.append(action)
 
     def _set_icon(self) -> None:
         """设置托盘图标。"""
         # 根据主题设置图标
         theme = self._config_manager.get_theme()
-        if theme == "dark":
-            # 深色主题图标
-            self._tray_icon.setIcon(QIcon(":/icons/app_icon_light.png"))
-        else:
-            # 浅色主题图标
-            self._tray_icon.setIcon(QIcon(":/icons/app_icon_dark.png"))
+        # 深色主题使用浅色图标，浅色主题使用深色图标
+        name = "light" if theme == "dark" else "dark"
+        
+        icon = SystemTray._icon_cache.get(name)
+        if icon is None:
+            icon = QIcon(f":/icons/app_icon_{name}.png")
+            SystemTray._icon_cache[name] = icon
+        self._tray_icon.setIcon(icon)
 
     def _handle_tray_activated(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         """
@@ -99,10 +102,18 @@ class SystemTray:
         Args:
             reason: 激活原因
         """
-        if reason == QSystemTrayIcon.ActivationReason.Trigger:
+        try:
+            is_trigger = reason == QSystemTrayIcon.ActivationReason.Trigger
+            is_double_click = reason == QSystemTrayIcon.ActivationReason.DoubleClick
+        except TypeError:
+            # 部分PyQt6版本传入的激活原因无法转换为枚举，比较时会抛出TypeError，此时按单击处理
+            is_trigger = True
+            is_double_click = False
+        
+        if is_trigger:
             # 单击托盘图标，显示输入窗口
             self._event_system.publish("show_input_window")
-        elif reason == QSystemTrayIcon.ActivationReason.DoubleClick:
+        elif is_double_click:
             # 双击托盘图标，显示主窗口
             self._event_system.publish("show_main_window")
 
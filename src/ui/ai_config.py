@@ -1,32 +1,105 @@
 """
 AI配置界面模块，用于配置AI服务。
 """
-from typing import Optional
+import html
+from typing import TYPE_CHECKING, Optional
 
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QIcon
+from PyQt6.QtCore import QRunnable, QSignalBlocker, Qt, QThreadPool, QTimer, pyqtSignal
+from PyQt6.QtGui import QColor, QIcon, QTextCursor
 from PyQt6.QtWidgets import (
     QApplication, QCheckBox, QComboBox, QFrame, QHBoxLayout, QLabel, 
-    QLineEdit, QMessageBox, QPushButton, QVBoxLayout, QWidget
+    QLineEdit, QMessageBox, QProgressBar, QPushButton, QTextBrowser, QVBoxLayout, QWidget
 )
 
-from src.ai.ai_service import AIService
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
-from .theme_manager import ThemeManager
 from .ui_utils import RoundedRectWidget, ShadowEffect
 
+if TYPE_CHECKING:
+    from src.ai.ai_service import AIService
+    from .theme_manager import ThemeManager
+
+# 蓝色主按钮样式，各按钮共用同一字符串
+_BLUE_BUTTON_QSS = """
+    QPushButton {
+        background-color: #0078D7;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1C88E6;
+    }
+    QPushButton:pressed {
+        background-color: #0067C0;
+    }
+"""
+
+# 对话历史样式，文字颜色随主题变化
+_DIALOG_VIEW_QSS = "QTextBrowser {{ color: {color}; background: transparent; border: none; }}"
+
+# 面板颜色，按主题共用
+_LIGHT_PANEL_BG = QColor(245, 245, 245)
+_LIGHT_PANEL_BORDER = QColor(200, 200, 200)
+_DARK_PANEL_BG = QColor(60, 60, 60)
+_DARK_PANEL_BORDER = QColor(80, 80, 80)
+
+
+def _make_panel() -> RoundedRectWidget:
+    """
+    创建浅色主题的圆角面板。
+
+    Returns:
+        面板实例
+    """
+    return RoundedRectWidget(
+        radius=10,
+        background_color=_LIGHT_PANEL_BG,
+        border_color=_LIGHT_PANEL_BORDER,
+        border_width=1,
+    )
+
+
+def _make_blue_button(text: str) -> QPushButton:
+    """
+    创建蓝色主按钮。
+
+    Args:
+        text: 按钮文本
+
+    Returns:
+        按钮实例
+    """
+    button = QPushButton(text)
+    button.setStyleSheet(_BLUE_BUTTON_QSS)
+    return button
+
 
 class APIConfigWidget(QWidget):
     """API配置界面类，用于配置AI API。"""
 
+    # 测试结果信号，将后台线程发布的测试结果转到UI线程处理
+    test_result_received = pyqtSignal(dict)
+
+    # 等待测试结果的最长时间（毫秒），包含AI服务的请求超时和重试时间
+    TEST_TIMEOUT_MS = 45000
+
+    # 可选模型：(显示名称, 模型名称)
+    _MODELS = (
+        ("GPT-3.5 Turbo", "gpt-3.5-turbo"),
+        ("GPT-4", "gpt-4"),
+        ("GPT-4 Turbo", "gpt-4-turbo"),
+    )
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
         config_manager: Optional[ConfigManager] = None,
         event_system: Optional[EventSystem] = None,
-        theme_manager: Optional[ThemeManager] = None,
-        ai_service: Optional[AIService] = None,
+        theme_manager: Optional["ThemeManager"] = None,
+        ai_service: Optional["AIService"] = None,
     ):
         """
         初始化API配置界面。
@@ -41,8 +114,16 @@ class APIConfigWidget(QWidget):
         super().__init__(parent)
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._theme_manager = theme_manager or ThemeManager(self._config_manager)
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
+        if theme_manager is None:
+            # 延迟导入，仅在未传入时加载
+            from .theme_manager import ThemeManager
+            theme_manager = ThemeManager(self._config_manager)
+        if ai_service is None:
+            # 延迟导入，避免未打开AI界面时加载AI服务依赖
+            from src.ai.ai_service import AIService
+            ai_service = AIService(self._config_manager, self._event_system)
+        self._theme_manager = theme_manager
+        self._ai_service = ai_service
         
         # 初始化UI
         self._init_ui()
@@ -82,16 +163,17 @@ class APIConfigWidget(QWidget):
         main_layout.addLayout(enable_layout)
         
         # API配置面板
-        api_panel = RoundedRectWidget(
-            radius=10,
-            background_color=QColor(245, 245, 245),
-            border_color=QColor(200, 200, 200),
-            border_width=1,
-        )
-        api_layout = QVBoxLayout(api_panel)
+        self._api_panel = _make_panel()
+        api_layout = QVBoxLayout(self._api_panel)
         api_layout.setContentsMargins(20, 20, 20, 20)
         api_layout.setSpacing(15)
         
+        # API输入项容器，统一设置启用状态
+        self._api_inputs = QWidget()
+        inputs_layout = QVBoxLayout(self._api_inputs)
+        inputs_layout.setContentsMargins(0, 0, 0, 0)
+        inputs_layout.setSpacing(15)
+        
         # API URL
         url_layout = QHBoxLayout()
         url_layout.setContentsMargins(0, 0, 0, 0)
@@ -106,7 +188,7 @@ class APIConfigWidget(QWidget):
         url_layout.addWidget(url_label)
         url_layout.addWidget(self._url_edit)
         
-        api_layout.addLayout(url_layout)
+        inputs_layout.addLayout(url_layout)
         
         # API密钥
         key_layout = QHBoxLayout()
@@ -123,7 +205,7 @@ class APIConfigWidget(QWidget):
         key_layout.addWidget(key_label)
         key_layout.addWidget(self._key_edit)
         
-        api_layout.addLayout(key_layout)
+        inputs_layout.addLayout(key_layout)
         
         # 模型选择
         model_layout = QHBoxLayout()
@@ -134,14 +216,15 @@ class APIConfigWidget(QWidget):
         model_label.setFixedWidth(80)
         
         self._model_combo = QComboBox()
-        self._model_combo.addItem("GPT-3.5 Turbo", "gpt-3.5-turbo")
-        self._model_combo.addItem("GPT-4", "gpt-4")
-        self._model_combo.addItem("GPT-4 Turbo", "gpt-4-turbo")
+        for text, model in self._MODELS:
+            self._model_combo.addItem(text, model)
         
         model_layout.addWidget(model_label)
         model_layout.addWidget(self._model_combo)
         
-        api_layout.addLayout(model_layout)
+        inputs_layout.addLayout(model_layout)
+        
+        api_layout.addWidget(self._api_inputs)
         
         # 离线模式
         offline_layout = QHBoxLayout()
@@ -155,48 +238,36 @@ class APIConfigWidget(QWidget):
         
         api_layout.addLayout(offline_layout)
         
-        # 测试连接按钮
-        test_btn = QPushButton("测试连接")
-        test_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1C88E6;
-            }
-            QPushButton:pressed {
-                background-color: #0067C0;
-            }
-        """)
-        test_btn.clicked.connect(self._test_connection)
-        
-        api_layout.addWidget(test_btn, 0, Qt.AlignmentFlag.AlignRight)
-        
-        main_layout.addWidget(api_panel)
+        # 测试连接按钮，测试过程中在按钮旁显示进度条
+        test_layout = QHBoxLayout()
+        test_layout.setContentsMargins(0, 0, 0, 0)
+        test_layout.setSpacing(10)
+        
+        self._test_progress = QProgressBar()
+        self._test_progress.setRange(0, 0)
+        self._test_progress.setTextVisible(False)
+        self._test_progress.setFixedWidth(120)
+        self._test_progress.hide()
+        
+        self._test_btn = _make_blue_button("测试连接")
+        self._test_btn.clicked.connect(self._test_connection)
+        
+        test_layout.addStretch()
+        test_layout.addWidget(self._test_progress)
+        test_layout.addWidget(self._test_btn)
+        
+        api_layout.addLayout(test_layout)
+        
+        # 测试超时定时器
+        self._test_timer = QTimer(self)
+        self._test_timer.setSingleShot(True)
+        self._test_timer.setInterval(self.TEST_TIMEOUT_MS)
+        self._test_timer.timeout.connect(self._handle_test_timeout)
+        
+        main_layout.addWidget(self._api_panel)
         
         # 保存按钮
-        save_btn = QPushButton("保存配置")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1C88E6;
-            }
-            QPushButton:pressed {
-                background-color: #0067C0;
-            }
-        """)
+        save_btn = _make_blue_button("保存配置")
         save_btn.clicked.connect(self._save_config)
         
         main_layout.addWidget(save_btn, 0, Qt.AlignmentFlag.AlignRight)
@@ -205,8 +276,8 @@ class APIConfigWidget(QWidget):
         main_layout.addStretch()
         
         # 添加阴影效果
-        shadow = ShadowEffect(api_panel)
-        api_panel.setGraphicsEffect(shadow)
+        shadow = ShadowEffect(self._api_panel)
+        self._api_panel.setGraphicsEffect(shadow)
 
     def _connect_signals(self):
         """连接信号。"""
@@ -218,11 +289,19 @@ class APIConfigWidget(QWidget):
         
         # 主题变更信号
         self._theme_manager.theme_changed.connect(self._update_theme)
+        
+        # 测试结果信号
+        self.test_result_received.connect(self._handle_test_result)
 
     def _register_event_handlers(self):
         """注册事件处理器。"""
-        # 测试API结果事件
-        self._event_system.subscribe("test_ai_api_result", self._handle_test_result)
+        # 测试API结果事件，测试在后台线程执行，通过信号转到UI线程
+        callback = self.test_result_received.emit
+        self._event_system.subscribe("test_ai_api_result", callback)
+        
+        # 界面销毁时取消订阅，避免重复打开设置界面时订阅者不断增加
+        event_system = self._event_system
+        self.destroyed.connect(lambda: event_system.unsubscribe("test_ai_api_result", callback))
 
     def _handle_test_result(self, data):
         """
@@ -231,6 +310,11 @@ class APIConfigWidget(QWidget):
         Args:
             data: 事件数据
         """
+        # 超时后到达的结果不再显示
+        if not self._test_timer.isActive():
+            return
+        self._set_testing(False)
+        
         # 显示测试结果
         success = data.get("success", False)
         message = data.get("message", "")
@@ -240,6 +324,25 @@ class APIConfigWidget(QWidget):
         else:
             QMessageBox.warning(self, "测试失败", message)
 
+    def _handle_test_timeout(self):
+        """处理测试API超时。"""
+        self._set_testing(False)
+        QMessageBox.warning(self, "测试失败", "测试API连接超时，请检查网络和API地址。")
+
+    def _set_testing(self, testing: bool):
+        """
+        设置测试中状态。
+
+        Args:
+            testing: 是否正在测试
+        """
+        if testing:
+            self._test_timer.start()
+        else:
+            self._test_timer.stop()
+        self._test_progress.setVisible(testing)
+        self._test_btn.setEnabled(not testing)
+
     def _update_theme(self, theme: str):
         """
         更新主题。
@@ -248,15 +351,12 @@ class APIConfigWidget(QWidget):
             theme: 主题名称
         """
         # 更新面板样式
-        for i in range(self.layout().count()):
-            widget = self.layout().itemAt(i).widget()
-            if isinstance(widget, RoundedRectWidget):
-                if theme == "light":
-                    widget.set_background_color(QColor(245, 245, 245))
-                    widget.set_border_color(QColor(200, 200, 200))
-                else:
-                    widget.set_background_color(QColor(60, 60, 60))
-                    widget.set_border_color(QColor(80, 80, 80))
+        if theme == "light":
+            self._api_panel.set_background_color(_LIGHT_PANEL_BG)
+            self._api_panel.set_border_color(_LIGHT_PANEL_BORDER)
+        else:
+            self._api_panel.set_background_color(_DARK_PANEL_BG)
+            self._api_panel.set_border_color(_DARK_PANEL_BORDER)
 
     def _update_ui_state(self):
         """更新UI状态。"""
@@ -264,27 +364,30 @@ class APIConfigWidget(QWidget):
         enabled = self._enable_ai_check.isChecked()
         offline = self._offline_check.isChecked()
         
-        # 更新UI状态
-        self._url_edit.setEnabled(enabled and not offline)
-        self._key_edit.setEnabled(enabled and not offline)
-        self._model_combo.setEnabled(enabled and not offline)
+        # 更新UI状态，子控件随容器一起启用或禁用
+        self._api_inputs.setEnabled(enabled and not offline)
 
     def _load_config(self):
         """加载配置。"""
-        # 加载AI功能启用状态
-        self._enable_ai_check.setChecked(self._config_manager.is_ai_enabled())
+        # 一次取出AI配置节，各项从中读取
+        ai_config = self._config_manager.get_section("ai")
         
-        # 加载离线模式状态
-        self._offline_check.setChecked(self._config_manager.is_offline_mode())
+        # 加载复选框状态时阻止信号，最后统一更新一次UI状态
+        with QSignalBlocker(self._enable_ai_check), QSignalBlocker(self._offline_check):
+            # 加载AI功能启用状态
+            self._enable_ai_check.setChecked(ai_config.get("enabled", False))
+            
+            # 加载离线模式状态
+            self._offline_check.setChecked(ai_config.get("offline_mode", False))
         
         # 加载API URL
-        self._url_edit.setText(self._config_manager.get("ai", "api_url", ""))
+        self._url_edit.setText(ai_config.get("api_url", ""))
         
         # 加载API密钥
-        self._key_edit.setText(self._config_manager.get("ai", "api_key", ""))
+        self._key_edit.setText(ai_config.get("api_key", ""))
         
         # 加载模型
-        model = self._config_manager.get("ai", "model", "gpt-3.5-turbo")
+        model = ai_config.get("model", "gpt-3.5-turbo")
         index = self._model_combo.findData(model)
         if index >= 0:
             self._model_combo.setCurrentIndex(index)
@@ -294,20 +397,17 @@ class APIConfigWidget(QWidget):
 
     def _save_config(self):
         """保存配置。"""
-        # 保存AI功能启用状态
-        self._config_manager.set("ai", "enabled", self._enable_ai_check.isChecked())
-        
-        # 保存离线模式状态
-        self._config_manager.set("ai", "offline_mode", self._offline_check.isChecked())
-        
-        # 保存API URL
-        self._config_manager.set("ai", "api_url", self._url_edit.text())
-        
-        # 保存API密钥
-        self._config_manager.set("ai", "api_key", self._key_edit.text())
+        # 保存AI功能启用状态、离线模式状态、API URL、API密钥和模型，只写入一次配置文件
+        self._config_manager.update_section("ai", {
+            "enabled": self._enable_ai_check.isChecked(),
+            "offline_mode": self._offline_check.isChecked(),
+            "api_url": self._url_edit.text(),
+            "api_key": self._key_edit.text(),
+            "model": self._model_combo.currentData(),
+        })
         
-        # 保存模型
-        self._config_manager.set("ai", "model", self._model_combo.currentData())
+        # 通知各组件刷新AI配置
+        self._event_system.publish("config_changed", {"ai": self._config_manager.get_section("ai")})
         
         # 显示保存成功消息
         QMessageBox.information(self, "保存成功", "AI配置已保存。")
@@ -333,27 +433,58 @@ class APIConfigWidget(QWidget):
             return
         
         # 临时保存配置
-        self._config_manager.set("ai", "api_url", self._url_edit.text())
-        self._config_manager.set("ai", "api_key", self._key_edit.text())
-        self._config_manager.set("ai", "model", self._model_combo.currentData())
+        self._config_manager.update_section("ai", {
+            "api_url": self._url_edit.text(),
+            "api_key": self._key_edit.text(),
+            "model": self._model_combo.currentData(),
+        })
         
-        # 发布测试API事件
+        # 显示测试进度，发布测试API事件，结果通过test_ai_api_result事件返回
+        self._set_testing(True)
         self._event_system.publish("test_ai_api", {})
-        
-        # 显示测试中消息
-        QMessageBox.information(self, "测试中", "正在测试API连接，请稍候...")
+
+
+class _AskAIRunnable(QRunnable):
+    """在线程池中向AI提问的任务。"""
+
+    def __init__(self, ai_service: "AIService", question: str, context: list, callback):
+        """
+        初始化提问任务。
+
+        Args:
+            ai_service: AI服务实例
+            question: 问题
+            context: 上下文，包含相关想法的列表
+            callback: 回调函数，参数为AI回答
+        """
+        super().__init__()
+        self._ai_service = ai_service
+        self._question = question
+        self._context = context
+        self._callback = callback
+
+    def run(self):
+        """执行提问。"""
+        try:
+            answer = self._ai_service.ask_ai(self._question, self._context)
+        except Exception as e:
+            answer = f"提问失败: {e}"
+        self._callback(answer)
 
 
 class AIConsoleWidget(QWidget):
     """AI控制台界面类，用于与AI交互。"""
 
+    # AI回答信号，将线程池中得到的回答转到UI线程显示
+    answer_received = pyqtSignal(str)
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
         config_manager: Optional[ConfigManager] = None,
         event_system: Optional[EventSystem] = None,
-        theme_manager: Optional[ThemeManager] = None,
-        ai_service: Optional[AIService] = None,
+        theme_manager: Optional["ThemeManager"] = None,
+        ai_service: Optional["AIService"] = None,
     ):
         """
         初始化AI控制台界面。
@@ -368,8 +499,17 @@ class AIConsoleWidget(QWidget):
         super().__init__(parent)
         self._config_manager = config_manager or ConfigManager()
         self._event_system = event_system or EventSystem()
-        self._theme_manager = theme_manager or ThemeManager(self._config_manager)
-        self._ai_service = ai_service or AIService(self._config_manager, self._event_system)
+        if theme_manager is None:
+            # 延迟导入，仅在未传入时加载
+            from .theme_manager import ThemeManager
+            theme_manager = ThemeManager(self._config_manager)
+        if ai_service is None:
+            # 延迟导入，避免未打开AI界面时加载AI服务依赖
+            from src.ai.ai_service import AIService
+            ai_service = AIService(self._config_manager, self._event_system)
+        self._theme_manager = theme_manager
+        self._ai_service = ai_service
+        self._waiting_answer = False
         
         # 初始化UI
         self._init_ui()
@@ -393,23 +533,19 @@ class AIConsoleWidget(QWidget):
         main_layout.addWidget(title_label)
         
         # 对话面板
-        dialog_panel = RoundedRectWidget(
-            radius=10,
-            background_color=QColor(245, 245, 245),
-            border_color=QColor(200, 200, 200),
-            border_width=1,
-        )
-        dialog_layout = QVBoxLayout(dialog_panel)
+        self._dialog_panel = _make_panel()
+        dialog_layout = QVBoxLayout(self._dialog_panel)
         dialog_layout.setContentsMargins(20, 20, 20, 20)
         dialog_layout.setSpacing(15)
         
-        # 对话历史
-        self._dialog_label = QLabel("欢迎使用AI控制台，您可以在这里向AI提问关于您想法的问题。")
-        self._dialog_label.setWordWrap(True)
-        self._dialog_label.setStyleSheet("color: #333333;")
-        self._dialog_label.setMinimumHeight(200)
+        # 对话历史，逐条追加，不重建整个对话文本
+        self._dialog_view = QTextBrowser()
+        self._dialog_view.setOpenExternalLinks(True)
+        self._dialog_view.setStyleSheet(_DIALOG_VIEW_QSS.format(color="#333333"))
+        self._dialog_view.setMinimumHeight(200)
+        self._dialog_view.append("欢迎使用AI控制台，您可以在这里向AI提问关于您想法的问题。")
         
-        dialog_layout.addWidget(self._dialog_label)
+        dialog_layout.addWidget(self._dialog_view)
         
         # 分隔线
         separator = QFrame()
@@ -426,23 +562,7 @@ class AIConsoleWidget(QWidget):
         self._input_edit = QLineEdit()
         self._input_edit.setPlaceholderText("输入您的问题...")
         
-        send_btn = QPushButton("发送")
-        send_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1C88E6;
-            }
-            QPushButton:pressed {
-                background-color: #0067C0;
-            }
-        """)
+        send_btn = _make_blue_button("发送")
         send_btn.clicked.connect(self._send_question)
         
         input_layout.addWidget(self._input_edit)
@@ -450,20 +570,23 @@ class AIConsoleWidget(QWidget):
         
         dialog_layout.addLayout(input_layout)
         
-        main_layout.addWidget(dialog_panel)
+        main_layout.addWidget(self._dialog_panel)
         
         # 添加伸缩项
         main_layout.addStretch()
         
         # 添加阴影效果
-        shadow = ShadowEffect(dialog_panel)
-        dialog_panel.setGraphicsEffect(shadow)
+        shadow = ShadowEffect(self._dialog_panel)
+        self._dialog_panel.setGraphicsEffect(shadow)
 
     def _connect_signals(self):
         """连接信号。"""
         # 输入框回车信号
         self._input_edit.returnPressed.connect(self._send_question)
         
+        # AI回答信号
+        self.answer_received.connect(self._show_answer)
+        
         # 主题变更信号
         self._theme_manager.theme_changed.connect(self._update_theme)
 
@@ -479,38 +602,33 @@ class AIConsoleWidget(QWidget):
             theme: 主题名称
         """
         # 更新面板样式
-        for i in range(self.layout().count()):
-            widget = self.layout().itemAt(i).widget()
-            if isinstance(widget, RoundedRectWidget):
-                if theme == "light":
-                    widget.set_background_color(QColor(245, 245, 245))
-                    widget.set_border_color(QColor(200, 200, 200))
-                    self._dialog_label.setStyleSheet("color: #333333;")
-                else:
-                    widget.set_background_color(QColor(60, 60, 60))
-                    widget.set_border_color(QColor(80, 80, 80))
-                    self._dialog_label.setStyleSheet("color: #FFFFFF;")
+        if theme == "light":
+            self._dialog_panel.set_background_color(_LIGHT_PANEL_BG)
+            self._dialog_panel.set_border_color(_LIGHT_PANEL_BORDER)
+            self._dialog_view.setStyleSheet(_DIALOG_VIEW_QSS.format(color="#333333"))
+        else:
+            self._dialog_panel.set_background_color(_DARK_PANEL_BG)
+            self._dialog_panel.set_border_color(_DARK_PANEL_BORDER)
+            self._dialog_view.setStyleSheet(_DIALOG_VIEW_QSS.format(color="#FFFFFF"))
 
     def _send_question(self):
         """发送问题。"""
         # 获取问题
         question = self._input_edit.text().strip()
         
-        # 如果问题为空，不处理
-        if not question:
+        # 如果问题为空或上一个问题还在等待回答，不处理
+        if not question or self._waiting_answer:
             return
         
         # 清空输入框
         self._input_edit.clear()
         
         # 更新对话历史
-        current_text = self._dialog_label.text()
-        new_text = f"{current_text}\n\n<b>您:</b> {question}"
-        self._dialog_label.setText(new_text)
+        self._dialog_view.append(f"<b>您:</b> {html.escape(question)}")
         
         # 如果AI服务不可用，显示提示
         if not self._ai_service.is_available():
-            self._dialog_label.setText(f"{new_text}\n\n<b>AI:</b> AI服务不可用，请检查设置。")
+            self._dialog_view.append("<b>AI:</b> AI服务不可用，请检查设置。")
             return
         
         # 发布查询相关想法事件
@@ -531,10 +649,26 @@ class AIConsoleWidget(QWidget):
             question: 问题
             context: 上下文，包含相关想法的列表
         """
-        # 获取AI回答
-        answer = self._ai_service.ask_ai(question, context)
+        # 显示占位提示，在线程池中获取AI回答，避免网络请求阻塞界面
+        self._waiting_answer = True
+        self._dialog_view.append("<b>AI:</b> 正在思考...")
+        QThreadPool.globalInstance().start(
+            _AskAIRunnable(self._ai_service, question, context, self.answer_received.emit)
+        )
+
+    def _show_answer(self, answer: str):
+        """
+        显示AI回答，替换占位提示。
+
+        Args:
+            answer: AI回答
+        """
+        # 删除最后一段的占位提示
+        cursor = self._dialog_view.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.select(QTextCursor.SelectionType.BlockUnderCursor)
+        cursor.removeSelectedText()
         
         # 更新对话历史
-        current_text = self._dialog_label.text()
-        new_text = f"{current_text}\n\n<b>AI:</b> {answer}"
-        self._dialog_label.setText(new_text)
+        self._dialog_view.append(f"<b>AI:</b> {html.escape(answer)}")
+        self._waiting_answer = False
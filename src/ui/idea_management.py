@@ -1,14 +1,23 @@
 """
 想法管理界面模块，用于管理和查看想法。
 """
-from typing import List, Optional
-
-from PyQt6.QtCore import QDate, QDateTime, QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QIcon
+import datetime
+import logging
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import (
+    QAbstractListModel, QDate, QDateTime, QEvent, QModelIndex, QObject, QRect, QRectF, QRunnable,
+    QSize, Qt, QThreadPool, QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QIcon, QImage, QPainter, QPen, QPixmap
 from PyQt6.QtWidgets import (
-    QApplication, QCalendarWidget, QComboBox, QDateEdit, QFrame, QHBoxLayout, 
-    QLabel, QLineEdit, QListWidget, QListWidgetItem, QPushButton, QScrollArea, 
-    QSizePolicy, QSplitter, QStackedWidget, QTextEdit, QVBoxLayout, QWidget
+    QAbstractItemView, QApplication, QCalendarWidget, QComboBox, QDateEdit, QFrame, QGraphicsBlurEffect,
+    QGraphicsPixmapItem, QGraphicsScene, QHBoxLayout, 
+    QLabel, QLineEdit, QListView, QListWidget, QListWidgetItem, QPushButton, 
+    QSizePolicy, QSplitter, QStackedWidget, QStyledItemDelegate, QStyleOptionViewItem, QTextEdit,
+    QVBoxLayout, QWidget
 )
 
 from src.business.idea_manager import IdeaManager
@@ -16,211 +25,561 @@ from src.business.tag_manager import TagManager
 from src.core.config_manager import ConfigManager
 from src.core.event_system import EventSystem
 from .theme_manager import ThemeManager
-from .ui_utils import RoundedRectWidget, ShadowEffect
+from .ui_utils import RoundedRectWidget
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _default_services() -> Tuple[ConfigManager, EventSystem, ThemeManager, IdeaManager, TagManager]:
+    """
+    获取未传入管理器时使用的默认实例，首次调用时创建，之后所有界面共用。
+
+    Returns:
+        (配置管理器, 事件系统, 主题管理器, 想法管理器, 标签管理器)
+    """
+    config_manager = ConfigManager()
+    event_system = EventSystem()
+    return (
+        config_manager,
+        event_system,
+        ThemeManager(config_manager, event_system),
+        IdeaManager(config_manager, event_system),
+        TagManager(config_manager, event_system),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_time(value) -> str:
+    """
+    格式化想法创建时间，结果按时间值缓存，重绘卡片时不重复格式化。
+
+    Args:
+        value: 创建时间，QDateTime、datetime或字符串
+
+    Returns:
+        格式为yyyy-MM-dd hh:mm的时间文本
+    """
+    if isinstance(value, QDateTime):
+        return value.toString("yyyy-MM-dd hh:mm")
+    if hasattr(value, "strftime"):
+        return value.strftime("%Y-%m-%d %H:%M")
+    return str(value or "")[:16]
+
+
+class IdeasModel(QAbstractListModel):
+    """想法列表模型，为列表视图提供想法数据。"""
+
+    # 自定义数据角色
+    IdRole = Qt.ItemDataRole.UserRole + 1
+    TitleRole = Qt.ItemDataRole.UserRole + 2
+    ContentRole = Qt.ItemDataRole.UserRole + 3
+    TimeRole = Qt.ItemDataRole.UserRole + 4
+    TagsRole = Qt.ItemDataRole.UserRole + 5
+
+    def __init__(self, parent: Optional[QObject] = None):
+        """
+        初始化想法列表模型。
+
+        Args:
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._rows: List[Dict] = []
+        
+        # 想法ID到行号的索引
+        self._row_index: Dict[int, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        获取行数。
+
+        Args:
+            parent: 父索引
+
+        Returns:
+            想法数量
+        """
+        return 0 if parent.isValid() else len(self._rows)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """
+        获取项标志，想法卡片只响应点击，不可选中或编辑。
+
+        Args:
+            index: 模型索引
+
+        Returns:
+            项标志
+        """
+        return Qt.ItemFlag.ItemIsEnabled if index.isValid() else Qt.ItemFlag.NoItemFlags
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """
+        获取指定角色的数据。
+
+        Args:
+            index: 模型索引
+            role: 数据角色
+
+        Returns:
+            数据，如果索引无效或角色不支持则返回None
+        """
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        
+        idea = self._rows[index.row()]
+        if role == self.IdRole:
+            return idea["id"]
+        if role in (self.TitleRole, Qt.ItemDataRole.DisplayRole):
+            return idea.get("title") or ""
+        if role == self.ContentRole:
+            return idea.get("content") or ""
+        if role == self.TimeRole:
+            return _format_time(idea.get("created_at"))
+        if role == self.TagsRole:
+            # 标签可能是名称或标签字典
+            return [tag["name"] if isinstance(tag, dict) else tag for tag in idea.get("tags") or ()]
+        return None
+
+    def set_ideas(self, ideas: List[Dict]) -> None:
+        """
+        替换全部想法。
+
+        Args:
+            ideas: 想法列表
+        """
+        self.beginResetModel()
+        self._rows = list(ideas)
+        self._reindex()
+        self.endResetModel()
+
+    def _reindex(self) -> None:
+        """重建想法ID到行号的索引。"""
+        self._row_index = {idea["id"]: row for row, idea in enumerate(self._rows)}
+
+    def insert_idea(self, row: int, idea: Dict) -> None:
+        """
+        插入想法。
+
+        Args:
+            row: 插入位置
+            idea: 想法字典
+        """
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, idea)
+        self._reindex()
+        self.endInsertRows()
+
+    def update_idea(self, idea: Dict) -> bool:
+        """
+        替换想法数据，只重绘该想法所在的行。
+
+        Args:
+            idea: 想法字典
 
+        Returns:
+            想法是否在列表中
+        """
+        row = self._row_index.get(idea["id"])
+        if row is None:
+            return False
+        
+        self._rows[row] = idea
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
 
-class IdeaCard(QWidget):
-    """想法卡片类，用于显示单个想法。"""
+    def remove_idea(self, idea_id: int) -> bool:
+        """
+        删除想法。
+
+        Args:
+            idea_id: 想法ID
+
+        Returns:
+            想法是否在列表中
+        """
+        row = self._row_index.get(idea_id)
+        if row is None:
+            return False
+        
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._reindex()
+        self.endRemoveRows()
+        return True
+
+
+class IdeaCardDelegate(QStyledItemDelegate):
+    """想法卡片委托类，直接绘制想法卡片，不为每个想法创建控件。"""
 
     # 想法操作信号
+    card_clicked = pyqtSignal(int)
     edit_clicked = pyqtSignal(int)
     delete_clicked = pyqtSignal(int)
     tag_clicked = pyqtSignal(str)
 
-    def __init__(
-        self,
-        idea_id: int,
-        title: str,
-        content: str,
-        created_at: QDateTime,
-        tags: List[str] = None,
-        parent: Optional[QWidget] = None,
-        theme_manager: Optional[ThemeManager] = None,
-    ):
+    # 卡片高度、卡片间距和内边距
+    CARD_HEIGHT = 170
+    CARD_MARGIN = 8
+    CARD_PADDING = 15
+    CARD_RADIUS = 10
+
+    # 卡片阴影，与ShadowEffect的默认效果一致
+    SHADOW_COLOR = QColor(0, 0, 0, 50)
+    SHADOW_BLUR = 10
+    SHADOW_OFFSET_Y = 5
+
+    # 预先渲染的阴影图，所有卡片按九宫格拉伸绘制
+    _shadow_pixmap: Optional[QPixmap] = None
+
+    # 各主题的卡片颜色
+    _THEME_COLORS = {
+        "light": {
+            "background": QColor("white"),
+            "border": QColor("#E0E0E0"),
+            "text": QColor("#333333"),
+            "time": QColor("#888888"),
+            "tag_background": QColor("#E0E0E0"),
+            "tag_text": QColor("#333333"),
+        },
+        "dark": {
+            "background": QColor("#3D3D3D"),
+            "border": QColor("#5D5D5D"),
+            "text": QColor("#FFFFFF"),
+            "time": QColor("#888888"),
+            "tag_background": QColor("#5D5D5D"),
+            "tag_text": QColor("#FFFFFF"),
+        },
+    }
+    _EDIT_COLOR = QColor("#0078D7")
+    _DELETE_COLOR = QColor("#E81123")
+
+    def __init__(self, parent: Optional[QObject] = None, theme: str = "light"):
         """
-        初始化想法卡片。
+        初始化想法卡片委托。
 
         Args:
-            idea_id: 想法ID
-            title: 标题
-            content: 内容
-            created_at: 创建时间
-            tags: 标签列表
-            parent: 父窗口
-            theme_manager: 主题管理器实例
+            parent: 父对象
+            theme: 主题名称
         """
         super().__init__(parent)
-        self._idea_id = idea_id
-        self._title = title
-        self._content = content
-        self._created_at = created_at
-        self._tags = tags or []
-        self._theme_manager = theme_manager or ThemeManager()
-        
-        # 初始化UI
-        self._init_ui()
-        
-        # 连接信号
-        self._connect_signals()
+        self._colors = self._THEME_COLORS["light"]
+        self._title_fonts: Dict[str, Tuple[QFont, QFontMetrics]] = {}
+        self._chip_widths: Dict[Tuple[str, str], int] = {}
+        self.set_theme(theme)
 
-    def _init_ui(self):
-        """初始化UI。"""
-        # 主布局
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(15, 15, 15, 15)
-        main_layout.setSpacing(10)
+    def set_theme(self, theme: str) -> None:
+        """
+        设置主题。
+
+        Args:
+            theme: 主题名称
+        """
+        self._colors = self._THEME_COLORS["light" if theme == "light" else "dark"]
+
+    @classmethod
+    def _get_shadow_pixmap(cls) -> QPixmap:
+        """
+        获取卡片阴影图，首次使用时渲染一次模糊的圆角矩形。
+
+        Returns:
+            阴影图，四周各留出模糊半径的透明边距，中间有2像素可拉伸区域
+        """
+        if cls._shadow_pixmap is None:
+            size = 2 * (cls.SHADOW_BLUR + cls.CARD_RADIUS) + 2
+            
+            # 绘制未模糊的圆角矩形
+            shape = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            shape.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(shape)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(cls.SHADOW_COLOR)
+            painter.drawRoundedRect(
+                QRectF(cls.SHADOW_BLUR, cls.SHADOW_BLUR, size - 2 * cls.SHADOW_BLUR, size - 2 * cls.SHADOW_BLUR),
+                cls.CARD_RADIUS,
+                cls.CARD_RADIUS,
+            )
+            painter.end()
+            
+            # 借助图形场景的模糊效果完成一次模糊
+            item = QGraphicsPixmapItem(QPixmap.fromImage(shape))
+            blur = QGraphicsBlurEffect()
+            blur.setBlurRadius(cls.SHADOW_BLUR)
+            item.setGraphicsEffect(blur)
+            scene = QGraphicsScene()
+            scene.addItem(item)
+            
+            shadow = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+            shadow.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(shadow)
+            scene.render(painter, QRectF(0, 0, size, size), QRectF(0, 0, size, size))
+            painter.end()
+            
+            cls._shadow_pixmap = QPixmap.fromImage(shadow)
+        return cls._shadow_pixmap
+
+    def _paint_shadow(self, painter: QPainter, card: QRect) -> None:
+        """
+        按九宫格拉伸绘制卡片阴影。
+
+        Args:
+            painter: 绘制器
+            card: 卡片区域
+        """
+        pixmap = self._get_shadow_pixmap()
+        border = self.SHADOW_BLUR + self.CARD_RADIUS
+        size = pixmap.width()
+        target = card.translated(0, self.SHADOW_OFFSET_Y).adjusted(
+            -self.SHADOW_BLUR, -self.SHADOW_BLUR, self.SHADOW_BLUR, self.SHADOW_BLUR
+        )
         
-        # 标题和时间
-        header_layout = QHBoxLayout()
-        header_layout.setContentsMargins(0, 0, 0, 0)
-        header_layout.setSpacing(10)
+        # 源图和目标区域在水平、垂直方向上各分为三段
+        source_cols = ((0, border), (border, size - 2 * border), (size - border, border))
+        source_rows = source_cols
+        target_cols = (
+            (target.left(), border),
+            (target.left() + border, target.width() - 2 * border),
+            (target.right() - border + 1, border),
+        )
+        target_rows = (
+            (target.top(), border),
+            (target.top() + border, target.height() - 2 * border),
+            (target.bottom() - border + 1, border),
+        )
+        for (sy, sh), (ty, th) in zip(source_rows, target_rows):
+            for (sx, sw), (tx, tw) in zip(source_cols, target_cols):
+                painter.drawPixmap(QRect(tx, ty, tw, th), pixmap, QRect(sx, sy, sw, sh))
+
+    def _title_font(self, base: QFont) -> Tuple[QFont, QFontMetrics]:
+        """
+        获取标题字体及其度量，按基础字体缓存，避免每次绘制都重新创建。
+
+        Args:
+            base: 基础字体
+
+        Returns:
+            标题字体和字体度量
+        """
+        key = base.key()
+        cached = self._title_fonts.get(key)
+        if cached is None:
+            title_font = QFont(base)
+            title_font.setPixelSize(16)
+            title_font.setBold(True)
+            cached = self._title_fonts[key] = (title_font, QFontMetrics(title_font))
+        return cached
+
+    def _chip_width(self, option: QStyleOptionViewItem, text: str) -> int:
+        """
+        获取标签或操作按钮的宽度，按字体和文本缓存。
+
+        Args:
+            option: 样式选项
+            text: 文本
+
+        Returns:
+            宽度
+        """
+        key = (option.font.key(), text)
+        width = self._chip_widths.get(key)
+        if width is None:
+            width = self._chip_widths[key] = option.fontMetrics.horizontalAdvance(text) + 16
+        return width
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        """
+        获取卡片大小，所有卡片高度相同。
+
+        Args:
+            option: 样式选项
+            index: 模型索引
+
+        Returns:
+            卡片大小
+        """
+        return QSize(option.rect.width(), self.CARD_HEIGHT + 2 * self.CARD_MARGIN)
+
+    def _card_layout(self, rect: QRect, option: QStyleOptionViewItem, tags: List[str]) -> Dict:
+        """
+        计算卡片内各部分的位置，绘制和点击检测共用。
+
+        Args:
+            rect: 列表项区域
+            option: 样式选项
+            tags: 标签列表
+
+        Returns:
+            位置字典，包含card、header、content、tags、edit和delete字段
+        """
+        card = rect.adjusted(self.CARD_MARGIN, self.CARD_MARGIN, -self.CARD_MARGIN, -self.CARD_MARGIN)
+        inner = card.adjusted(self.CARD_PADDING, self.CARD_PADDING, -self.CARD_PADDING, -self.CARD_PADDING)
+        
+        # 标题行、内容、标签行和操作行自上而下排列
+        header = QRect(inner.left(), inner.top(), inner.width(), 24)
+        actions_top = inner.bottom() - 20 + 1
+        tags_top = actions_top - 10 - 22
+        content = QRect(inner.left(), header.bottom() + 10, inner.width(), tags_top - 10 - header.bottom() - 10)
+        
+        # 标签按钮依次排列，超出宽度的不显示
+        tag_rects = []
+        x = inner.left()
+        for tag in tags:
+            width = self._chip_width(option, tag)
+            if x + width > inner.right():
+                break
+            tag_rects.append((QRect(x, tags_top, width, 22), tag))
+            x += width + 5
+        
+        # 操作按钮靠右排列
+        delete_width = self._chip_width(option, "删除")
+        edit_width = self._chip_width(option, "编辑")
+        delete = QRect(inner.right() - delete_width + 1, actions_top, delete_width, 20)
+        edit = QRect(delete.left() - 10 - edit_width, actions_top, edit_width, 20)
+        
+        return {
+            "card": card,
+            "header": header,
+            "content": content,
+            "tags": tag_rects,
+            "edit": edit,
+            "delete": delete,
+        }
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        """
+        绘制想法卡片。
+
+        Args:
+            painter: 绘制器
+            option: 样式选项
+            index: 模型索引
+        """
+        colors = self._colors
+        layout = self._card_layout(option.rect, option, index.data(IdeasModel.TagsRole) or [])
         
-        title_label = QLabel(self._title)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        painter.save()
         
-        time_label = QLabel(self._created_at.toString("yyyy-MM-dd hh:mm"))
-        time_label.setStyleSheet("color: #888888;")
+        # 卡片阴影，限制在当前项内，避免残留在相邻项上
+        painter.setClipRect(option.rect)
+        self._paint_shadow(painter, layout["card"])
         
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-        header_layout.addWidget(time_label)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
-        main_layout.addLayout(header_layout)
+        # 卡片背景和边框
+        painter.setPen(QPen(colors["border"], 1))
+        painter.setBrush(colors["background"])
+        painter.drawRoundedRect(
+            QRectF(layout["card"]).adjusted(0.5, 0.5, -0.5, -0.5), self.CARD_RADIUS, self.CARD_RADIUS
+        )
         
-        # 内容
-        content_label = QLabel(self._content)
-        content_label.setWordWrap(True)
-        content_label.setStyleSheet("color: #333333;")
-        main_layout.addWidget(content_label)
+        # 标题和时间
+        header = layout["header"]
+        title_font, title_metrics = self._title_font(option.font)
+        painter.setFont(title_font)
+        painter.setPen(colors["text"])
+        title = title_metrics.elidedText(
+            index.data(IdeasModel.TitleRole), Qt.TextElideMode.ElideRight, header.width() - 130
+        )
+        painter.drawText(header, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, title)
+        
+        painter.setFont(option.font)
+        painter.setPen(colors["time"])
+        painter.drawText(header, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, index.data(IdeasModel.TimeRole))
+        
+        # 内容，超出区域的部分不显示
+        painter.setPen(colors["text"])
+        painter.drawText(
+            layout["content"],
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap,
+            index.data(IdeasModel.ContentRole),
+        )
         
         # 标签
-        if self._tags:
-            tags_layout = QHBoxLayout()
-            tags_layout.setContentsMargins(0, 0, 0, 0)
-            tags_layout.setSpacing(5)
-            
-            for tag in self._tags:
-                tag_btn = QPushButton(tag)
-                tag_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #E0E0E0;
-                        color: #333333;
-                        border: none;
-                        border-radius: 10px;
-                        padding: 3px 8px;
-                        font-size: 12px;
-                    }
-                    QPushButton:hover {
-                        background-color: #D0D0D0;
-                    }
-                """)
-                tag_btn.clicked.connect(lambda checked, t=tag: self.tag_clicked.emit(t))
-                tags_layout.addWidget(tag_btn)
-            
-            tags_layout.addStretch()
-            main_layout.addLayout(tags_layout)
+        painter.setPen(Qt.PenStyle.NoPen)
+        for tag_rect, tag in layout["tags"]:
+            painter.setBrush(colors["tag_background"])
+            painter.drawRoundedRect(QRectF(tag_rect), 10, 10)
+        painter.setPen(colors["tag_text"])
+        for tag_rect, tag in layout["tags"]:
+            painter.drawText(tag_rect, Qt.AlignmentFlag.AlignCenter, tag)
         
         # 操作按钮
-        actions_layout = QHBoxLayout()
-        actions_layout.setContentsMargins(0, 0, 0, 0)
-        actions_layout.setSpacing(10)
-        
-        edit_btn = QPushButton("编辑")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #0078D7;
-                border: none;
-                padding: 3px 8px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                text-decoration: underline;
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.edit_clicked.emit(self._idea_id))
-        
-        delete_btn = QPushButton("删除")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #E81123;
-                border: none;
-                padding: 3px 8px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                text-decoration: underline;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.delete_clicked.emit(self._idea_id))
-        
-        actions_layout.addStretch()
-        actions_layout.addWidget(edit_btn)
-        actions_layout.addWidget(delete_btn)
-        
-        main_layout.addLayout(actions_layout)
-        
-        # 设置样式
-        self.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 10px;
-                border: 1px solid #E0E0E0;
-            }
-        """)
-        
-        # 添加阴影效果
-        shadow = ShadowEffect(self)
-        self.setGraphicsEffect(shadow)
+        painter.setPen(self._EDIT_COLOR)
+        painter.drawText(layout["edit"], Qt.AlignmentFlag.AlignCenter, "编辑")
+        painter.setPen(self._DELETE_COLOR)
+        painter.drawText(layout["delete"], Qt.AlignmentFlag.AlignCenter, "删除")
+        
+        painter.restore()
 
-    def _connect_signals(self):
-        """连接信号。"""
-        # 主题变更信号
-        if self._theme_manager:
-            self._theme_manager.theme_changed.connect(self._update_theme)
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:
+        """
+        处理卡片上的鼠标点击，按位置分发到编辑、删除、标签和选择操作。
 
-    def _update_theme(self, theme: str):
+        Args:
+            event: 事件
+            model: 数据模型
+            option: 样式选项
+            index: 模型索引
+
+        Returns:
+            是否已处理事件
         """
-        更新主题。
+        if event.type() != QEvent.Type.MouseButtonRelease or event.button() != Qt.MouseButton.LeftButton:
+            return False
+        
+        pos = event.position().toPoint()
+        layout = self._card_layout(option.rect, option, index.data(IdeasModel.TagsRole) or [])
+        
+        if layout["edit"].contains(pos):
+            self.edit_clicked.emit(index.data(IdeasModel.IdRole))
+            return True
+        
+        if layout["delete"].contains(pos):
+            self.delete_clicked.emit(index.data(IdeasModel.IdRole))
+            return True
+        
+        for tag_rect, tag in layout["tags"]:
+            if tag_rect.contains(pos):
+                self.tag_clicked.emit(tag)
+                return True
+        
+        if layout["card"].contains(pos):
+            self.card_clicked.emit(index.data(IdeasModel.IdRole))
+            return True
+        
+        return False
+
+
+class _IdeasQueryRunnable(QRunnable):
+    """在线程池中查询想法列表的任务。"""
+
+    def __init__(self, idea_manager: IdeaManager, query_id: int, query_kwargs: Dict, callback):
+        """
+        初始化查询任务。
 
         Args:
-            theme: 主题名称
+            idea_manager: 想法管理器实例
+            query_id: 查询编号，用于丢弃过期的结果
+            query_kwargs: 传给get_ideas的参数
+            callback: 回调函数，参数为查询编号和想法列表
         """
-        if theme == "light":
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: white;
-                    border-radius: 10px;
-                    border: 1px solid #E0E0E0;
-                }
-            """)
-            
-            # 更新内容标签样式
-            for i in range(self.layout().count()):
-                item = self.layout().itemAt(i)
-                if isinstance(item, QHBoxLayout):
-                    for j in range(item.count()):
-                        widget = item.itemAt(j).widget()
-                        if isinstance(widget, QLabel) and widget.text() == self._content:
-                            widget.setStyleSheet("color: #333333;")
-        else:
-            self.setStyleSheet("""
-                QWidget {
-                    background-color: #3D3D3D;
-                    border-radius: 10px;
-                    border: 1px solid #5D5D5D;
-                }
-            """)
-            
-            # 更新内容标签样式
-            for i in range(self.layout().count()):
-                item = self.layout().itemAt(i)
-                if isinstance(item, QHBoxLayout):
-                    for j in range(item.count()):
-                        widget = item.itemAt(j).widget()
-                        if isinstance(widget, QLabel) and widget.text() == self._content:
-                            widget.setStyleSheet("color: #FFFFFF;")
+        super().__init__()
+        self._idea_manager = idea_manager
+        self._query_id = query_id
+        self._query_kwargs = query_kwargs
+        self._callback = callback
+
+    def run(self):
+        """执行查询。"""
+        try:
+            ideas = self._idea_manager.get_ideas(**self._query_kwargs)
+        except Exception:
+            logger.exception("查询想法列表失败")
+            ideas = []
+        self._callback(self._query_id, ideas)
 
 
 class IdeaListWidget(QWidget):
@@ -232,6 +591,29 @@ class IdeaListWidget(QWidget):
     idea_delete = pyqtSignal(int)
     tag_selected = pyqtSignal(str)
 
+    # 想法查询完成信号，将线程池中得到的结果转到UI线程显示
+    ideas_loaded = pyqtSignal(int, list)
+
+    # 想法变更事件信号，想法可能在后台线程中保存，通过信号转到UI线程更新列表
+    idea_created_received = pyqtSignal(object)
+    idea_updated_received = pyqtSignal(object)
+    idea_deleted_received = pyqtSignal(object)
+
+    # 搜索文本或排序方式变更后延迟刷新的时间（毫秒），连续输入时只刷新一次
+    REFRESH_DELAY_MS = 200
+
+    # 查询结果缓存的数量上限和有效期（秒）
+    CACHE_SIZE = 32
+    CACHE_TTL = 30
+
+    # 排序方式对应的排序字段和排序顺序
+    _SORT_OPTIONS = {
+        "time_desc": ("created_at", "DESC"),
+        "time_asc": ("created_at", "ASC"),
+        "title_asc": ("title", "ASC"),
+        "title_desc": ("title", "DESC"),
+    }
+
     def __init__(
         self,
         parent: Optional[QWidget] = None,
@@ -251,10 +633,22 @@ class IdeaListWidget(QWidget):
             idea_manager: 想法管理器实例
         """
         super().__init__(parent)
-        self._config_manager = config_manager or ConfigManager()
-        self._event_system = event_system or EventSystem()
-        self._theme_manager = theme_manager or ThemeManager(self._config_manager)
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
+        self._config_manager = config_manager or _default_services()[0]
+        self._event_system = event_system or _default_services()[1]
+        self._theme_manager = theme_manager or _default_services()[2]
+        self._idea_manager = idea_manager or _default_services()[3]
+        
+        # 最近一次查询的编号，只显示最新查询的结果
+        self._query_id = 0
+        
+        # 日期筛选，为None时不按日期筛选
+        self._date_filter: Optional[datetime.date] = None
+        
+        # 查询结果缓存，键为查询条件，值为(查询时间, 想法列表)
+        self._ideas_cache: Dict[tuple, Tuple[float, list]] = {}
+        
+        # 进行中查询的条件，为None时查询结果不写入缓存
+        self._query_key: Optional[tuple] = None
         
         # 初始化UI
         self._init_ui()
@@ -319,23 +713,47 @@ class IdeaListWidget(QWidget):
         separator.setFixedHeight(1)
         main_layout.addWidget(separator)
         
-        # 想法列表
-        self._ideas_layout = QVBoxLayout()
-        self._ideas_layout.setContentsMargins(10, 10, 10, 10)
-        self._ideas_layout.setSpacing(10)
-        self._ideas_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        # 滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
-        scroll_content = QWidget()
-        scroll_content.setLayout(self._ideas_layout)
-        scroll_area.setWidget(scroll_content)
-        
-        main_layout.addWidget(scroll_area)
+        # 查询中的提示
+        self._loading_label = QLabel("加载中…")
+        self._loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._loading_label.hide()
+        main_layout.addWidget(self._loading_label)
+        
+        # 想法列表，只绘制可见的想法卡片
+        self._model = IdeasModel(self)
+        self._delegate = IdeaCardDelegate(self, self._theme_manager.get_current_theme())
+        
+        self._view = QListView()
+        self._view.setModel(self._model)
+        self._view.setItemDelegate(self._delegate)
+        self._view.setUniformItemSizes(True)
+        self._view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._view.setFrameShape(QFrame.Shape.NoFrame)
+        self._view.setContentsMargins(10, 10, 10, 10)
+        
+        main_layout.addWidget(self._view)
+        
+        # 没有想法时的提示
+        self._empty_label = QLabel("没有找到想法")
+        self._empty_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self._empty_label.setProperty("role", "empty_hint")
+        self._empty_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._empty_label.hide()
+        main_layout.addWidget(self._empty_label)
+        
+        # 延迟刷新定时器，重新启动时重新计时
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self.refresh_ideas)
+        
+        # 事件触发的刷新定时器，在下一次事件循环中刷新，运行期间再次启动不会重复刷新
+        self._event_refresh_timer = QTimer(self)
+        self._event_refresh_timer.setSingleShot(True)
+        self._event_refresh_timer.setInterval(0)
+        self._event_refresh_timer.timeout.connect(self.refresh_ideas)
 
     def _connect_signals(self):
         """连接信号。"""
@@ -345,19 +763,56 @@ class IdeaListWidget(QWidget):
         # 搜索框
         self._search_edit.textChanged.connect(self._handle_search_changed)
         
+        # 想法查询完成信号
+        self.ideas_loaded.connect(self._apply_ideas)
+        
+        # 想法变更事件信号
+        self.idea_created_received.connect(self._handle_idea_created)
+        self.idea_updated_received.connect(self._handle_idea_updated)
+        self.idea_deleted_received.connect(self._handle_idea_deleted)
+        
+        # 想法卡片信号
+        self._delegate.card_clicked.connect(self._handle_idea_clicked)
+        self._delegate.edit_clicked.connect(self._handle_idea_edit)
+        self._delegate.delete_clicked.connect(self._handle_idea_delete)
+        self._delegate.tag_clicked.connect(self._handle_tag_clicked)
+        
         # 主题变更信号
         self._theme_manager.theme_changed.connect(self._update_theme)
 
     def _register_event_handlers(self):
         """注册事件处理器。"""
         # 想法创建事件
-        self._event_system.subscribe("idea_created", self._handle_idea_created)
+        self._event_system.subscribe("idea_created", self.idea_created_received.emit)
         
         # 想法更新事件
-        self._event_system.subscribe("idea_updated", self._handle_idea_updated)
+        self._event_system.subscribe("idea_updated", self.idea_updated_received.emit)
         
         # 想法删除事件
-        self._event_system.subscribe("idea_deleted", self._handle_idea_deleted)
+        self._event_system.subscribe("idea_deleted", self.idea_deleted_received.emit)
+        
+        # 标签变更事件，想法的标签可能变化
+        for event_type in ("tag_added_to_idea", "tag_removed_from_idea", "tag_updated", "tag_deleted"):
+            self._event_system.subscribe(event_type, self._invalidate_cache)
+
+    def _invalidate_cache(self, data=None):
+        """
+        清空查询结果缓存，进行中的查询结果也不再写入缓存。
+
+        Args:
+            data: 事件数据
+        """
+        self._ideas_cache.clear()
+        self._query_key = None
+
+    def _is_filtered(self) -> bool:
+        """
+        判断列表是否按搜索文本或日期筛选，筛选时无法直接判断想法是否应显示。
+
+        Returns:
+            是否筛选
+        """
+        return self._date_filter is not None or bool(self._search_edit.text().strip())
 
     def _handle_idea_created(self, data):
         """
@@ -366,8 +821,28 @@ class IdeaListWidget(QWidget):
         Args:
             data: 事件数据
         """
-        # 刷新想法列表
-        self.refresh_ideas()
+        self.upsert_idea(data["idea"])
+
+    def upsert_idea(self, idea: Dict):
+        """
+        更新列表中的想法，想法不在列表中时插入或重新查询。
+
+        Args:
+            idea: 想法字典
+        """
+        self._invalidate_cache()
+        
+        # 已在列表中的想法只替换该行
+        if self._model.update_idea(idea):
+            return
+        
+        # 按最新排序且未筛选时，新想法直接插入到列表顶部，否则重新查询
+        if self._is_filtered() or self._sort_combo.currentData() != "time_desc":
+            self._schedule_refresh()
+            return
+        
+        self._model.insert_idea(0, idea)
+        self._update_empty_state()
 
     def _handle_idea_updated(self, data):
         """
@@ -376,8 +851,18 @@ class IdeaListWidget(QWidget):
         Args:
             data: 事件数据
         """
-        # 刷新想法列表
-        self.refresh_ideas()
+        self._invalidate_cache()
+        
+        # 筛选结果或按标题排序的顺序可能变化，需要重新查询，否则只替换该想法所在的行
+        idea = data["idea"]
+        if self._is_filtered() or (
+            self._sort_combo.currentData() in ("title_asc", "title_desc")
+            and idea.get("title") != data["original"].get("title")
+        ):
+            self._schedule_refresh()
+            return
+        
+        self._model.update_idea(idea)
 
     def _handle_idea_deleted(self, data):
         """
@@ -386,8 +871,16 @@ class IdeaListWidget(QWidget):
         Args:
             data: 事件数据
         """
-        # 刷新想法列表
-        self.refresh_ideas()
+        self._invalidate_cache()
+        
+        # 删除想法所在的行
+        if self._model.remove_idea(data["idea"]["id"]):
+            self._update_empty_state()
+
+    def _schedule_refresh(self):
+        """在下一次事件循环中刷新想法列表，连续的想法事件只触发一次刷新。"""
+        if not self._event_refresh_timer.isActive():
+            self._event_refresh_timer.start()
 
     def _handle_sort_changed(self, index):
         """
@@ -396,8 +889,8 @@ class IdeaListWidget(QWidget):
         Args:
             index: 索引
         """
-        # 刷新想法列表
-        self.refresh_ideas()
+        # 延迟刷新想法列表
+        self._refresh_timer.start()
 
     def _handle_search_changed(self, text):
         """
@@ -406,17 +899,20 @@ class IdeaListWidget(QWidget):
         Args:
             text: 搜索文本
         """
-        # 刷新想法列表
-        self.refresh_ideas()
+        # 延迟刷新想法列表
+        self._refresh_timer.start()
 
     def _filter_by_date(self):
         """按日期筛选。"""
+        self._date_filter = self._date_edit.date().toPyDate()
+        
         # 刷新想法列表
         self.refresh_ideas()
 
     def _clear_date_filter(self):
         """清除日期筛选。"""
         # 清除日期
+        self._date_filter = None
         self._date_edit.setDate(QDate.currentDate())
         
         # 刷新想法列表
@@ -429,11 +925,19 @@ class IdeaListWidget(QWidget):
         Args:
             theme: 主题名称
         """
-        # 更新想法卡片主题
-        for i in range(self._ideas_layout.count()):
-            widget = self._ideas_layout.itemAt(i).widget()
-            if isinstance(widget, IdeaCard):
-                widget._update_theme(theme)
+        # 更新想法卡片主题，重绘可见的卡片
+        self._delegate.set_theme(theme)
+        self._view.viewport().update()
+
+    def _handle_idea_clicked(self, idea_id):
+        """
+        处理想法卡片点击事件。
+
+        Args:
+            idea_id: 想法ID
+        """
+        # 发射想法选择信号
+        self.idea_selected.emit(idea_id)
 
     def _handle_idea_edit(self, idea_id):
         """
@@ -467,58 +971,82 @@ class IdeaListWidget(QWidget):
 
     def refresh_ideas(self):
         """刷新想法列表。"""
-        # 清空想法列表
-        while self._ideas_layout.count():
-            item = self._ideas_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        # 立即刷新时取消等待中的延迟刷新
+        self._refresh_timer.stop()
+        self._event_refresh_timer.stop()
         
         # 获取排序方式
-        sort_by = self._sort_combo.currentData()
+        sort_by, sort_order = self._SORT_OPTIONS[self._sort_combo.currentData()]
         
         # 获取搜索文本
         search_text = self._search_edit.text().strip()
         
-        # 获取日期筛选
-        date_filter = self._date_edit.date().toString("yyyy-MM-dd")
-        
-        # 获取想法列表
-        ideas = self._idea_manager.get_ideas(sort_by, search_text, date_filter)
-        
-        # 添加想法卡片
-        for idea in ideas:
-            idea_card = IdeaCard(
-                idea["id"],
-                idea["title"],
-                idea["content"],
-                idea["created_at"],
-                idea["tags"],
-                self,
-                self._theme_manager,
+        # 新的查询会使之前未完成的查询结果作废
+        self._query_id += 1
+        
+        # 相同条件的查询结果仍有效时直接使用
+        key = (sort_by, sort_order, search_text, self._date_filter)
+        cached = self._ideas_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL:
+            self._query_key = None
+            self._apply_ideas(self._query_id, cached[1])
+            return
+        
+        # 在线程池中查询想法列表
+        self._query_key = key
+        self._loading_label.show()
+        QThreadPool.globalInstance().start(
+            _IdeasQueryRunnable(
+                self._idea_manager,
+                self._query_id,
+                {
+                    "sort_by": sort_by,
+                    "sort_order": sort_order,
+                    "search_query": search_text or None,
+                    "created_on": self._date_filter,
+                },
+                self.ideas_loaded.emit,
             )
-            
-            # 连接信号
-            idea_card.edit_clicked.connect(self._handle_idea_edit)
-            idea_card.delete_clicked.connect(self._handle_idea_delete)
-            idea_card.tag_clicked.connect(self._handle_tag_clicked)
-            
-            # 添加到布局
-            self._ideas_layout.addWidget(idea_card)
+        )
+
+    def _apply_ideas(self, query_id: int, ideas: list):
+        """
+        显示查询到的想法列表。
+
+        Args:
+            query_id: 查询编号
+            ideas: 想法列表
+        """
+        # 忽略过期查询的结果
+        if query_id != self._query_id:
+            return
         
-        # 如果没有想法，显示提示
-        if not ideas:
-            no_ideas_label = QLabel("没有找到想法")
-            no_ideas_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_ideas_label.setStyleSheet("color: #888888; font-size: 14px; padding: 20px;")
-            self._ideas_layout.addWidget(no_ideas_label)
+        self._loading_label.hide()
+        
+        # 缓存查询结果，超出数量上限时移除最早的结果
+        if self._query_key is not None:
+            self._ideas_cache.pop(self._query_key, None)
+            if len(self._ideas_cache) >= self.CACHE_SIZE:
+                del self._ideas_cache[next(iter(self._ideas_cache))]
+            self._ideas_cache[self._query_key] = (time.monotonic(), ideas)
+            self._query_key = None
+        
+        # 替换模型数据，视图只重绘可见的卡片
+        self._model.set_ideas(ideas)
+        self._update_empty_state()
+
+    def _update_empty_state(self):
+        """如果没有想法，显示提示。"""
+        has_ideas = self._model.rowCount() > 0
+        self._view.setVisible(has_ideas)
+        self._empty_label.setVisible(not has_ideas)
 
 
 class IdeaDetailWidget(QWidget):
     """想法详情类，用于显示想法详情。"""
 
-    # 想法操作信号
-    idea_save = pyqtSignal(int, str, str, list)
+    # 想法操作信号，新想法的ID为None
+    idea_save = pyqtSignal(object, str, str, list)
     idea_cancel = pyqtSignal()
 
     def __init__(
@@ -542,13 +1070,17 @@ class IdeaDetailWidget(QWidget):
             tag_manager: 标签管理器实例
         """
         super().__init__(parent)
-        self._config_manager = config_manager or ConfigManager()
-        self._event_system = event_system or EventSystem()
-        self._theme_manager = theme_manager or ThemeManager(self._config_manager)
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
-        self._tag_manager = tag_manager or TagManager(self._config_manager, self._event_system)
+        self._config_manager = config_manager or _default_services()[0]
+        self._event_system = event_system or _default_services()[1]
+        self._theme_manager = theme_manager or _default_services()[2]
+        self._idea_manager = idea_manager or _default_services()[3]
+        self._tag_manager = tag_manager or _default_services()[4]
         self._current_idea_id = None
         
+        # 当前标签及对应的标签行，每行为(标签布局, 标签按钮, 删除按钮)，两者顺序一致
+        self._current_tags: List[str] = []
+        self._tag_rows: List[Tuple[QHBoxLayout, QPushButton, QPushButton]] = []
+        
         # 初始化UI
         self._init_ui()
         
@@ -614,11 +1146,7 @@ class IdeaDetailWidget(QWidget):
         tags_input_layout.addWidget(self._tag_edit)
         tags_input_layout.addWidget(add_tag_btn)
         
-        self._tags_container = QWidget()
-        self._tags_layout = QHBoxLayout(self._tags_container)
-        self._tags_layout.setContentsMargins(0, 0, 0, 0)
-        self._tags_layout.setSpacing(5)
-        self._tags_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+        self._create_tags_container()
         
         tags_layout.addWidget(tags_label)
         tags_layout.addLayout(tags_input_layout)
@@ -632,44 +1160,10 @@ class IdeaDetailWidget(QWidget):
         buttons_layout.setSpacing(10)
         
         self._save_btn = QPushButton("保存")
-        self._save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1C88E6;
-            }
-            QPushButton:pressed {
-                background-color: #0067C0;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #888888;
-            }
-        """)
+        self._save_btn.setProperty("primary", True)
         self._save_btn.clicked.connect(self._save_idea)
         
         cancel_btn = QPushButton("取消")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                color: #333333;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #D0D0D0;
-            }
-            QPushButton:pressed {
-                background-color: #C0C0C0;
-            }
-        """)
         cancel_btn.clicked.connect(self._cancel_edit)
         
         buttons_layout.addStretch()
@@ -681,61 +1175,26 @@ class IdeaDetailWidget(QWidget):
         # 添加伸缩项
         main_layout.addStretch()
 
+    def _create_tags_container(self):
+        """创建标签容器和标签布局。"""
+        self._tags_container = QWidget()
+        self._tags_layout = QHBoxLayout(self._tags_container)
+        self._tags_layout.setContentsMargins(0, 0, 0, 0)
+        self._tags_layout.setSpacing(5)
+        self._tags_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+
     def _connect_signals(self):
         """连接信号。"""
         # 标题和内容变更信号
         self._title_edit.textChanged.connect(self._update_save_button)
         self._content_edit.textChanged.connect(self._update_save_button)
-        
-        # 主题变更信号
-        self._theme_manager.theme_changed.connect(self._update_theme)
 
     def _update_save_button(self):
         """更新保存按钮状态。"""
         # 如果标题和内容都不为空，启用保存按钮
         title = self._title_edit.text().strip()
         content = self._content_edit.toPlainText().strip()
-        self._save_btn.setEnabled(title and content)
-
-    def _update_theme(self, theme: str):
-        """
-        更新主题。
-
-        Args:
-            theme: 主题名称
-        """
-        # 更新标签样式
-        for i in range(self._tags_layout.count()):
-            widget = self._tags_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton):
-                if theme == "light":
-                    widget.setStyleSheet("""
-                        QPushButton {
-                            background-color: #E0E0E0;
-                            color: #333333;
-                            border: none;
-                            border-radius: 10px;
-                            padding: 3px 8px;
-                            font-size: 12px;
-                        }
-                        QPushButton:hover {
-                            background-color: #D0D0D0;
-                        }
-                    """)
-                else:
-                    widget.setStyleSheet("""
-                        QPushButton {
-                            background-color: #5D5D5D;
-                            color: #FFFFFF;
-                            border: none;
-                            border-radius: 10px;
-                            padding: 3px 8px;
-                            font-size: 12px;
-                        }
-                        QPushButton:hover {
-                            background-color: #6D6D6D;
-                        }
-                    """)
+        self._save_btn.setEnabled(bool(title and content))
 
     def _add_tag(self):
         """添加标签。"""
@@ -747,43 +1206,31 @@ class IdeaDetailWidget(QWidget):
             return
         
         # 如果标签已存在，不添加
-        for i in range(self._tags_layout.count()):
-            widget = self._tags_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton) and widget.text() == tag:
-                return
+        if tag in self._current_tags:
+            return
+        
+        # 创建标签行
+        self._create_tag_row(tag)
         
+        # 清空标签输入框
+        self._tag_edit.clear()
+
+    def _create_tag_row(self, tag: str):
+        """
+        创建标签行，包含标签按钮和删除按钮。
+
+        Args:
+            tag: 标签名称
+        """
         # 创建标签按钮
         tag_btn = QPushButton(tag)
-        tag_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                color: #333333;
-                border: none;
-                border-radius: 10px;
-                padding: 3px 8px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #D0D0D0;
-            }
-        """)
+        tag_btn.setProperty("role", "tag")
         
         # 添加删除按钮
         remove_btn = QPushButton("×")
         remove_btn.setFixedSize(16, 16)
-        remove_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #888888;
-                border: none;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                color: #E81123;
-            }
-        """)
-        remove_btn.clicked.connect(lambda: self._remove_tag(tag_btn))
+        remove_btn.setProperty("role", "tag_remove")
+        remove_btn.clicked.connect(self._handle_remove_tag_clicked)
         
         # 创建标签布局
         tag_layout = QHBoxLayout()
@@ -794,33 +1241,41 @@ class IdeaDetailWidget(QWidget):
         
         # 添加到标签布局
         self._tags_layout.addLayout(tag_layout)
-        
-        # 清空标签输入框
-        self._tag_edit.clear()
+        self._current_tags.append(tag)
+        self._tag_rows.append((tag_layout, tag_btn, remove_btn))
+
+    def _handle_remove_tag_clicked(self):
+        """处理标签删除按钮点击事件，所有删除按钮共用此槽，按发送者确定标签。"""
+        self._remove_tag(self.sender())
 
-    def _remove_tag(self, tag_btn):
+    def _remove_tag(self, remove_btn):
         """
         删除标签。
 
         Args:
-            tag_btn: 标签按钮
-        """
-        # 查找标签布局
-        for i in range(self._tags_layout.count()):
-            item = self._tags_layout.itemAt(i)
-            if isinstance(item, QHBoxLayout):
-                for j in range(item.count()):
-                    widget = item.itemAt(j).widget()
-                    if widget == tag_btn:
-                        # 删除标签布局
-                        while item.count():
-                            w = item.takeAt(0).widget()
-                            if w:
-                                w.deleteLater()
-                        
-                        # 从标签布局中移除
-                        self._tags_layout.removeItem(item)
-                        return
+            remove_btn: 标签的删除按钮
+        """
+        for i, (tag_layout, tag_btn, button) in enumerate(self._tag_rows):
+            if button is remove_btn:
+                del self._current_tags[i]
+                del self._tag_rows[i]
+                self._tags_layout.removeItem(tag_layout)
+                tag_btn.deleteLater()
+                button.deleteLater()
+                tag_layout.deleteLater()
+                return
+
+    def _clear_tags(self):
+        """清空标签，用新的空容器替换整个标签容器，旧容器连同其中的控件一起删除。"""
+        if not self._tag_rows:
+            return
+        
+        old_container = self._tags_container
+        self._create_tags_container()
+        self.layout().replaceWidget(old_container, self._tags_container)
+        old_container.deleteLater()
+        self._current_tags.clear()
+        self._tag_rows.clear()
 
     def _get_tags(self):
         """
@@ -829,18 +1284,7 @@ class IdeaDetailWidget(QWidget):
         Returns:
             标签列表
         """
-        tags = []
-        
-        # 遍历标签布局
-        for i in range(self._tags_layout.count()):
-            item = self._tags_layout.itemAt(i)
-            if isinstance(item, QHBoxLayout):
-                for j in range(item.count()):
-                    widget = item.itemAt(j).widget()
-                    if isinstance(widget, QPushButton) and widget.text() != "×":
-                        tags.append(widget.text())
-        
-        return tags
+        return list(self._current_tags)
 
     def _save_idea(self):
         """保存想法。"""
@@ -880,61 +1324,14 @@ class IdeaDetailWidget(QWidget):
         self._title_edit.setText(title)
         self._content_edit.setText(content)
         
-        # 清空标签
-        while self._tags_layout.count():
-            item = self._tags_layout.takeAt(0)
-            if isinstance(item, QHBoxLayout):
-                while item.count():
-                    w = item.takeAt(0).widget()
-                    if w:
-                        w.deleteLater()
-            elif item.widget():
-                item.widget().deleteLater()
-        
-        # 添加标签
-        for tag in tags:
-            # 创建标签按钮
-            tag_btn = QPushButton(tag)
-            tag_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #E0E0E0;
-                    color: #333333;
-                    border: none;
-                    border-radius: 10px;
-                    padding: 3px 8px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: #D0D0D0;
-                }
-            """)
-            
-            # 添加删除按钮
-            remove_btn = QPushButton("×")
-            remove_btn.setFixedSize(16, 16)
-            remove_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #888888;
-                    border: none;
-                    font-size: 12px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    color: #E81123;
-                }
-            """)
-            remove_btn.clicked.connect(lambda checked, t=tag_btn: self._remove_tag(t))
-            
-            # 创建标签布局
-            tag_layout = QHBoxLayout()
-            tag_layout.setContentsMargins(0, 0, 0, 0)
-            tag_layout.setSpacing(0)
-            tag_layout.addWidget(tag_btn)
-            tag_layout.addWidget(remove_btn)
-            
-            # 添加到标签布局
-            self._tags_layout.addLayout(tag_layout)
+        # 清空标签后，添加标签期间暂停标签区域的更新，结束后统一重新布局
+        self._clear_tags()
+        self._tags_container.setUpdatesEnabled(False)
+        try:
+            for tag in tags:
+                self._create_tag_row(tag)
+        finally:
+            self._tags_container.setUpdatesEnabled(True)
         
         # 更新保存按钮状态
         self._update_save_button()
@@ -949,15 +1346,7 @@ class IdeaDetailWidget(QWidget):
         self._content_edit.clear()
         
         # 清空标签
-        while self._tags_layout.count():
-            item = self._tags_layout.takeAt(0)
-            if isinstance(item, QHBoxLayout):
-                while item.count():
-                    w = item.takeAt(0).widget()
-                    if w:
-                        w.deleteLater()
-            elif item.widget():
-                item.widget().deleteLater()
+        self._clear_tags()
         
         # 更新保存按钮状态
         self._update_save_button()
@@ -987,11 +1376,11 @@ class IdeaManagementWidget(QWidget):
             tag_manager: 标签管理器实例
         """
         super().__init__(parent)
-        self._config_manager = config_manager or ConfigManager()
-        self._event_system = event_system or EventSystem()
-        self._theme_manager = theme_manager or ThemeManager(self._config_manager)
-        self._idea_manager = idea_manager or IdeaManager(self._config_manager, self._event_system)
-        self._tag_manager = tag_manager or TagManager(self._config_manager, self._event_system)
+        self._config_manager = config_manager or _default_services()[0]
+        self._event_system = event_system or _default_services()[1]
+        self._theme_manager = theme_manager or _default_services()[2]
+        self._idea_manager = idea_manager or _default_services()[3]
+        self._tag_manager = tag_manager or _default_services()[4]
         
         # 初始化UI
         self._init_ui()
@@ -1057,6 +1446,7 @@ class IdeaManagementWidget(QWidget):
         # 创建新想法事件
         self._event_system.subscribe("create_new_idea", self._handle_create_new_idea)
 
+    @pyqtSlot(int)
     def _handle_idea_selected(self, idea_id):
         """
         处理想法选择事件。
@@ -1068,8 +1458,11 @@ class IdeaManagementWidget(QWidget):
         idea = self._idea_manager.get_idea(idea_id)
         
         # 设置想法详情
-        self._idea_detail.set_idea(idea["id"], idea["title"], idea["content"], idea["tags"])
+        self._idea_detail.set_idea(
+            idea["id"], idea["title"], idea["content"], [tag["name"] for tag in idea["tags"]]
+        )
 
+    @pyqtSlot(int)
     def _handle_idea_edit(self, idea_id):
         """
         处理想法编辑事件。
@@ -1081,8 +1474,11 @@ class IdeaManagementWidget(QWidget):
         idea = self._idea_manager.get_idea(idea_id)
         
         # 设置想法详情
-        self._idea_detail.set_idea(idea["id"], idea["title"], idea["content"], idea["tags"])
+        self._idea_detail.set_idea(
+            idea["id"], idea["title"], idea["content"], [tag["name"] for tag in idea["tags"]]
+        )
 
+    @pyqtSlot(int)
     def _handle_idea_delete(self, idea_id):
         """
         处理想法删除事件。
@@ -1093,6 +1489,7 @@ class IdeaManagementWidget(QWidget):
         # 发布确认删除想法事件
         self._event_system.publish("confirm_delete_idea", {"idea_id": idea_id})
 
+    @pyqtSlot(str)
     def _handle_tag_selected(self, tag):
         """
         处理标签选择事件。
@@ -1103,6 +1500,7 @@ class IdeaManagementWidget(QWidget):
         # 设置搜索框文本
         # TODO: 实现标签筛选
 
+    @pyqtSlot(object, str, str, list)
     def _handle_idea_save(self, idea_id, title, content, tags):
         """
         处理想法保存事件。
@@ -1116,17 +1514,55 @@ class IdeaManagementWidget(QWidget):
         # 如果是新想法
         if idea_id is None:
             # 创建新想法
-            self._idea_manager.create_idea(content, title, tags)
+            idea = self._idea_manager.create_idea(content, title)
         else:
             # 更新想法
-            self._idea_manager.update_idea(idea_id, content, title, tags)
+            idea = self._idea_manager.update_idea(idea_id, content=content, title=title)
+        
+        # 想法事件已更新列表中的该行，标签变化时用返回的想法和新标签更新该行，无需重新查询
+        idea_tags = self._sync_idea_tags(idea, tags)
+        if idea_tags is not None:
+            self._idea_list.upsert_idea({**idea, "tags": idea_tags})
         
         # 清空想法详情
         self._idea_detail.clear()
-        
-        # 刷新想法列表
-        self._idea_list.refresh_ideas()
 
+    def _sync_idea_tags(self, idea: Dict, tags: List[str]) -> Optional[List[Dict]]:
+        """
+        使想法的标签与标签名称列表一致。
+
+        Args:
+            idea: 想法字典
+            tags: 标签名称列表
+
+        Returns:
+            标签有变化时返回想法的新标签字典列表，否则返回None
+        """
+        current = {tag["name"]: tag for tag in idea.get("tags") or ()}
+        result = dict(current)
+        changed = False
+        
+        # 添加新标签
+        for name in tags:
+            if name not in current:
+                tag = self._tag_manager.get_or_create_tag(name)
+                if tag and self._idea_manager.add_tag_to_idea(idea["id"], tag["id"]):
+                    result[name] = tag
+                    changed = True
+        
+        # 移除已删除的标签
+        for name, tag in current.items():
+            if name not in tags and self._idea_manager.remove_tag_from_idea(idea["id"], tag["id"]):
+                del result[name]
+                changed = True
+        
+        if not changed:
+            return None
+        
+        # 与数据库查询的标签顺序一致，按名称排序
+        return [result[name] for name in sorted(result)]
+
+    @pyqtSlot()
     def _handle_idea_cancel(self):
         """处理想法取消事件。"""
         # 清空想法详情
@@ -4,8 +4,11 @@
 import os
 from typing import Optional
 
-from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRect, QSize, Qt, pyqtSignal
-from PyQt6.QtGui import QColor, QIcon, QKeyEvent, QPixmap
+from PyQt6.QtCore import (
+    QEasingCurve, QPoint, QPropertyAnimation, QRect, QRegularExpression, QRunnable, QSize, Qt, QThreadPool,
+    QTimer, pyqtSignal, pyqtSlot
+)
+from PyQt6.QtGui import QColor, QIcon, QKeyEvent, QPixmap, QScreen
 from PyQt6.QtWidgets import (
     QApplication, QFrame, QHBoxLayout, QLabel, QPushButton, 
     QTextEdit, QVBoxLayout, QWidget
@@ -17,6 +20,111 @@ from src.core.event_system import EventSystem
 from .theme_manager import ThemeManager
 from .ui_utils import AnimationHelper, RoundedRectWidget, ShadowEffect
 
+# 窗口内各控件的样式，按对象名称选择控件，两个主题只有输入框不同
+_COMMON_QSS = """
+    QLabel#inputTitle {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QPushButton#inputClose {
+        background-color: transparent;
+        border: none;
+        border-radius: 12px;
+    }
+    QPushButton#inputClose:hover {
+        background-color: rgba(255, 0, 0, 0.1);
+    }
+    QPushButton#inputSave {
+        background-color: #0078D7;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton#inputSave:hover {
+        background-color: #1C88E6;
+    }
+    QPushButton#inputSave:pressed {
+        background-color: #0067C0;
+    }
+    QPushButton#inputSave:disabled {
+        background-color: #CCCCCC;
+        color: #888888;
+    }
+    QPushButton#inputCancel {
+        background-color: #E0E0E0;
+        color: #333333;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 16px;
+    }
+    QPushButton#inputCancel:hover {
+        background-color: #D0D0D0;
+    }
+    QPushButton#inputCancel:pressed {
+        background-color: #C0C0C0;
+    }
+"""
+
+_LIGHT_QSS = _COMMON_QSS + """
+    QTextEdit#ideaInput {
+        background-color: white;
+        color: #333333;
+        border: 1px solid #E0E0E0;
+        border-radius: 5px;
+        padding: 8px;
+    }
+"""
+
+_DARK_QSS = _COMMON_QSS + """
+    QTextEdit#ideaInput {
+        background-color: #3D3D3D;
+        color: white;
+        border: 1px solid #5D5D5D;
+        border-radius: 5px;
+        padding: 8px;
+    }
+"""
+
+# 窗口容器颜色
+_LIGHT_BG = QColor(245, 245, 245)
+_LIGHT_BORDER = QColor(200, 200, 200)
+_DARK_BG = QColor(45, 45, 45)
+_DARK_BORDER = QColor(60, 60, 60)
+
+# 匹配非空白字符，用于判断输入是否只有空白
+_NON_SPACE = QRegularExpression(r"\S", QRegularExpression.PatternOption.UseUnicodePropertiesOption)
+
+
+class _CreateIdeaRunnable(QRunnable):
+    """在线程池中创建想法的任务。"""
+
+    def __init__(self, idea_manager: IdeaManager, content: str, callback, error_callback):
+        """
+        初始化创建任务。
+
+        Args:
+            idea_manager: 想法管理器实例
+            content: 想法内容
+            callback: 回调函数，参数为创建的想法字典
+            error_callback: 失败时的回调函数，参数为错误信息
+        """
+        super().__init__()
+        self._idea_manager = idea_manager
+        self._content = content
+        self._callback = callback
+        self._error_callback = error_callback
+
+    def run(self):
+        """执行创建。"""
+        try:
+            idea = self._idea_manager.create_idea(self._content)
+        except Exception as e:
+            self._error_callback(str(e))
+            return
+        self._callback(idea)
+
 
 class InputWindow(QWidget):
     """输入窗口类，用于快速记录想法。"""
@@ -24,6 +132,13 @@ class InputWindow(QWidget):
     # 关闭信号
     closed = pyqtSignal()
 
+    # 想法保存结果信号，将线程池中的保存结果转到UI线程处理
+    idea_saved = pyqtSignal(object)
+    idea_save_failed = pyqtSignal(str)
+
+    # 保存按钮状态更新的节流间隔（毫秒）
+    SAVE_BUTTON_THROTTLE_MS = 50
+
     def __init__(
         self,
         config_manager: Optional[ConfigManager] = None,
@@ -57,6 +172,14 @@ class InputWindow(QWidget):
         # 初始化UI
         self._init_ui()
         
+        # 淡入动画，每次显示时重新播放
+        self._fade_in_anim = AnimationHelper.fade_in(self)
+        
+        # 居中位置缓存，屏幕或窗口大小变化时失效
+        self._center_pos: Optional[QPoint] = None
+        self._center_size: Optional[QSize] = None
+        self._center_screen: Optional[QScreen] = None
+        
         # 连接信号
         self._connect_signals()
         
@@ -66,13 +189,7 @@ class InputWindow(QWidget):
     def _init_ui(self):
         """初始化UI。"""
         # 主窗口容器
-        self._container = RoundedRectWidget(
-            self,
-            radius=10,
-            background_color=QColor(245, 245, 245) if self._theme_manager.get_current_theme() == "light" else QColor(45, 45, 45),
-            border_color=QColor(200, 200, 200) if self._theme_manager.get_current_theme() == "light" else QColor(60, 60, 60),
-            border_width=1,
-        )
+        self._container = RoundedRectWidget(self, radius=10, border_width=1)
         
         # 添加阴影效果
         shadow = ShadowEffect(self._container)
@@ -94,21 +211,12 @@ class InputWindow(QWidget):
         title_layout.setSpacing(10)
         
         title_label = QLabel("记录想法")
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold;")
+        title_label.setObjectName("inputTitle")
         
         close_btn = QPushButton()
+        close_btn.setObjectName("inputClose")
         close_btn.setIcon(QIcon(":/icons/close.png"))
         close_btn.setFixedSize(24, 24)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                border-radius: 12px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 0.1);
-            }
-        """)
         close_btn.clicked.connect(self.close)
         
         title_layout.addWidget(title_label)
@@ -126,14 +234,8 @@ class InputWindow(QWidget):
         
         # 输入区域
         self._input_text = QTextEdit()
+        self._input_text.setObjectName("ideaInput")
         self._input_text.setPlaceholderText("在这里输入你的想法...")
-        self._input_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #E0E0E0;
-                border-radius: 5px;
-                padding: 8px;
-            }
-        """)
         container_layout.addWidget(self._input_text)
         
         # 按钮区域
@@ -142,44 +244,11 @@ class InputWindow(QWidget):
         button_layout.setSpacing(10)
         
         self._save_btn = QPushButton("保存")
-        self._save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #0078D7;
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1C88E6;
-            }
-            QPushButton:pressed {
-                background-color: #0067C0;
-            }
-            QPushButton:disabled {
-                background-color: #CCCCCC;
-                color: #888888;
-            }
-        """)
+        self._save_btn.setObjectName("inputSave")
         self._save_btn.clicked.connect(self._save_idea)
         
         cancel_btn = QPushButton("取消")
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #E0E0E0;
-                color: #333333;
-                border: none;
-                border-radius: 5px;
-                padding: 8px 16px;
-            }
-            QPushButton:hover {
-                background-color: #D0D0D0;
-            }
-            QPushButton:pressed {
-                background-color: #C0C0C0;
-            }
-        """)
+        cancel_btn.setObjectName("inputCancel")
         cancel_btn.clicked.connect(self.close)
         
         button_layout.addStretch()
@@ -188,6 +257,18 @@ class InputWindow(QWidget):
         
         container_layout.addLayout(button_layout)
         
+        # 保存按钮状态更新定时器，运行期间的输入合并为一次更新
+        self._save_btn_enabled = True
+        self._saving = False
+        self._save_btn_timer = QTimer(self)
+        self._save_btn_timer.setSingleShot(True)
+        self._save_btn_timer.setInterval(self.SAVE_BUTTON_THROTTLE_MS)
+        self._save_btn_timer.timeout.connect(self._update_save_button)
+        self._update_save_button()
+        
+        # 应用当前主题
+        self._update_theme(self._theme_manager.get_current_theme())
+        
         # 设置初始焦点
         self._input_text.setFocus()
 
@@ -196,8 +277,15 @@ class InputWindow(QWidget):
         # 主题变更信号
         self._theme_manager.theme_changed.connect(self._update_theme)
         
+        # 主屏幕变更信号
+        QApplication.instance().primaryScreenChanged.connect(self._invalidate_center)
+        
         # 输入文本变更信号
-        self._input_text.textChanged.connect(self._update_save_button)
+        self._input_text.textChanged.connect(self._schedule_save_button_update)
+        
+        # 想法保存结果信号
+        self.idea_saved.connect(self._handle_idea_saved)
+        self.idea_save_failed.connect(self._handle_idea_save_failed)
 
     def _register_event_handlers(self):
         """注册事件处理器。"""
@@ -221,6 +309,7 @@ class InputWindow(QWidget):
         self.activateWindow()
         self._input_text.setFocus()
 
+    @pyqtSlot(str)
     def _update_theme(self, theme: str):
         """
         更新主题。
@@ -228,65 +317,83 @@ class InputWindow(QWidget):
         Args:
             theme: 主题名称
         """
-        # 更新窗口背景颜色
+        # 更新窗口颜色，窗口内控件的样式由容器样式表统一设置
         if theme == "light":
-            self._container.setProperty("_background_color", QColor(245, 245, 245))
-            self._container.setProperty("_border_color", QColor(200, 200, 200))
-            
-            # 更新输入框样式
-            self._input_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: white;
-                    color: #333333;
-                    border: 1px solid #E0E0E0;
-                    border-radius: 5px;
-                    padding: 8px;
-                }
-            """)
+            self._container.set_background_color(_LIGHT_BG)
+            self._container.set_border_color(_LIGHT_BORDER)
+            self._container.setStyleSheet(_LIGHT_QSS)
         else:
-            self._container.setProperty("_background_color", QColor(45, 45, 45))
-            self._container.setProperty("_border_color", QColor(60, 60, 60))
-            
-            # 更新输入框样式
-            self._input_text.setStyleSheet("""
-                QTextEdit {
-                    background-color: #3D3D3D;
-                    color: white;
-                    border: 1px solid #5D5D5D;
-                    border-radius: 5px;
-                    padding: 8px;
-                }
-            """)
-        
-        # 刷新窗口
-        self._container.update()
+            self._container.set_background_color(_DARK_BG)
+            self._container.set_border_color(_DARK_BORDER)
+            self._container.setStyleSheet(_DARK_QSS)
 
+    @pyqtSlot()
+    def _schedule_save_button_update(self):
+        """安排更新保存按钮状态。"""
+        # 定时器运行期间不重新计时，持续输入时仍会定期更新
+        if not self._save_btn_timer.isActive():
+            self._save_btn_timer.start()
+
+    @pyqtSlot()
     def _update_save_button(self):
         """更新保存按钮状态。"""
-        # 如果输入为空，禁用保存按钮
-        self._save_btn.setEnabled(len(self._input_text.toPlainText().strip()) > 0)
+        self._save_btn_timer.stop()
+        
+        # 如果正在保存或输入为空，禁用保存按钮，直接在文档中查找非空白字符，不复制整段文本
+        document = self._input_text.document()
+        enabled = not self._saving and not document.isEmpty() and not document.find(_NON_SPACE).isNull()
+        
+        # 状态未变化时不更新，避免按钮重新应用样式
+        if enabled != self._save_btn_enabled:
+            self._save_btn_enabled = enabled
+            self._save_btn.setEnabled(enabled)
 
+    @pyqtSlot()
     def _save_idea(self):
         """保存想法。"""
         # 获取输入内容
         content = self._input_text.toPlainText().strip()
         
-        # 如果内容为空，不保存
-        if not content:
+        # 如果内容为空或正在保存，不保存
+        if not content or self._saving:
             return
         
-        # 保存想法
-        try:
-            idea = self._idea_manager.create_idea(content)
-            
-            # 发布想法创建成功事件
-            self._event_system.publish("idea_created_by_user", {"idea": idea})
-            
-            # 关闭窗口
-            self.close()
-        except Exception as e:
-            print(f"保存想法失败: {e}")
-            # TODO: 显示错误消息
+        # 在线程池中保存想法，保存期间禁用保存按钮，结果通过信号返回
+        self._saving = True
+        self._update_save_button()
+        QThreadPool.globalInstance().start(
+            _CreateIdeaRunnable(self._idea_manager, content, self.idea_saved.emit, self.idea_save_failed.emit)
+        )
+
+    @pyqtSlot(object)
+    def _handle_idea_saved(self, idea):
+        """
+        处理想法保存成功。
+
+        Args:
+            idea: 创建的想法字典
+        """
+        self._saving = False
+        
+        # 发布想法创建成功事件
+        self._event_system.publish("idea_created_by_user", {"idea": idea})
+        
+        # 关闭窗口
+        self.close()
+        self._update_save_button()
+
+    @pyqtSlot(str)
+    def _handle_idea_save_failed(self, message: str):
+        """
+        处理想法保存失败。
+
+        Args:
+            message: 错误信息
+        """
+        self._saving = False
+        self._update_save_button()
+        print(f"保存想法失败: {message}")
+        # TODO: 显示错误消息
 
     def keyPressEvent(self, event: QKeyEvent):
         """
@@ -297,6 +404,9 @@ class InputWindow(QWidget):
         """
         # Ctrl+Enter 保存想法
         if event.key() == Qt.Key.Key_Return and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+            # 先处理尚未执行的按钮状态更新
+            if self._save_btn_timer.isActive():
+                self._update_save_button()
             if self._save_btn.isEnabled():
                 self._save_idea()
             event.accept()
@@ -310,20 +420,51 @@ class InputWindow(QWidget):
     def show_with_animation(self):
         """使用动画显示窗口。"""
         # 居中显示
-        screen_geometry = QApplication.primaryScreen().geometry()
-        x = (screen_geometry.width() - self.width()) // 2
-        y = (screen_geometry.height() - self.height()) // 2
-        self.move(x, y)
+        self.move(self._center_position())
         
-        # 设置初始透明度
+        # 停止上一次未完成的动画并设置初始透明度
+        self._fade_in_anim.stop()
         self.setWindowOpacity(0.0)
         
         # 显示窗口
         self.show()
         
-        # 创建淡入动画
-        fade_in_anim = AnimationHelper.fade_in(self)
-        fade_in_anim.start()
+        # 播放淡入动画
+        self._fade_in_anim.start()
+
+    def _center_position(self) -> QPoint:
+        """
+        获取窗口在主屏幕居中时的位置。
+
+        Returns:
+            窗口左上角位置
+        """
+        if self._center_pos is None or self._center_size != self.size():
+            screen = QApplication.primaryScreen()
+            
+            # 监听当前主屏幕的分辨率变化
+            if screen is not self._center_screen:
+                if self._center_screen is not None:
+                    self._center_screen.geometryChanged.disconnect(self._invalidate_center)
+                screen.geometryChanged.connect(self._invalidate_center)
+                self._center_screen = screen
+            
+            screen_geometry = screen.geometry()
+            self._center_pos = QPoint(
+                screen_geometry.x() + (screen_geometry.width() - self.width()) // 2,
+                screen_geometry.y() + (screen_geometry.height() - self.height()) // 2,
+            )
+            self._center_size = self.size()
+        return self._center_pos
+
+    def _invalidate_center(self, data=None):
+        """
+        使居中位置缓存失效。
+
+        Args:
+            data: 信号参数
+        """
+        self._center_pos = None
 
     def closeEvent(self, event):
         """
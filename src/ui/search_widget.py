@@ -7,7 +7,7 @@ from PyQt6.QtCore import QSize, Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QIcon
 from PyQt6.QtWidgets import (
     QApplication, QCheckBox, QComboBox, QFrame, QHBoxLayout, QLabel, 
-    QLineEdit, QPushButton, QScrollArea, QSlider, QVBoxLayout, QWidget
+    QLineEdit, QPushButton, QScrollArea, QSizePolicy, QSlider, QVBoxLayout, QWidget
 )
 
 from src.business.idea_manager import IdeaManager
@@ -375,22 +375,34 @@ class SearchWidget(QWidget):
         results_label.setStyleSheet("font-size: 16px; font-weight: bold;")
         results_layout.addWidget(results_label)
         
+        self._create_results_container()
+        
+        # 滚动区域
+        self._results_scroll = QScrollArea()
+        self._results_scroll.setWidgetResizable(True)
+        self._results_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._results_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self._results_scroll.setWidget(self._results_container)
+        
+        results_layout.addWidget(self._results_scroll)
+        
+        # 没有结果时的提示
+        self._no_results_label = QLabel("没有找到匹配的想法")
+        self._no_results_label.setAlignment(Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop)
+        self._no_results_label.setProperty("role", "empty_hint")
+        self._no_results_label.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        self._no_results_label.hide()
+        results_layout.addWidget(self._no_results_label)
+        
+        main_layout.addLayout(results_layout)
+
+    def _create_results_container(self):
+        """创建搜索结果容器和搜索结果布局。"""
         self._results_container = QWidget()
         self._results_layout = QVBoxLayout(self._results_container)
         self._results_layout.setContentsMargins(0, 0, 0, 0)
         self._results_layout.setSpacing(10)
         self._results_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
-        
-        # 滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setWidget(self._results_container)
-        
-        results_layout.addWidget(scroll_area)
-        
-        main_layout.addLayout(results_layout)
 
     def _connect_signals(self):
         """连接信号。"""
@@ -528,19 +540,17 @@ class SearchWidget(QWidget):
         Args:
             results: 搜索结果
         """
-        # 清空搜索结果
-        while self._results_layout.count():
-            item = self._results_layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.deleteLater()
+        # 清空搜索结果，用新的空容器替换旧容器，旧容器连同其中的结果一起删除
+        if self._results_layout.count():
+            old_container = self._results_scroll.takeWidget()
+            self._create_results_container()
+            self._results_scroll.setWidget(self._results_container)
+            old_container.deleteLater()
         
         # 如果没有结果，显示提示
+        self._results_scroll.setVisible(bool(results))
+        self._no_results_label.setVisible(not results)
         if not results:
-            no_results_label = QLabel("没有找到匹配的想法")
-            no_results_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_results_label.setStyleSheet("color: #888888; font-size: 14px; padding: 20px;")
-            self._results_layout.addWidget(no_results_label)
             return
         
         # 添加搜索结果
@@ -91,7 +91,8 @@ class ThemeManager(QObject):
         if not app:
             return
         
-        # 设置应用程序样式表
+        # 设置应用程序样式表，Qt会一次性重新计算所有控件的样式，
+        # 控件的主题槽函数不需要再调用unpolish/polish或逐个设置样式表
         style_sheet = self._get_style_sheet()
         app.setStyleSheet(style_sheet)
         
@@ -213,6 +214,37 @@ class ThemeManager(QObject):
             color: #7D7D7D;
         }
         
+        /* 标签按钮 */
+        QPushButton[role="tag"] {
+            background-color: #5D5D5D;
+            color: #FFFFFF;
+            border: none;
+            border-radius: 10px;
+            padding: 3px 8px;
+            font-size: 12px;
+            min-width: 0px;
+        }
+        
+        QPushButton[role="tag"]:hover {
+            background-color: #6D6D6D;
+        }
+        
+        /* 标签删除按钮 */
+        QPushButton[role="tag_remove"] {
+            background-color: transparent;
+            color: #888888;
+            border: none;
+            padding: 0px;
+            font-size: 12px;
+            font-weight: bold;
+            min-width: 16px;
+            max-width: 16px;
+        }
+        
+        QPushButton[role="tag_remove"]:hover {
+            color: #E81123;
+        }
+        
         /* 输入框 */
         QLineEdit, QTextEdit, QPlainTextEdit {
             background-color: #3D3D3D;
@@ -240,6 +272,12 @@ class ThemeManager(QObject):
             background-color: transparent;
         }
         
+        QLabel[role="empty_hint"] {
+            color: #888888;
+            font-size: 14px;
+            padding: 20px;
+        }
+        
         /* 复选框 */
         QCheckBox {
             color: #FFFFFF;
@@ -640,6 +678,37 @@ class ThemeManager(QObject):
             color: #A0A0A0;
         }
         
+        /* 标签按钮 */
+        QPushButton[role="tag"] {
+            background-color: #E0E0E0;
+            color: #333333;
+            border: none;
+            border-radius: 10px;
+            padding: 3px 8px;
+            font-size: 12px;
+            min-width: 0px;
+        }
+        
+        QPushButton[role="tag"]:hover {
+            background-color: #D0D0D0;
+        }
+        
+        /* 标签删除按钮 */
+        QPushButton[role="tag_remove"] {
+            background-color: transparent;
+            color: #888888;
+            border: none;
+            padding: 0px;
+            font-size: 12px;
+            font-weight: bold;
+            min-width: 16px;
+            max-width: 16px;
+        }
+        
+        QPushButton[role="tag_remove"]:hover {
+            color: #E81123;
+        }
+        
         /* 输入框 */
         QLineEdit, QTextEdit, QPlainTextEdit {
             background-color: #FFFFFF;
@@ -667,6 +736,12 @@ class ThemeManager(QObject):
             background-color: transparent;
         }
         
+        QLabel[role="empty_hint"] {
+            color: #888888;
+            font-size: 14px;
+            padding: 20px;
+        }
+        
         /* 复选框 */
         QCheckBox {
             color: #333333;
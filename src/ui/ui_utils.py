@@ -4,7 +4,7 @@ UI工具模块，提供UI相关的工具函数和类。
 import math
 from typing import Optional, Tuple, Union
 
-from PyQt6.QtCore import QEasingCurve, QPoint, QPropertyAnimation, QRect, QSize, Qt
+from PyQt6.QtCore import QEasingCurve, QPoint, QPropertyAnimation, QRect, QRectF, QSize, Qt
 from PyQt6.QtGui import QColor, QPainter, QPainterPath, QPixmap
 from PyQt6.QtWidgets import QGraphicsBlurEffect, QGraphicsDropShadowEffect, QWidget
 
@@ -80,6 +80,28 @@ class RoundedRectWidget(QWidget):
         self._border_width = border_width
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
+    def set_background_color(self, color: QColor):
+        """
+        设置背景颜色，颜色变化时重绘。
+
+        Args:
+            color: 背景颜色
+        """
+        if color != self._background_color:
+            self._background_color = color
+            self.update()
+
+    def set_border_color(self, color: Optional[QColor]):
+        """
+        设置边框颜色，颜色变化时重绘。
+
+        Args:
+            color: 边框颜色
+        """
+        if color != self._border_color:
+            self._border_color = color
+            self.update()
+
     def paintEvent(self, event):
         """
         绘制事件。